@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: compiled decoders vs field-by-field parsing plus _fix_images_urls.
+
+Usage: python benchmarks/bench_decoders.py [photo counts...]
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from clickedu import Photo, QueryApi, User
+from clickedu.config import Config
+from clickedu.models import get_decoder
+
+
+def make_payload(count: int) -> list:
+    """Build a /pictures-like list of photo dicts."""
+    return [
+        {
+            "id": str(i),
+            "pathLarge": f"../private/fotos/album/large/{i:08d}.jpg",
+            "pathSmall": f"../private/fotos/album/small/{i:08d}.jpg",
+        }
+        for i in range(count)
+    ]
+
+
+def manual_decode(query_api: QueryApi, photos_data: list) -> list:
+    """The original parsing path: build each Photo, then copy and fix URLs reflectively."""
+    photos = []
+    for photo_data in photos_data:
+        photos.append(Photo(
+            id=photo_data.get("id", ""),
+            pathLarge=photo_data.get("pathLarge"),
+            pathSmall=photo_data.get("pathSmall")
+        ))
+    return query_api._fix_images_urls(photos, ["pathLarge", "pathSmall"])
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000]
+    config = Config(domain="bench.clickedu.eu")
+    user = User("id", 1, "child", "bench.clickedu.eu", "auth_token", "secret_token", "access_token")
+    query_api = QueryApi(user, config)
+    base_url = query_api._get_photo_base_url()
+    decoder = get_decoder(Photo, ("pathLarge", "pathSmall"))
+
+    for count in counts:
+        payload = make_payload(count)
+        assert manual_decode(query_api, payload) == decoder.many(payload, base_url)
+
+        repeat = 5
+        manual = min(timeit.repeat(lambda: manual_decode(query_api, payload), number=1, repeat=repeat))
+        compiled = min(timeit.repeat(lambda: decoder.many(payload, base_url), number=1, repeat=repeat))
+        print(f"{count:>8} photos  manual {manual * 1000:8.2f} ms  compiled {compiled * 1000:8.2f} ms  "
+              f"speedup {manual / compiled:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
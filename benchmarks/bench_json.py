@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON backends on representative /news and /pictures payloads.
+
+Compares requests' ``response.json()`` (decode to str, then stdlib json)
+with decoding the raw bytes using each installed backend.
+
+Usage: python benchmarks/bench_json.py
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import requests
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from clickedu.utils.json_backend import get_json_loads
+
+
+def news_payload(count: int = 200) -> bytes:
+    """A /news window with HTML bodies."""
+    body = "<p>Benvolgudes famílies,</p>" + "<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>" * 40
+    news = [
+        {"title": f"Notícia {i}", "subtitle": "Escola", "body": body, "imagePath": f"../private/img/{i}.jpg",
+         "imageText": "Foto", "filePath": f"../private/docs/{i}.pdf"}
+        for i in range(count)
+    ]
+    return json.dumps({"total": 5000, "news": news}).encode("utf-8")
+
+
+def pictures_payload(count: int = 10_000) -> bytes:
+    """A /pictures response for a large album."""
+    photos = [
+        {"id": str(i), "pathLarge": f"../private/fotos/large/{i}.jpg", "pathSmall": f"../private/fotos/small/{i}.jpg"}
+        for i in range(count)
+    ]
+    return json.dumps({"photos": photos}).encode("utf-8")
+
+
+def make_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    response.encoding = None
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def main():
+    backends = {}
+    for name in ("json", "ujson", "orjson"):
+        try:
+            backends[name] = get_json_loads(name)
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    for label, payload in (("news", news_payload()), ("pictures", pictures_payload())):
+        print(f"\n{label} payload: {len(payload) / 1024:.0f} KiB")
+
+        def via_response_json():
+            make_response(payload).json()
+
+        baseline = min(timeit.repeat(via_response_json, number=5, repeat=5)) / 5
+        print(f"  {'response.json()':>16}: {baseline * 1000:7.2f} ms")
+        for name, loads in backends.items():
+            elapsed = min(timeit.repeat(lambda: loads(payload), number=5, repeat=5)) / 5
+            print(f"  {name + ' (bytes)':>16}: {elapsed * 1000:7.2f} ms  ({baseline / elapsed:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
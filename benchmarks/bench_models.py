@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: Photo dataclasses vs slotted CompactPhoto vs columnar PhotoTable.
+
+Usage: python benchmarks/bench_models.py [photo count]
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add the src directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from clickedu import CompactPhoto, Photo, PhotoTable
+from clickedu.models import get_decoder
+
+BASE_URL = "https://school.clickedu.eu/private/app-46fabc6-0aa4471177-" + "a" * 40 + "-" + "b" * 40 + "/"
+
+
+def measure(build) -> int:
+    """Bytes allocated and still alive after build() returns its result."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = [
+        {"id": str(1_000_000 + i), "pathLarge": f"../private/fotos/{i // 500}/large/{i}.jpg",
+         "pathSmall": f"../private/fotos/{i // 500}/small/{i}.jpg"}
+        for i in range(count)
+    ]
+
+    results = {
+        "Photo": measure(lambda: get_decoder(Photo, ("pathLarge", "pathSmall")).many(payload, BASE_URL)),
+        "CompactPhoto": measure(lambda: get_decoder(CompactPhoto, ("pathLarge", "pathSmall")).many(payload, BASE_URL)),
+        "PhotoTable": measure(lambda: PhotoTable.from_json(payload, BASE_URL)),
+    }
+
+    baseline = results["Photo"]
+    for name, size in results.items():
+        print(f"{name:>13}: {size / count:8.1f} bytes/photo  ({size / baseline:6.1%} of Photo)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ A Python client for interacting with the ClickEdu API to search for domains.
 
 # Main client interface
 from .client import ClickEduClient
+from .fleet import ClickEduFleet, FleetAccount
 
 # Data models
 from .models import (
@@ -21,13 +22,30 @@ from .models import (
     PhotoAlbumsResponse,
     Photo,
     GetAlbumByIdResponse,
+    BatchResult,
+    CompactNewsItem,
+    CompactPhotoAlbum,
+    CompactPhoto,
+    PhotoTable,
+    AlbumTable,
+    BodySpool,
+    LazyNewsItem,
 )
 
 # Authentication
-from .auth import AuthApi, ClickeduApi, get_user
+from .auth import AuthApi, ClickeduApi, get_user, LoginTimings, SessionStore, FileSessionStore
 
 # Query API
-from .query import QueryApi
+from .query import (
+    QueryApi, QueryCache, CacheStats, NewsSyncer, news_fingerprint, merge_news, merge_albums,
+    AlbumMirror, MirrorResult,
+)
+
+# HTTP transport
+from .utils import (
+    Transport, TransportStats, ValidatorStore, ConditionalStats, RateLimiter, RetryPolicy, CircuitBreakers,
+    Deadline, DownloadManager, DownloadProgress, BlobStore,
+)
 
 # Exceptions
 from .exceptions import (
@@ -35,6 +53,8 @@ from .exceptions import (
     AuthenticationError,
     AuthorizationError,
     APIError,
+    CircuitOpenError,
+    DeadlineExceededError,
     ConfigurationError,
     FileDownloadError,
     ValidationError,
@@ -44,6 +64,8 @@ __version__ = "0.1.0"
 __all__ = [
     # Main client
     "ClickEduClient",
+    "ClickEduFleet",
+    "FleetAccount",
     
     # Data models
     "User",
@@ -59,20 +81,54 @@ __all__ = [
     "PhotoAlbumsResponse",
     "Photo",
     "GetAlbumByIdResponse",
+    "BatchResult",
+    "CompactNewsItem",
+    "CompactPhotoAlbum",
+    "CompactPhoto",
+    "PhotoTable",
+    "AlbumTable",
+    "BodySpool",
+    "LazyNewsItem",
     
     # Authentication
     "AuthApi",
     "ClickeduApi",
     "get_user",
+    "LoginTimings",
+    "SessionStore",
+    "FileSessionStore",
     
     # Query API
     "QueryApi",
+    "QueryCache",
+    "CacheStats",
+    "NewsSyncer",
+    "news_fingerprint",
+    "merge_news",
+    "merge_albums",
+    "AlbumMirror",
+    "MirrorResult",
+    
+    # HTTP transport
+    "Transport",
+    "TransportStats",
+    "RateLimiter",
+    "RetryPolicy",
+    "CircuitBreakers",
+    "Deadline",
+    "DownloadManager",
+    "DownloadProgress",
+    "BlobStore",
+    "ValidatorStore",
+    "ConditionalStats",
     
     # Exceptions
     "ClickEduError",
     "AuthenticationError",
     "AuthorizationError",
     "APIError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
     "ConfigurationError",
     "FileDownloadError",
     "ValidationError",
@@ -4,6 +4,7 @@ Authentication modules for ClickEdu API client.
 
 from .auth_api import AuthApi
 from .clickedu_api import ClickeduApi
-from .flow import get_user
+from .flow import get_user, LoginTimings
+from .session_store import SessionStore, FileSessionStore
 
-__all__ = ["AuthApi", "ClickeduApi", "get_user"]
+__all__ = ["AuthApi", "ClickeduApi", "get_user", "LoginTimings", "SessionStore", "FileSessionStore"]
@@ -7,17 +7,20 @@ from typing import Optional, Dict, Any
 from ..models import AppInitResponse, AuthorizationResponse, AppPermissionsResponse
 from ..exceptions import AuthenticationError, APIError
 from ..utils.logger import setup_logger
+from ..utils.transport import Transport
+from ..utils.json_backend import decode_json
 
 
 class AuthApi:
     """AuthApi class for handling authentication operations."""
     
-    def __init__(self, config_or_domain):
+    def __init__(self, config_or_domain, transport: Optional[Transport] = None):
         """
         Initialize AuthApi.
         
         Args:
             config_or_domain: Configuration object or domain string (for backward compatibility)
+            transport: Shared HTTP transport (a private one is created if not provided)
         """
         # Backward compatibility: accept domain string
         if isinstance(config_or_domain, str):
@@ -26,12 +29,14 @@ class AuthApi:
         else:
             self.config = config_or_domain
             
-        self.session = requests.Session()
+        self.transport = transport or Transport(self.config)
+        self.session = self.transport.session
+        self.timeout = self.config.timeout_for("auth")
         self.cookie: Optional[str] = None
         self.logger = setup_logger("clickedu.auth")
         
-        # Set default headers
-        self.session.headers.update(self.config.get_default_headers())
+        # Default headers are sent per request so a shared session is left untouched
+        self.headers = self.config.get_default_headers()
     
     def app_clickedu_init(self) -> Optional[AppInitResponse]:
         """Initialize app tokens."""
@@ -44,7 +49,7 @@ class AuthApi:
         
         try:
             self.logger.info("Initializing app tokens...")
-            response = self.session.post(url, data=data)
+            response = self.session.post(url, data=data, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             
             # Extract cookie from response
@@ -55,7 +60,7 @@ class AuthApi:
                 self.set_cookie(php_cookie)
                 self.logger.debug(f"Cookie set: {php_cookie[:20]}...")
             
-            result = response.json()
+            result = decode_json(response, self.config.json_loads)
             init_response = AppInitResponse(
                 token=result.get("token", ""),
                 secret=result.get("secret", "")
@@ -69,12 +74,13 @@ class AuthApi:
             if hasattr(e, 'response') and e.response is not None:
                 self.logger.error(f"Response status: {e.response.status_code}")
                 self.logger.error(f"Response content: {e.response.text}")
-            raise APIError(f"Failed to initialize app: {e}", e.response.status_code if hasattr(e, 'response') and e.response else None) from e
+            raise APIError(f"Failed to initialize app: {e}", e.response.status_code if getattr(e, 'response', None) is not None else None) from e
     
     def set_cookie(self, cookie: str) -> None:
         """Set the cookie for subsequent requests."""
         self.cookie = cookie
-        self.session.cookies.set('PHPSESSID', cookie.split('=')[1] if '=' in cookie else cookie)
+        self.session.cookies.set('PHPSESSID', cookie.split('=')[1] if '=' in cookie else cookie,
+                                 domain=self.config.domain)
     
     def authorization(self, access_token: str, user: str, password: str) -> Optional[AuthorizationResponse]:
         """Authorize user with access token."""
@@ -88,10 +94,10 @@ class AuthApi:
         
         try:
             self.logger.info(f"Authorizing user: {user}")
-            response = self.session.get(url, params=params)
+            response = self.session.get(url, params=params, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             
-            result = response.json()
+            result = decode_json(response, self.config.json_loads)
             auth_response = AuthorizationResponse(
                 id_usuari=result.get("id_usuari", "")
             )
@@ -120,10 +126,11 @@ class AuthApi:
         
         try:
             self.logger.info(f"Setting permissions for user ID: {user_id}")
-            response = self.session.post(url, data=data, headers=self.get_cookie_header())
+            response = self.session.post(url, data=data, headers={**self.headers, **self.get_cookie_header()},
+                                         timeout=self.timeout)
             response.raise_for_status()
             
-            result = response.json()
+            result = decode_json(response, self.config.json_loads)
             permissions_response = AppPermissionsResponse(
                 error=result.get("error"),
                 msg=result.get("msg"),
@@ -143,7 +150,7 @@ class AuthApi:
             if hasattr(e, 'response') and e.response is not None:
                 self.logger.error(f"Response status: {e.response.status_code}")
                 self.logger.error(f"Response content: {e.response.text}")
-            raise APIError(f"Failed to set permissions: {e}", e.response.status_code if hasattr(e, 'response') and e.response else None) from e
+            raise APIError(f"Failed to set permissions: {e}", e.response.status_code if getattr(e, 'response', None) is not None else None) from e
     
     def check_token(self, auth_token: str) -> Optional[Dict[str, Any]]:
         """Check token validity."""
@@ -158,10 +165,11 @@ class AuthApi:
         
         try:
             self.logger.info("Checking token...")
-            response = self.session.get(url, params=params, headers=self.get_cookie_header())
+            response = self.session.get(url, params=params, headers={**self.headers, **self.get_cookie_header()},
+                                        timeout=self.timeout)
             response.raise_for_status()
             
-            result = response.json()
+            result = decode_json(response, self.config.json_loads)
             self.logger.info("Token check successful!")
             return result
             
@@ -170,7 +178,7 @@ class AuthApi:
             if hasattr(e, 'response') and e.response is not None:
                 self.logger.error(f"Response status: {e.response.status_code}")
                 self.logger.error(f"Response content: {e.response.text}")
-            raise APIError(f"Failed to check token: {e}", e.response.status_code if hasattr(e, 'response') and e.response else None) from e
+            raise APIError(f"Failed to check token: {e}", e.response.status_code if getattr(e, 'response', None) is not None else None) from e
     
     def get_cookie_header(self) -> Dict[str, str]:
         """Get cookie header for requests."""
@@ -7,17 +7,20 @@ from typing import Optional
 from ..models import TokenResponse, ValidateResponse
 from ..exceptions import AuthenticationError, APIError
 from ..utils.logger import setup_logger
+from ..utils.transport import Transport
+from ..utils.json_backend import decode_json
 
 
 class ClickeduApi:
     """ClickeduApi class for handling ClickEdu API operations."""
     
-    def __init__(self, config_or_domain):
+    def __init__(self, config_or_domain, transport: Optional[Transport] = None):
         """
         Initialize ClickeduApi.
         
         Args:
             config_or_domain: Configuration object or domain string (for backward compatibility)
+            transport: Shared HTTP transport (a private one is created if not provided)
         """
         # Backward compatibility: accept domain string
         if isinstance(config_or_domain, str):
@@ -26,13 +29,10 @@ class ClickeduApi:
         else:
             self.config = config_or_domain
             
-        self.session = requests.Session()
+        self.transport = transport or Transport(self.config)
+        self.session = self.transport.session
+        self.timeout = self.config.timeout_for("api")
         self.logger = setup_logger("clickedu.api")
-        
-        # Set default headers
-        self.session.headers.update({
-            'User-Agent': self.config.get_user_agent()
-        })
     
     def token(self, username: str, password: str) -> Optional[TokenResponse]:
         """Get access token."""
@@ -50,10 +50,10 @@ class ClickeduApi:
         
         try:
             self.logger.info(f"Getting access token for user: {username}")
-            response = self.session.post(url, data=data, headers=headers)
+            response = self.session.post(url, data=data, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             
-            result = response.json()
+            result = decode_json(response, self.config.json_loads)
             token_response = TokenResponse(
                 access_token=result.get("access_token", "")
             )
@@ -82,10 +82,10 @@ class ClickeduApi:
         
         try:
             self.logger.info("Validating access token...")
-            response = self.session.get(url, params=params, headers=headers)
+            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
             response.raise_for_status()
             
-            result = response.json()
+            result = decode_json(response, self.config.json_loads)
             validate_response = ValidateResponse(
                 id=result.get("id", ""),
                 user_id=result.get("user_id", 0)
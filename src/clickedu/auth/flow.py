@@ -2,23 +2,69 @@
 Authentication flow for ClickEdu API client.
 """
 
-from typing import Optional
+import contextvars
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
 from ..models import User
-from ..exceptions import AuthenticationError, APIError
+from ..exceptions import AuthenticationError, APIError, DeadlineExceededError
 from ..utils.logger import setup_logger
+from ..utils.deadline import Deadline, deadline_scope
 from .auth_api import AuthApi
 from .clickedu_api import ClickeduApi
 
 
-def get_user(web_url: str, username: str, password: str, config=None) -> Optional[User]:
+@dataclass
+class LoginTimings:
+    """Wall-clock timing breakdown of a get_user flow."""
+    steps: Dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    background: List[Future] = field(default_factory=list, repr=False)
+    
+    @property
+    def serial_total(self) -> float:
+        """Time the flow would have taken running every step back to back."""
+        return sum(self.steps.values())
+    
+    @property
+    def saved(self) -> float:
+        """Wall-clock time saved compared to running the steps serially."""
+        return max(0.0, self.serial_total - self.total)
+    
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for steps still running in the background (e.g. check_token)."""
+        wait(self.background, timeout=timeout)
+
+
+def _timed(timings: LoginTimings, step: str, func, *args):
+    """Run one login step, recording its duration."""
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings.steps[step] = time.perf_counter() - started
+
+
+def get_user(web_url: str, username: str, password: str, config=None,
+             concurrent: bool = False, timings: Optional[LoginTimings] = None,
+             transport=None, deadline: Optional[Union[float, Deadline]] = None) -> Optional[User]:
     """
     Get user following the TypeScript flow.
     
+    In concurrent mode the OAuth token request runs alongside the AuthApi
+    chain, validation starts as soon as both the user id and access token
+    are known, and the optional token check runs in the background.
+    
     Args:
         web_url: The web URL (domain) for the ClickEdu instance
         username: Username for authentication
         password: Password for authentication
         config: Configuration object (optional, will create one if not provided)
+        concurrent: Run independent login steps concurrently
+        timings: Optional LoginTimings filled with a per-step breakdown
+        transport: Shared HTTP transport (optional, one is created if not provided)
+        deadline: Time budget in seconds (or a Deadline) shared by every login step
         
     Returns:
         User object with all authentication data or None if failed
@@ -26,8 +72,11 @@ def get_user(web_url: str, username: str, password: str, config=None) -> Optiona
     Raises:
         AuthenticationError: If authentication fails
         APIError: If API requests fail
+        DeadlineExceededError: If the deadline passes before the flow completes
     """
     logger = setup_logger("clickedu.flow")
+    timings = timings if timings is not None else LoginTimings()
+    started = time.perf_counter()
     
     try:
         logger.info(f"Starting getUser flow for {web_url}")
@@ -37,40 +86,22 @@ def get_user(web_url: str, username: str, password: str, config=None) -> Optiona
             from ..config import Config
             config = Config(domain=web_url)
         
-        # Step 1: Initialize AuthApi and get tokens
-        auth_api = AuthApi(config)
-        init_result = auth_api.app_clickedu_init()
-        if not init_result:
-            raise AuthenticationError("Failed to initialize app tokens")
-        
-        # Step 2: Authorize user
-        auth_result = auth_api.authorization(init_result.token, username, password)
-        if not auth_result:
-            raise AuthenticationError("Failed to authorize user")
-        
-        # Step 3: Set permissions
-        permissions_result = auth_api.app_clickedu_permissions(init_result.token, auth_result.id_usuari)
-        if not permissions_result:
-            raise AuthenticationError("Failed to set permissions")
-        
-        # Step 4: Get access token from ClickeduApi
-        clickedu_api = ClickeduApi(config)
-        token_result = clickedu_api.token(username, password)
-        if not token_result:
-            raise AuthenticationError("Failed to get access token")
+        if transport is None:
+            from ..utils.transport import Transport
+            transport = Transport(config)
         
-        # Step 5: Validate token
-        validate_result = clickedu_api.validate(token_result.access_token, auth_result.id_usuari)
-        if not validate_result:
-            raise AuthenticationError("Failed to validate token")
+        auth_api = AuthApi(config, transport)
+        clickedu_api = ClickeduApi(config, transport)
         
-        # Step 6: Check token (optional, continue even if fails)
-        try:
-            check_result = auth_api.check_token(init_result.token)
-            if not check_result:
-                logger.warning("Token check failed, but continuing...")
-        except Exception as e:
-            logger.warning(f"Token check failed: {e}, but continuing...")
+        with deadline_scope(deadline):
+            if concurrent:
+                init_result, auth_result, token_result, validate_result = _concurrent_steps(
+                    auth_api, clickedu_api, username, password, timings, logger
+                )
+            else:
+                init_result, auth_result, token_result, validate_result = _serial_steps(
+                    auth_api, clickedu_api, username, password, timings, logger
+                )
         
         # Create and return User object
         user = User(
@@ -80,15 +111,120 @@ def get_user(web_url: str, username: str, password: str, config=None) -> Optiona
             base_url=web_url,
             auth_token=init_result.token,
             secret_token=init_result.secret,
-            access_token=token_result.access_token
+            access_token=token_result.access_token,
+            cookie=auth_api.cookie
         )
         
+        timings.total = time.perf_counter() - started
         logger.info("getUser flow completed successfully!")
+        logger.debug(f"Login step timings: {timings.steps}, total {timings.total:.3f}s")
         return user
         
-    except (AuthenticationError, APIError):
+    except (AuthenticationError, APIError, DeadlineExceededError):
         # Re-raise known exceptions
         raise
     except Exception as e:
         logger.error(f"Unexpected error in getUser flow: {e}")
         raise AuthenticationError(f"Unexpected error in authentication flow: {e}") from e
+
+
+def _check_token(auth_api: AuthApi, token: str, timings: LoginTimings, logger) -> None:
+    """Step 6: Check token (optional, continue even if fails)."""
+    try:
+        check_result = _timed(timings, "check_token", auth_api.check_token, token)
+        if not check_result:
+            logger.warning("Token check failed, but continuing...")
+    except Exception as e:
+        logger.warning(f"Token check failed: {e}, but continuing...")
+
+
+def _serial_steps(auth_api: AuthApi, clickedu_api: ClickeduApi, username: str,
+                  password: str, timings: LoginTimings, logger):
+    """Run the login steps one after another."""
+    # Step 1: Initialize AuthApi and get tokens
+    init_result = _timed(timings, "app_clickedu_init", auth_api.app_clickedu_init)
+    if not init_result:
+        raise AuthenticationError("Failed to initialize app tokens")
+    
+    # Step 2: Authorize user
+    auth_result = _timed(timings, "authorization", auth_api.authorization,
+                         init_result.token, username, password)
+    if not auth_result:
+        raise AuthenticationError("Failed to authorize user")
+    
+    # Step 3: Set permissions
+    permissions_result = _timed(timings, "app_clickedu_permissions", auth_api.app_clickedu_permissions,
+                                init_result.token, auth_result.id_usuari)
+    if not permissions_result:
+        raise AuthenticationError("Failed to set permissions")
+    
+    # Step 4: Get access token from ClickeduApi
+    token_result = _timed(timings, "token", clickedu_api.token, username, password)
+    if not token_result:
+        raise AuthenticationError("Failed to get access token")
+    
+    # Step 5: Validate token
+    validate_result = _timed(timings, "validate", clickedu_api.validate,
+                             token_result.access_token, auth_result.id_usuari)
+    if not validate_result:
+        raise AuthenticationError("Failed to validate token")
+    
+    # Step 6: Check token
+    _check_token(auth_api, init_result.token, timings, logger)
+    
+    return init_result, auth_result, token_result, validate_result
+
+
+def _concurrent_steps(auth_api: AuthApi, clickedu_api: ClickeduApi, username: str,
+                      password: str, timings: LoginTimings, logger):
+    """Run the login steps, overlapping the ones that do not depend on each other."""
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="clickedu-login")
+    
+    def submit(func, *args):
+        # Each task runs in a copy of the caller's context so the deadline carries over
+        return executor.submit(contextvars.copy_context().run, func, *args)
+    
+    try:
+        # Step 4 only needs the credentials, so it runs alongside steps 1-3
+        token_future = submit(_timed, timings, "token", clickedu_api.token, username, password)
+        
+        # Step 1: Initialize AuthApi and get tokens
+        init_result = _timed(timings, "app_clickedu_init", auth_api.app_clickedu_init)
+        if not init_result:
+            raise AuthenticationError("Failed to initialize app tokens")
+        
+        # Step 2: Authorize user
+        auth_result = _timed(timings, "authorization", auth_api.authorization,
+                             init_result.token, username, password)
+        if not auth_result:
+            raise AuthenticationError("Failed to authorize user")
+        
+        # Step 5 starts as soon as both the user id and the access token exist
+        def validate():
+            token_result = token_future.result()
+            if not token_result:
+                raise AuthenticationError("Failed to get access token")
+            return _timed(timings, "validate", clickedu_api.validate,
+                          token_result.access_token, auth_result.id_usuari)
+        
+        validate_future = submit(validate)
+        
+        # Step 3: Set permissions
+        permissions_result = _timed(timings, "app_clickedu_permissions", auth_api.app_clickedu_permissions,
+                                    init_result.token, auth_result.id_usuari)
+        if not permissions_result:
+            raise AuthenticationError("Failed to set permissions")
+        
+        token_result = token_future.result()
+        validate_result = validate_future.result()
+        if not validate_result:
+            raise AuthenticationError("Failed to validate token")
+        
+        # Step 6 runs in the background and does not block the login
+        timings.background.append(
+            submit(_check_token, auth_api, init_result.token, timings, logger)
+        )
+        
+        return init_result, auth_result, token_result, validate_result
+    finally:
+        executor.shutdown(wait=False)
@@ -0,0 +1,128 @@
+"""
+Persistent session storage for ClickEdu API client.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Callable, Optional
+from ..models import User
+from ..utils.logger import setup_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+class SessionStore(ABC):
+    """
+    Base class for session stores.
+
+    A session store persists the authenticated ``User`` (including the
+    PHPSESSID cookie) keyed by domain and username, so a restarted process
+    can skip the full ``get_user`` login flow.
+    """
+
+    @abstractmethod
+    def load(self, domain: str, username: str) -> Optional[User]:
+        """Load a stored session, or None if there is none."""
+
+    @abstractmethod
+    def save(self, domain: str, username: str, user: User) -> None:
+        """Store a session."""
+
+    @abstractmethod
+    def delete(self, domain: str, username: str) -> None:
+        """Remove a stored session."""
+
+
+class FileSessionStore(SessionStore):
+    """Session store that keeps one JSON file per (domain, username)."""
+
+    def __init__(
+        self,
+        directory: str = ".clickedu_sessions",
+        encrypt: Optional[Callable[[bytes], bytes]] = None,
+        decrypt: Optional[Callable[[bytes], bytes]] = None,
+    ):
+        """
+        Initialize file session store.
+
+        Args:
+            directory: Directory where session files are written
+            encrypt: Optional hook to encrypt serialized sessions before writing
+            decrypt: Optional hook to decrypt session files after reading
+        """
+        if (encrypt is None) != (decrypt is None):
+            raise ValueError("encrypt and decrypt hooks must be provided together")
+
+        self.directory = directory
+        self.encrypt = encrypt
+        self.decrypt = decrypt
+        self.logger = setup_logger("clickedu.session_store")
+
+    def _path_for(self, domain: str, username: str) -> str:
+        """Get the session file path for a domain and username."""
+        key = hashlib.sha256(f"{domain}\0{username}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.session")
+
+    @contextmanager
+    def _locked(self, path: str, exclusive: bool):
+        """Hold an advisory lock on the sidecar lock file of a session."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(f"{path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self, domain: str, username: str) -> Optional[User]:
+        """Load a stored session, or None if missing or unreadable."""
+        path = self._path_for(domain, username)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with self._locked(path, exclusive=False):
+                with open(path, "rb") as f:
+                    data = f.read()
+            if self.decrypt is not None:
+                data = self.decrypt(data)
+            return User(**json.loads(data))
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable session file {path}: {e}")
+            return None
+
+    def save(self, domain: str, username: str, user: User) -> None:
+        """Atomically write a session file readable only by the owner."""
+        path = self._path_for(domain, username)
+        data = json.dumps(asdict(user)).encode("utf-8")
+        if self.encrypt is not None:
+            data = self.encrypt(data)
+
+        with self._locked(path, exclusive=True):
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                os.chmod(tmp_path, 0o600)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def delete(self, domain: str, username: str) -> None:
+        """Remove a stored session if present."""
+        path = self._path_for(domain, username)
+        with self._locked(path, exclusive=True):
+            if os.path.exists(path):
+                os.remove(path)
@@ -4,10 +4,13 @@ Main ClickEdu API client.
 
 from typing import Optional
 from .models import User
-from .auth import get_user
-from .query import QueryApi
-from .exceptions import ClickEduError, AuthenticationError, APIError
+from .auth import get_user, LoginTimings, SessionStore
+from .query import QueryApi, QueryCache, NewsSyncer
+from .exceptions import ClickEduError, AuthenticationError, APIError, DeadlineExceededError
 from .utils.logger import setup_logger
+from .utils.transport import Transport
+from .utils.conditional import ValidatorStore
+from .utils.deadline import deadline_scope
 from .config import Config
 
 
@@ -19,53 +22,122 @@ class ClickEduClient:
     It provides a clean, high-level API for authentication and data retrieval.
     """
     
-    def __init__(self, log_level: str = "WARNING"):
+    def __init__(self, log_level: str = "WARNING", session_store: Optional[SessionStore] = None,
+                 transport: Optional[Transport] = None, cache: Optional[QueryCache] = None,
+                 validators: Optional[ValidatorStore] = None, json_backend=None,
+                 domain: Optional[str] = None):
         """
         Initialize ClickEdu client.
         
         Args:
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+            session_store: Optional store used to persist sessions across restarts
+            transport: HTTP transport shared by every component (built from config if not provided)
+            cache: Optional in-memory cache for query results
+            validators: Optional ETag/Last-Modified store enabling conditional requests
+            json_backend: JSON decoder ("auto", "orjson", "ujson", "json" or a callable
+                taking bytes); overrides the CLICKEDU_JSON_BACKEND setting
+            domain: ClickEdu domain; overrides the CLICKEDU_DOMAIN setting
         """
-        self.config = Config(log_level=log_level)
+        self.config = Config(domain=domain, log_level=log_level)
+        if json_backend is not None:
+            self.config.json_backend = json_backend
         self.logger = setup_logger("clickedu.client", log_level)
+        self.session_store = session_store
+        self.transport = transport or Transport(self.config)
+        self.cache = cache
+        self.validators = validators
         self._user: Optional[User] = None
         self._query_api: Optional[QueryApi] = None
+        self.login_timings: Optional[LoginTimings] = None
     
-    def authenticate(self, username: str, password: str) -> User:
+    def authenticate(self, username: str, password: str, concurrent: bool = False, deadline=None) -> User:
         """
         Authenticate with ClickEdu.
         
+        If a session store is configured, a stored session for this domain and
+        username is revalidated with a single query and reused; the full login
+        flow only runs when there is no stored session or it was rejected.
+        
         Args:
             username: Username for authentication
             password: Password for authentication
+            concurrent: Run independent login steps concurrently
+            deadline: Time budget in seconds (or a Deadline) shared by the session
+                check and every login step
             
         Returns:
             Authenticated user object
             
         Raises:
             AuthenticationError: If authentication fails
+            DeadlineExceededError: If the deadline passes before authentication completes
             ClickEduError: If other errors occur
         """
         try:
+            with deadline_scope(deadline) as active_deadline:
+                restored = self._restore_session(username)
+            if restored:
+                self.logger.info("Reusing stored session")
+                return self._user
+            
             self.logger.info(f"Authenticating user {username} with domain {self.config.domain}")
-            self._user = get_user(self.config.domain, username, password, self.config)
+            self.login_timings = LoginTimings()
+            self._user = get_user(self.config.domain, username, password, self.config,
+                                  concurrent=concurrent, timings=self.login_timings,
+                                  transport=self.transport, deadline=active_deadline)
             
             if not self._user:
                 raise AuthenticationError("Authentication failed")
             
             # Initialize query API
-            self._query_api = QueryApi(self._user, self.config)
+            self._query_api = QueryApi(self._user, self.config, self.transport, self.cache, self.validators)
+            
+            if self.session_store is not None:
+                try:
+                    self.session_store.save(self.config.domain, username, self._user)
+                except Exception as e:
+                    self.logger.warning(f"Could not store session: {e}")
             
             self.logger.info("Authentication successful")
             return self._user
             
-        except (AuthenticationError, APIError):
+        except (AuthenticationError, APIError, DeadlineExceededError):
             # Re-raise known exceptions
             raise
         except Exception as e:
             self.logger.error(f"Unexpected error during authentication: {e}")
             raise ClickEduError(f"Unexpected error during authentication: {e}") from e
     
+    def _restore_session(self, username: str) -> bool:
+        """Load and revalidate a stored session. Returns True if it was reused."""
+        if self.session_store is None:
+            return False
+        
+        user = self.session_store.load(self.config.domain, username)
+        if user is None:
+            return False
+        
+        if user.cookie:
+            # The stored PHPSESSID must travel with the tokens, as after a full login
+            value = user.cookie.split('=', 1)[1] if '=' in user.cookie else user.cookie
+            self.transport.session.cookies.set('PHPSESSID', value, domain=self.config.domain)
+        
+        query_api = QueryApi(user, self.config, self.transport, self.cache, self.validators)
+        try:
+            valid = query_api.validate_session()
+        except APIError as e:
+            self.logger.warning(f"Could not validate stored session ({e}), running full login flow")
+            return False
+        if not valid:
+            self.logger.info("Stored session rejected, running full login flow")
+            self.session_store.delete(self.config.domain, username)
+            return False
+        
+        self._user = user
+        self._query_api = query_api
+        return True
+    
     @property
     def is_authenticated(self) -> bool:
         """Check if client is authenticated."""
@@ -76,13 +148,17 @@ class ClickEduClient:
         if not self.is_authenticated:
             raise AuthenticationError("Client not authenticated. Call authenticate() first.")
     
-    def get_news(self, start_limit: int = 0, end_limit: int = 10):
+    def get_news(self, start_limit: int = 0, end_limit: int = 10, lazy_bodies: Optional[str] = None,
+                 deadline=None):
         """
         Get news from ClickEdu.
         
         Args:
             start_limit: Starting index for news items
             end_limit: Ending index for news items
+            lazy_bodies: "memory" or "disk" to keep bodies compressed or spooled
+                until accessed (news are then LazyNewsItem objects)
+            deadline: Time budget in seconds (or a Deadline) for the request and its retries
             
         Returns:
             NewsResponse object with news items
@@ -92,7 +168,62 @@ class ClickEduClient:
             APIError: If API request fails
         """
         self._ensure_authenticated()
-        return self._query_api.get_news(start_limit, end_limit)
+        return self._query_api.get_news(start_limit, end_limit, lazy_bodies, deadline=deadline)
+    
+    def iter_news(self, page_size: int = 10, prefetch: int = 1, lazy_bodies: Optional[str] = None):
+        """
+        Iterate over all news items, prefetching following pages in the background.
+        
+        Args:
+            page_size: Number of news items requested per page
+            prefetch: Number of pages fetched ahead of the consumer
+            lazy_bodies: "memory" or "disk" to keep bodies compressed or spooled
+                until accessed (items are then LazyNewsItem objects)
+            
+        Returns:
+            Iterator of NewsItem objects
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            APIError: If API request fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.iter_news(page_size=page_size, prefetch=prefetch, lazy_bodies=lazy_bodies)
+    
+    def fetch_all_news(self, concurrency: int = 4, page_size: int = 50):
+        """
+        Fetch every news item, downloading pages concurrently.
+        
+        Args:
+            concurrency: Maximum number of pages fetched at the same time
+            page_size: Number of news items per page
+            
+        Returns:
+            NewsResponse object with all news items
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            APIError: If API request fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.fetch_all_news(concurrency=concurrency, page_size=page_size)
+    
+    def news_syncer(self, state_path: Optional[str] = None, page_size: int = 10) -> NewsSyncer:
+        """
+        Create a syncer that fetches only news published since its last run.
+        
+        Args:
+            state_path: JSON file where the high-water mark is persisted
+            page_size: Number of news items requested per page
+            
+        Returns:
+            NewsSyncer bound to this client
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return NewsSyncer(self._query_api, state_path, page_size=page_size)
     
     def get_photo_albums(self, start_limit: int = 0, end_limit: int = 10):
         """
@@ -129,6 +260,153 @@ class ClickEduClient:
         self._ensure_authenticated()
         return self._query_api.get_album_by_id(album_id)
     
+    def get_album_photo_table(self, album_id: str):
+        """
+        Get photos from a specific album as a compact columnar table.
+        
+        Args:
+            album_id: ID of the album
+            
+        Returns:
+            PhotoTable building full URLs lazily on access
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            APIError: If API request fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.get_album_photo_table(album_id)
+    
+    def iter_album_photos(self, album_id: str):
+        """
+        Iterate over the photos of an album while the response is downloaded.
+        
+        Args:
+            album_id: ID of the album
+            
+        Returns:
+            Iterator of Photo objects, parsed incrementally from the response
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            APIError: If API request fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.iter_album_photos(album_id)
+    
+    def stream_news(self, start_limit: int = 0, end_limit: int = 10, lazy_bodies: Optional[str] = None):
+        """
+        Iterate over news items while the response is downloaded.
+        
+        Args:
+            start_limit: Starting index for news items
+            end_limit: Ending index for news items
+            lazy_bodies: "memory" or "disk" to keep bodies compressed or spooled
+                until accessed (items are then LazyNewsItem objects)
+            
+        Returns:
+            Iterator of NewsItem objects, parsed incrementally from the response
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            APIError: If API request fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.stream_news(start_limit, end_limit, lazy_bodies)
+    
+    def get_albums_photos(self, album_ids, max_workers: Optional[int] = None):
+        """
+        Get photos from several albums concurrently.
+        
+        Args:
+            album_ids: IDs of the albums
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+            
+        Returns:
+            BatchResult mapping album IDs, in input order, to GetAlbumByIdResponse
+            objects, with per-album failures in ``errors``
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.get_albums_by_ids(album_ids, max_workers)
+    
+    def albums_photos_as_completed(self, album_ids, max_workers: Optional[int] = None, on_error=None):
+        """
+        Get photos from several albums concurrently, in completion order.
+        
+        Args:
+            album_ids: IDs of the albums
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+            on_error: Called with (album_id, exception) for albums that failed
+            
+        Returns:
+            Iterator of (album_id, GetAlbumByIdResponse) tuples
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.albums_by_ids_as_completed(album_ids, max_workers, on_error)
+    
+    def get_news_for_children(self, child_ids, start_limit: int = 0, end_limit: int = 10,
+                              max_workers: Optional[int] = None):
+        """
+        Get news for several children of the account concurrently.
+        
+        Args:
+            child_ids: Children to query
+            start_limit: Starting index for news items
+            end_limit: Ending index for news items
+            max_workers: Maximum concurrent requests
+            
+        Returns:
+            BatchResult mapping child IDs to NewsResponse objects (combine with merge_news)
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.get_news_for_children(child_ids, start_limit, end_limit, max_workers)
+    
+    def get_photo_albums_for_children(self, child_ids, start_limit: int = 0, end_limit: int = 10,
+                                      max_workers: Optional[int] = None):
+        """
+        Get photo albums for several children of the account concurrently.
+        
+        Args:
+            child_ids: Children to query
+            start_limit: Starting index for albums
+            end_limit: Ending index for albums
+            max_workers: Maximum concurrent requests
+            
+        Returns:
+            BatchResult mapping child IDs to PhotoAlbumsResponse objects (combine with merge_albums)
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.get_photo_albums_for_children(child_ids, start_limit, end_limit, max_workers)
+    
+    def get_albums_for_children(self, albums, max_workers: Optional[int] = None):
+        """
+        Get the photos of albums belonging to different children concurrently.
+        
+        Args:
+            albums: (child_id, album_id) pairs
+            max_workers: Maximum concurrent requests
+            
+        Returns:
+            BatchResult mapping (child_id, album_id) pairs to GetAlbumByIdResponse objects
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.get_albums_for_children(albums, max_workers)
+    
     def download_file(self, file_path: str, download_dir: str = "files"):
         """
         Download a file from ClickEdu.
@@ -146,6 +424,83 @@ class ClickEduClient:
         self._ensure_authenticated()
         return self._query_api.download_file(file_path, download_dir)
     
+    def iter_file(self, file_path: str, chunk_size: Optional[int] = None):
+        """
+        Download a file as an iterator of byte chunks, without writing it to disk.
+        
+        Args:
+            file_path: Path to the file (from news item or photo)
+            chunk_size: Size of the chunks
+            
+        Returns:
+            Iterator over the body chunks
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            FileDownloadError: If the download fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.iter_file(file_path, chunk_size)
+    
+    def open_file(self, file_path: str, buffer_size: Optional[int] = None):
+        """
+        Open a file for reading straight from ClickEdu, without writing it to disk.
+        
+        Args:
+            file_path: Path to the file (from news item or photo)
+            buffer_size: Size of the read buffer
+            
+        Returns:
+            Binary file-like object supporting ``read`` and ``readinto``; close it when done
+            
+        Raises:
+            AuthenticationError: If not authenticated
+            FileDownloadError: If the download fails
+        """
+        self._ensure_authenticated()
+        return self._query_api.open_file(file_path, buffer_size)
+    
+    def download_files(self, items, download_dir: str = "files", variant: str = "large",
+                       max_workers: Optional[int] = None, progress=None):
+        """
+        Download many files concurrently.
+        
+        Args:
+            items: File paths or Photo objects
+            download_dir: Directory to save the files
+            variant: Photo size to download, "large" or "small"
+            max_workers: Maximum concurrent downloads
+            progress: Called with a DownloadProgress after each chunk of every file
+            
+        Returns:
+            BatchResult mapping file paths to local paths, with failures in ``errors``
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.download_files(items, download_dir, variant, max_workers, progress)
+    
+    def mirror_albums(self, target_dir: str, prune: bool = False, variants=("large",),
+                      rescan_known: bool = True):
+        """
+        Mirror every photo album into a local directory, downloading only new photos.
+        
+        Args:
+            target_dir: Directory of the mirror; its manifest is kept there
+            prune: Delete local albums and photos that are no longer on the server
+            variants: Photo sizes to download, "large" and/or "small"
+            rescan_known: Re-read the photo lists of albums already mirrored
+            
+        Returns:
+            MirrorResult describing what was downloaded, removed or failed
+            
+        Raises:
+            AuthenticationError: If not authenticated
+        """
+        self._ensure_authenticated()
+        return self._query_api.mirror_albums(target_dir, prune, variants, rescan_known)
+    
     def init(self):
         """
         Execute initialization query.
@@ -164,3 +519,21 @@ class ClickEduClient:
     def user(self) -> Optional[User]:
         """Get the authenticated user object."""
         return self._user
+    
+    def invalidate_cache(self, query: Optional[str] = None) -> int:
+        """
+        Drop cached query results.
+        
+        Args:
+            query: Only drop results for this query path, e.g. "/news" (all if None)
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(query)
+    
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.transport.close()
@@ -7,6 +7,7 @@ import logging
 from typing import Optional
 from dotenv import load_dotenv
 from .exceptions import ConfigurationError
+from .utils.json_backend import get_json_loads
 
 # Load environment variables from .env file
 load_dotenv()
@@ -30,6 +31,56 @@ class Config:
         self.client_secret = os.getenv("CLICKEDU_CLIENT_SECRET", "xxx")
         self.default_language = os.getenv("DEFAULT_LANGUAGE", "ca")
 
+        # HTTP connection pooling
+        self.pool_connections = int(os.getenv("CLICKEDU_POOL_CONNECTIONS", "10"))
+        self.pool_maxsize = int(os.getenv("CLICKEDU_POOL_MAXSIZE", "10"))
+        self.max_retries = int(os.getenv("CLICKEDU_MAX_RETRIES", "0"))
+        self.retry_backoff = float(os.getenv("CLICKEDU_RETRY_BACKOFF", "0.5"))
+        self.keep_alive = os.getenv("CLICKEDU_KEEP_ALIVE", "true").lower() not in ("0", "false", "no")
+
+        # Retries of failed requests (0 disables) with exponential backoff and jitter; POST
+        # paths listed in CLICKEDU_RETRY_POST_PATHS (comma separated) are retried as well.
+        # When enabled, these replace the connection-level CLICKEDU_MAX_RETRIES
+        self.retry_attempts = int(os.getenv("CLICKEDU_RETRY_ATTEMPTS", "0"))
+        self.retry_post_paths = tuple(
+            path.strip() for path in os.getenv("CLICKEDU_RETRY_POST_PATHS", "").split(",") if path.strip()
+        )
+
+        # Per-endpoint circuit breakers: consecutive failures that open one (0 disables)
+        # and seconds before a trial request is let through
+        self.breaker_threshold = int(os.getenv("CLICKEDU_BREAKER_THRESHOLD", "0"))
+        self.breaker_reset_timeout = float(os.getenv("CLICKEDU_BREAKER_RESET_TIMEOUT", "30"))
+
+        # Request timeouts in seconds: one connect timeout and a read timeout per endpoint
+        # class; downloads also fail when slower than download_min_speed bytes/s over
+        # download_stall_window seconds
+        self.connect_timeout = float(os.getenv("CLICKEDU_CONNECT_TIMEOUT", "10"))
+        self.auth_timeout = float(os.getenv("CLICKEDU_AUTH_TIMEOUT", "30"))
+        self.api_timeout = float(os.getenv("CLICKEDU_API_TIMEOUT", "30"))
+        self.query_timeout = float(os.getenv("CLICKEDU_QUERY_TIMEOUT", "30"))
+        self.download_timeout = float(os.getenv("CLICKEDU_DOWNLOAD_TIMEOUT", "60"))
+        self.download_min_speed = float(os.getenv("CLICKEDU_DOWNLOAD_MIN_SPEED", "1024"))
+        self.download_stall_window = float(os.getenv("CLICKEDU_DOWNLOAD_STALL_WINDOW", "30"))
+
+        # Batch downloads: concurrent downloads per host and bytes being received at once
+        self.download_per_host = int(os.getenv("CLICKEDU_DOWNLOAD_PER_HOST", "2"))
+        self.download_max_inflight_bytes = int(os.getenv("CLICKEDU_DOWNLOAD_MAX_INFLIGHT_BYTES", str(64 * 1024 * 1024)))
+
+        # Directory of the content-addressed store deduplicating downloads (empty disables)
+        self.blob_store_dir = os.getenv("CLICKEDU_BLOB_STORE_DIR", "")
+
+        # JSON decoder: "auto", "orjson", "ujson", "json" or a callable taking bytes
+        self.json_backend = os.getenv("CLICKEDU_JSON_BACKEND", "auto")
+
+        # Upper bound on concurrent requests issued by batch operations against this domain
+        self.max_workers = int(os.getenv("CLICKEDU_MAX_WORKERS", "4"))
+
+        # Client-side throttling per host: requests per second (0 disables the token
+        # bucket) and an adaptive concurrency window bounded by max_concurrency
+        self.rate_limit = float(os.getenv("CLICKEDU_RATE_LIMIT", "0"))
+        self.adaptive_concurrency = os.getenv("CLICKEDU_ADAPTIVE_CONCURRENCY", "false").lower() in ("1", "true", "yes")
+        self.max_concurrency = int(os.getenv("CLICKEDU_MAX_CONCURRENCY", "16"))
+
         # Set up logging
         log_level_str = log_level or os.getenv("LOG_LEVEL", "WARNING")
         self.log_level = getattr(logging, log_level_str.upper(), logging.WARNING)
@@ -48,6 +99,38 @@ class Config:
         """Get the API base URL."""
         return "https://api.clickedu.eu"
     
+    @property
+    def json_backend(self):
+        """JSON decoder setting: "auto", "orjson", "ujson", "json" or a callable taking bytes."""
+        return self._json_backend
+    
+    @json_backend.setter
+    def json_backend(self, backend) -> None:
+        # Resolved here so a bad setting fails before any request is sent
+        try:
+            self._json_loads = get_json_loads(backend)
+        except (ValueError, ImportError) as e:
+            raise ConfigurationError(f"Invalid JSON backend {backend!r}: {e}") from e
+        self._json_backend = backend
+    
+    @property
+    def json_loads(self):
+        """Get the function used to decode JSON response bodies."""
+        return self._json_loads
+    
+    def timeout_for(self, endpoint_class: str) -> tuple:
+        """
+        Get the (connect, read) timeout for an endpoint class.
+        
+        Args:
+            endpoint_class: "auth" (school login endpoints), "api" (api.clickedu.eu),
+                "query" (app_clickedu_query.php) or "download"
+        """
+        read = getattr(self, f"{endpoint_class}_timeout", None)
+        if read is None:
+            raise ValueError(f"Unknown endpoint class: {endpoint_class}")
+        return (self.connect_timeout, read)
+    
     def get_user_agent(self) -> str:
         """Get the User-Agent string for requests."""
         return "ClickEdu/Python"
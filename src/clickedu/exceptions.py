@@ -27,6 +27,20 @@ class APIError(ClickEduError):
         self.response_data = response_data or {}
 
 
+class CircuitOpenError(APIError):
+    """Raised when an endpoint's circuit breaker is open and requests fail fast."""
+    
+    def __init__(self, endpoint: str, retry_in: float = 0.0):
+        super().__init__(f"Circuit breaker open for {endpoint}, retry in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(ClickEduError):
+    """Raised when an operation runs out of its time budget."""
+    pass
+
+
 class ConfigurationError(ClickEduError):
     """Raised when configuration is invalid or missing."""
     pass
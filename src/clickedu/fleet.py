@@ -0,0 +1,277 @@
+"""
+Orchestration of many ClickEdu accounts across schools.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .client import ClickEduClient
+from .exceptions import ClickEduError
+from .models import BatchResult
+from .utils.logger import setup_logger
+from .utils.singleflight import SingleFlight
+
+AccountKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class FleetAccount:
+    """Credentials of one account in a fleet."""
+    domain: str
+    username: str
+    password: str = field(repr=False)
+
+    @property
+    def key(self) -> AccountKey:
+        """Identity of the account: (domain, username)."""
+        return (self.domain, self.username)
+
+
+@dataclass
+class _LiveClient:
+    client: ClickEduClient
+    last_used: float
+
+
+class ClickEduFleet:
+    """
+    Manager of authenticated clients for many accounts and domains.
+
+    Accounts are authenticated on demand or in bulk with bounded
+    parallelism; every request for a domain, logins included, also holds one
+    of ``per_domain_limit`` slots so a large fleet does not flood a single
+    school. Live clients are kept in an LRU of at most ``max_clients``
+    entries, and clients idle for longer than ``idle_timeout`` are closed
+    and re-authenticated on next use.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[Any] = (),
+        max_parallel: int = 8,
+        per_domain_limit: int = 2,
+        max_clients: int = 100,
+        idle_timeout: Optional[float] = 300.0,
+        client_factory: Optional[Callable[[str], ClickEduClient]] = None,
+        concurrent_login: bool = False,
+    ):
+        """
+        Initialize fleet.
+
+        Args:
+            accounts: FleetAccount objects or (domain, username, password) tuples
+            max_parallel: Maximum accounts authenticated or queried at the same time
+            per_domain_limit: Maximum concurrent operations against one domain
+            max_clients: Maximum number of live clients kept
+            idle_timeout: Seconds after which an unused client is closed (None keeps them)
+            client_factory: Builds an unauthenticated client for a domain
+            concurrent_login: Run independent login steps of each account concurrently
+        """
+        if max_parallel < 1 or per_domain_limit < 1 or max_clients < 1:
+            raise ValueError("max_parallel, per_domain_limit and max_clients must be at least 1")
+        self.max_parallel = max_parallel
+        self.per_domain_limit = per_domain_limit
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.client_factory = client_factory or (lambda domain: ClickEduClient(domain=domain))
+        self.concurrent_login = concurrent_login
+        self.logger = setup_logger("clickedu.fleet")
+
+        self._accounts: Dict[AccountKey, FleetAccount] = {}
+        self._clients: "OrderedDict[AccountKey, _LiveClient]" = OrderedDict()
+        self._domain_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._logins = SingleFlight()
+        self._evicted = 0
+
+        for account in accounts:
+            if isinstance(account, FleetAccount):
+                self.add_account(account)
+            else:
+                self.add(*account)
+
+    def add(self, domain: str, username: str, password: str) -> FleetAccount:
+        """Add an account given its credentials."""
+        return self.add_account(FleetAccount(domain, username, password))
+
+    def add_account(self, account: FleetAccount) -> FleetAccount:
+        """Add an account, replacing one with the same domain and username."""
+        with self._lock:
+            self._accounts[account.key] = account
+        return account
+
+    @property
+    def accounts(self) -> List[FleetAccount]:
+        """Accounts in the fleet, in insertion order."""
+        with self._lock:
+            return list(self._accounts.values())
+
+    @property
+    def live_clients(self) -> int:
+        """Number of authenticated clients currently kept."""
+        with self._lock:
+            return len(self._clients)
+
+    @property
+    def evicted(self) -> int:
+        """Number of clients closed because of the LRU bound or the idle timeout."""
+        with self._lock:
+            return self._evicted
+
+    def _domain_slot(self, domain: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._domain_slots.get(domain)
+            if slot is None:
+                slot = self._domain_slots[domain] = threading.BoundedSemaphore(self.per_domain_limit)
+            return slot
+
+    def _pop_evictable(self, keep: Optional[AccountKey] = None) -> List[ClickEduClient]:
+        """Remove idle clients other than ``keep`` and LRU clients beyond the bound (lock held)."""
+        evicted = []
+        if self.idle_timeout is not None:
+            cutoff = time.monotonic() - self.idle_timeout
+            for key in [key for key, live in self._clients.items() if live.last_used < cutoff and key != keep]:
+                evicted.append(self._clients.pop(key).client)
+        while len(self._clients) > self.max_clients:
+            evicted.append(self._clients.popitem(last=False)[1].client)
+        self._evicted += len(evicted)
+        return evicted
+
+    @staticmethod
+    def _close_all(clients: List[ClickEduClient]) -> None:
+        for client in clients:
+            client.close()
+
+    def evict_idle(self) -> int:
+        """Close clients idle for longer than ``idle_timeout``. Returns the number closed."""
+        with self._lock:
+            evicted = self._pop_evictable()
+        self._close_all(evicted)
+        return len(evicted)
+
+    def client(self, domain: str, username: str) -> ClickEduClient:
+        """
+        Get an authenticated client for an account, logging in if needed.
+
+        Concurrent callers asking for the same account share one login.
+
+        Raises:
+            KeyError: If the account is not part of the fleet
+            AuthenticationError: If authentication fails
+        """
+        key = (domain, username)
+        with self._lock:
+            evicted = self._pop_evictable()
+            live = self._clients.get(key)
+            if live is not None:
+                live.last_used = time.monotonic()
+                self._clients.move_to_end(key)
+            account = self._accounts[key]
+        self._close_all(evicted)
+        if live is not None:
+            return live.client
+        return self._logins.do(("login", key), lambda: self._login(account))
+
+    def _login(self, account: FleetAccount) -> ClickEduClient:
+        """Authenticate an account and keep its client."""
+        client = self.client_factory(account.domain)
+        try:
+            with self._domain_slot(account.domain):
+                client.authenticate(account.username, account.password, concurrent=self.concurrent_login)
+        except Exception:
+            client.close()
+            raise
+        with self._lock:
+            self._clients[account.key] = _LiveClient(client, time.monotonic())
+            self._clients.move_to_end(account.key)
+            evicted = self._pop_evictable(keep=account.key)
+        self._close_all(evicted)
+        return client
+
+    def _select(self, accounts: Optional[Iterable[Any]]) -> List[FleetAccount]:
+        """Resolve accounts given as FleetAccount objects or (domain, username) keys."""
+        if accounts is None:
+            return self.accounts
+        with self._lock:
+            return [account if isinstance(account, FleetAccount) else self._accounts[tuple(account)]
+                    for account in accounts]
+
+    def run(self, operation: Callable[[ClickEduClient], Any], accounts: Optional[Iterable[Any]] = None,
+            max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Run an operation for many accounts with bounded parallelism.
+
+        Each account is authenticated on demand; the operation itself runs
+        while holding one of the account domain's slots.
+
+        Args:
+            operation: Function called with each authenticated client
+            accounts: Accounts or (domain, username) keys to run for (all if None)
+            max_workers: Maximum accounts processed at the same time (capped by ``max_parallel``)
+
+        Returns:
+            BatchResult mapping (domain, username) keys, in input order, to the
+            operation's results, with failed accounts reported in ``errors``
+        """
+        selected = self._select(accounts)
+        batch = BatchResult()
+        if not selected:
+            return batch
+
+        def task(account: FleetAccount) -> Any:
+            client = self.client(account.domain, account.username)
+            with self._domain_slot(account.domain):
+                return operation(client)
+
+        workers = min(self.max_parallel, max_workers or self.max_parallel, len(selected))
+        completed: Dict[AccountKey, Any] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clickedu-fleet") as executor:
+            futures = {executor.submit(task, account): account.key for account in selected}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    completed[key] = future.result()
+                except (ClickEduError, KeyError) as e:
+                    self.logger.error(f"Fleet operation failed for {key[1]}@{key[0]}: {e}")
+                    batch.errors[key] = e
+
+        batch.results = {account.key: completed[account.key] for account in selected
+                         if account.key in completed}
+        return batch
+
+    def authenticate_all(self, accounts: Optional[Iterable[Any]] = None,
+                         max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Authenticate accounts with bounded parallelism.
+
+        Returns:
+            BatchResult mapping (domain, username) keys to authenticated users
+        """
+        return self.run(lambda client: client.user, accounts, max_workers)
+
+    def get_news(self, start_limit: int = 0, end_limit: int = 10,
+                 accounts: Optional[Iterable[Any]] = None) -> BatchResult:
+        """Get news for every account. Returns a BatchResult of NewsResponse objects."""
+        return self.run(lambda client: client.get_news(start_limit, end_limit), accounts)
+
+    def get_photo_albums(self, start_limit: int = 0, end_limit: int = 10,
+                         accounts: Optional[Iterable[Any]] = None) -> BatchResult:
+        """Get photo albums for every account. Returns a BatchResult of PhotoAlbumsResponse objects."""
+        return self.run(lambda client: client.get_photo_albums(start_limit, end_limit), accounts)
+
+    def close(self) -> None:
+        """Close every live client."""
+        with self._lock:
+            clients = [live.client for live in self._clients.values()]
+            self._clients.clear()
+        self._close_all(clients)
+
+    def __enter__(self) -> "ClickEduFleet":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
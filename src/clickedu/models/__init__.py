@@ -17,6 +17,17 @@ from .responses import (
     Photo,
     GetAlbumByIdResponse,
 )
+from .batch import BatchResult
+from .decoders import ModelDecoder, get_decoder
+from .tables import (
+    CompactNewsItem,
+    CompactPhotoAlbum,
+    CompactPhoto,
+    StringColumn,
+    PhotoTable,
+    AlbumTable,
+)
+from .lazy import BodySpool, LazyNewsItem
 
 __all__ = [
     "User",
@@ -32,4 +43,15 @@ __all__ = [
     "PhotoAlbumsResponse",
     "Photo",
     "GetAlbumByIdResponse",
+    "BatchResult",
+    "ModelDecoder",
+    "get_decoder",
+    "CompactNewsItem",
+    "CompactPhotoAlbum",
+    "CompactPhoto",
+    "StringColumn",
+    "PhotoTable",
+    "AlbumTable",
+    "BodySpool",
+    "LazyNewsItem",
 ]
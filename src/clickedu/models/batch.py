@@ -0,0 +1,18 @@
+"""
+Aggregated results for batch operations.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+
+@dataclass
+class BatchResult:
+    """Results and per-item errors of a batch operation, keyed by input."""
+    results: Dict[Any, Any] = field(default_factory=dict)
+    errors: Dict[Any, Exception] = field(default_factory=dict)
+    
+    @property
+    def ok(self) -> bool:
+        """True if every item succeeded."""
+        return not self.errors
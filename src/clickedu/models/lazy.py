@@ -0,0 +1,197 @@
+"""
+News items whose bodies are loaded only when accessed.
+"""
+
+import tempfile
+import threading
+import zlib
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .responses import NewsItem
+
+# Modes accepted by the ``lazy_bodies`` option of the news queries
+LAZY_BODY_MODES = ("memory", "disk")
+
+
+class BodySpool:
+    """
+    Append-only temporary file holding news bodies.
+
+    Bodies are written as UTF-8 and read back by offset, so thousands of
+    items can stay alive while only their offsets are kept in memory. The
+    file is removed when the spool is closed or garbage collected.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize body spool.
+
+        Args:
+            directory: Directory for the temporary file (system default if None)
+        """
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def write(self, data: bytes) -> Tuple[int, int]:
+        """Append data and return its (offset, length)."""
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+            return offset, len(data)
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Read back data written at ``offset``."""
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written to the spool."""
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        """True once the spool has been closed."""
+        return self._file.closed
+
+    def close(self) -> None:
+        """Close and delete the temporary file."""
+        self._file.close()
+
+    def __enter__(self) -> "BodySpool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LazyNewsItem:
+    """
+    News item keeping its body out of the Python heap until accessed.
+
+    The body is stored either zlib-compressed in memory or in a BodySpool on
+    disk and decoded on first access of ``body``. ``release_body()`` drops
+    the decoded string again, so a rendered item costs only its compressed
+    body (or a spool offset) afterwards.
+    """
+
+    __slots__ = ("title", "subtitle", "imagePath", "imageText", "filePath", "_source", "_spool", "_body")
+
+    def __init__(self, title: str, subtitle: Optional[str] = None, body: Optional[str] = None,
+                 imagePath: Optional[str] = None, imageText: Optional[str] = None,
+                 filePath: Optional[str] = None, spool: Optional[BodySpool] = None):
+        """
+        Initialize lazy news item.
+
+        Args:
+            title: News title
+            subtitle: News subtitle
+            body: HTML body, stored compressed (or spooled) rather than as a string
+            imagePath: Image path
+            imageText: Image caption
+            filePath: Attached file path
+            spool: Spool to write the body to (kept compressed in memory if None)
+        """
+        self.title = title
+        self.subtitle = subtitle
+        self.imagePath = imagePath
+        self.imageText = imageText
+        self.filePath = filePath
+        self._spool = spool
+        self._body = None
+        self._source: Union[None, bytes, Tuple[int, int]] = None
+        if body is not None:
+            data = body.encode("utf-8")
+            self._source = spool.write(data) if spool is not None else zlib.compress(data)
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any], spool: Optional[BodySpool] = None) -> "LazyNewsItem":
+        """Build an item from one entry of the ``news`` list of a /news response."""
+        return cls(
+            title=data.get("title", ""),
+            subtitle=data.get("subtitle"),
+            body=data.get("body"),
+            imagePath=data.get("imagePath"),
+            imageText=data.get("imageText"),
+            filePath=data.get("filePath"),
+            spool=spool,
+        )
+
+    def read_body(self) -> Optional[str]:
+        """Decode the body without keeping the decoded string."""
+        if self._body is not None:
+            return self._body
+        if self._source is None:
+            return None
+        if self._spool is not None:
+            data = self._spool.read(*self._source)
+        else:
+            data = zlib.decompress(self._source)
+        return data.decode("utf-8")
+
+    @property
+    def body(self) -> Optional[str]:
+        """The body, decoded on first access and kept until release_body()."""
+        if self._body is None:
+            self._body = self.read_body()
+        return self._body
+
+    @property
+    def body_loaded(self) -> bool:
+        """True while the decoded body is held in memory."""
+        return self._body is not None
+
+    def release_body(self) -> None:
+        """Drop the decoded body; it is decoded again on next access."""
+        self._body = None
+
+    def to_news_item(self) -> NewsItem:
+        """Materialise a regular NewsItem, loading the body."""
+        return NewsItem(title=self.title, subtitle=self.subtitle, body=self.read_body(),
+                        imagePath=self.imagePath, imageText=self.imageText, filePath=self.filePath)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (LazyNewsItem, NewsItem)):
+            return NotImplemented
+        return _news_fields(self) == _news_fields(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyNewsItem(title={self.title!r}, subtitle={self.subtitle!r}, body_loaded={self.body_loaded})"
+
+
+def _news_fields(item) -> tuple:
+    """Field values of a news item, for comparisons between lazy and regular items."""
+    body = item.read_body() if isinstance(item, LazyNewsItem) else item.body
+    return (item.title, item.subtitle, body, item.imagePath, item.imageText, item.filePath)
+
+
+def check_lazy_bodies(mode: str) -> None:
+    """Raise ValueError for an unknown ``lazy_bodies`` mode."""
+    if mode not in LAZY_BODY_MODES:
+        raise ValueError(f"lazy_bodies must be one of {LAZY_BODY_MODES}, got {mode!r}")
+
+
+def lazy_news_items(items_data, mode: str, spool: Optional[BodySpool] = None) -> list:
+    """
+    Build LazyNewsItem objects from the ``news`` list of a /news response.
+
+    Args:
+        items_data: News dicts from the response
+        mode: "memory" to keep bodies compressed, "disk" to spool them
+        spool: Spool used in "disk" mode (a new one is created if None)
+
+    Returns:
+        List of LazyNewsItem objects
+    """
+    check_lazy_bodies(mode)
+    if mode == "disk":
+        spool = spool or BodySpool()
+    else:
+        spool = None
+    return [LazyNewsItem.from_json(data, spool) for data in items_data]
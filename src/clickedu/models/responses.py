@@ -16,6 +16,7 @@ class User:
     auth_token: str
     secret_token: str
     access_token: str
+    cookie: Optional[str] = None
 
 
 @dataclass
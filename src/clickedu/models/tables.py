@@ -0,0 +1,213 @@
+"""
+Compact model variants and columnar containers for large photo and album lists.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional
+
+from .decoders import PRIVATE_PREFIX
+from .responses import Photo, PhotoAlbum
+
+
+@dataclass(slots=True)
+class CompactNewsItem:
+    """Slotted variant of NewsItem without a per-instance __dict__."""
+    title: str
+    subtitle: Optional[str] = None
+    body: Optional[str] = None
+    imagePath: Optional[str] = None
+    imageText: Optional[str] = None
+    filePath: Optional[str] = None
+
+
+@dataclass(slots=True)
+class CompactPhotoAlbum:
+    """Slotted variant of PhotoAlbum without a per-instance __dict__."""
+    id: str
+    name: str
+    coverImageLarge: Optional[str] = None
+    coverImageSmall: Optional[str] = None
+
+
+@dataclass(slots=True)
+class CompactPhoto:
+    """Slotted variant of Photo without a per-instance __dict__."""
+    id: str
+    pathLarge: Optional[str] = None
+    pathSmall: Optional[str] = None
+
+
+class StringColumn:
+    """
+    Append-only column of optional strings packed into one UTF-8 buffer.
+
+    Each value costs a 4-byte offset plus its encoded bytes instead of a
+    full Python ``str`` object; values are decoded on access.
+    """
+
+    __slots__ = ("_data", "_offsets", "_missing")
+
+    def __init__(self, values: Iterable[Optional[str]] = ()):
+        self._data = bytearray()
+        self._offsets = array("I", [0])
+        self._missing = bytearray()
+        for value in values:
+            self.append(value)
+
+    def append(self, value: Optional[str]) -> None:
+        """Append a value (None is kept distinct from the empty string)."""
+        if value is None:
+            self._missing.append(1)
+        else:
+            self._missing.append(0)
+            self._data += value.encode("utf-8")
+        self._offsets.append(len(self._data))
+
+    def __len__(self) -> int:
+        return len(self._missing)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index < 0:
+            index += len(self)
+        if self._missing[index]:
+            return None
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the column buffers."""
+        return (len(self._data) + self._offsets.itemsize * len(self._offsets) + len(self._missing))
+
+
+def _relative_path(path: Optional[str]) -> Optional[str]:
+    """Strip the private prefix stored in API paths."""
+    return path.replace(PRIVATE_PREFIX, "") if path else path
+
+
+class _Table:
+    """Shared behaviour of the columnar containers."""
+
+    __slots__ = ()
+
+    def _url(self, column: StringColumn, index: int) -> Optional[str]:
+        """Build a full URL for one cell of a path column."""
+        path = column[index]
+        return self.base_url + path if path else path
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def nbytes(self) -> int:
+        """Approximate memory used by the column buffers."""
+        return sum(getattr(self, name).nbytes() for name in self.__slots__
+                   if isinstance(getattr(self, name), StringColumn))
+
+
+class PhotoTable(_Table):
+    """
+    Columnar container of photos sharing one base URL.
+
+    Photo ids and relative paths are packed into compact columns and the
+    long private base URL (which embeds the app credentials and tokens) is
+    stored once; full URLs and Photo objects are built lazily on access.
+    """
+
+    __slots__ = ("base_url", "ids", "large_paths", "small_paths")
+
+    def __init__(self, base_url: str = ""):
+        """
+        Initialize photo table.
+
+        Args:
+            base_url: Base URL prefixed to every relative path
+        """
+        self.base_url = base_url
+        self.ids = StringColumn()
+        self.large_paths = StringColumn()
+        self.small_paths = StringColumn()
+
+    @classmethod
+    def from_json(cls, photos_data: Iterable[dict], base_url: str = "") -> "PhotoTable":
+        """Build a table from the ``photos`` list of a /pictures response."""
+        table = cls(base_url)
+        for photo_data in photos_data:
+            table.append(photo_data.get("id", ""), photo_data.get("pathLarge"), photo_data.get("pathSmall"))
+        return table
+
+    def append(self, photo_id: str, path_large: Optional[str] = None, path_small: Optional[str] = None) -> None:
+        """Append a photo given its API paths (with or without the "../private/" prefix)."""
+        self.ids.append(photo_id)
+        self.large_paths.append(_relative_path(path_large))
+        self.small_paths.append(_relative_path(path_small))
+
+    def large_url(self, index: int) -> Optional[str]:
+        """Full URL of the large image of a photo."""
+        return self._url(self.large_paths, index)
+
+    def small_url(self, index: int) -> Optional[str]:
+        """Full URL of the small image of a photo."""
+        return self._url(self.small_paths, index)
+
+    def __getitem__(self, index: int) -> CompactPhoto:
+        return CompactPhoto(id=self.ids[index], pathLarge=self.large_url(index), pathSmall=self.small_url(index))
+
+    def to_photos(self) -> List[Photo]:
+        """Materialise regular Photo objects."""
+        return [Photo(id=photo.id, pathLarge=photo.pathLarge, pathSmall=photo.pathSmall) for photo in self]
+
+
+class AlbumTable(_Table):
+    """Columnar container of photo albums sharing one base URL."""
+
+    __slots__ = ("base_url", "ids", "names", "large_covers", "small_covers")
+
+    def __init__(self, base_url: str = ""):
+        """
+        Initialize album table.
+
+        Args:
+            base_url: Base URL prefixed to every relative cover path
+        """
+        self.base_url = base_url
+        self.ids = StringColumn()
+        self.names = StringColumn()
+        self.large_covers = StringColumn()
+        self.small_covers = StringColumn()
+
+    @classmethod
+    def from_json(cls, albums_data: Iterable[dict], base_url: str = "") -> "AlbumTable":
+        """Build a table from the ``albums`` list of a /photo_albums response."""
+        table = cls(base_url)
+        for album_data in albums_data:
+            table.append(album_data.get("id", ""), album_data.get("name", ""),
+                         album_data.get("coverImageLarge"), album_data.get("coverImageSmall"))
+        return table
+
+    def append(self, album_id: str, name: str, cover_large: Optional[str] = None,
+               cover_small: Optional[str] = None) -> None:
+        """Append an album given its API cover paths."""
+        self.ids.append(album_id)
+        self.names.append(name)
+        self.large_covers.append(_relative_path(cover_large))
+        self.small_covers.append(_relative_path(cover_small))
+
+    def __getitem__(self, index: int) -> CompactPhotoAlbum:
+        return CompactPhotoAlbum(
+            id=self.ids[index],
+            name=self.names[index],
+            coverImageLarge=self._url(self.large_covers, index),
+            coverImageSmall=self._url(self.small_covers, index),
+        )
+
+    def to_albums(self) -> List[PhotoAlbum]:
+        """Materialise regular PhotoAlbum objects."""
+        return [PhotoAlbum(id=album.id, name=album.name, coverImageLarge=album.coverImageLarge,
+                           coverImageSmall=album.coverImageSmall) for album in self]
@@ -3,5 +3,10 @@ Query API for ClickEdu.
 """
 
 from .query_api import QueryApi
+from .cache import QueryCache, CacheStats
+from .sync import NewsSyncer, news_fingerprint
+from .children import merge_news, merge_albums
+from .mirror import AlbumMirror, MirrorResult
 
-__all__ = ["QueryApi"]
+__all__ = ["QueryApi", "QueryCache", "CacheStats", "NewsSyncer", "news_fingerprint", "merge_news", "merge_albums",
+           "AlbumMirror", "MirrorResult"]
@@ -0,0 +1,116 @@
+"""
+In-memory response cache for ClickEdu queries.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of cache counters."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class QueryCache:
+    """
+    Thread-safe TTL + LRU cache for query results.
+
+    Entries are keyed by query path, the non-secret query parameters, the
+    user and the child id, so cached data is never shared between users.
+    """
+
+    def __init__(self, max_size: int = 256, default_ttl: float = 60.0,
+                 ttls: Optional[Dict[str, float]] = None):
+        """
+        Initialize query cache.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the least recently used
+            default_ttl: Time-to-live in seconds for queries without a specific TTL
+            ttls: Per-query TTLs, e.g. ``{"/news": 30, "/photo_albums": 300}``;
+                a TTL of 0 disables caching for that query
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self._entries: "OrderedDict[Hashable, Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def ttl_for(self, query: str) -> float:
+        """Get the TTL in seconds for a query path."""
+        return self.ttls.get(query, self.default_ttl)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, _, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, query: str, value: Any) -> None:
+        """Store a value for a query, evicting the least recently used entries if full."""
+        ttl = self.ttl_for(query)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, query, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, query: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            query: Only drop entries for this query path (all entries if None)
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            if query is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            keys = [key for key, (_, entry_query, _) in self._entries.items() if entry_query == query]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
@@ -0,0 +1,61 @@
+"""
+Merging of per-child query results for parent accounts.
+"""
+
+from itertools import chain, zip_longest
+from typing import Dict, Union
+
+from ..models import BatchResult, NewsResponse, PhotoAlbumsResponse
+from .sync import news_fingerprint
+
+
+def _responses(results: Union[BatchResult, Dict]) -> list:
+    """Successful responses of a fan-out, in child order."""
+    if isinstance(results, BatchResult):
+        results = results.results
+    return [response for response in results.values() if response]
+
+
+def merge_news(results: Union[BatchResult, Dict[str, NewsResponse]]) -> NewsResponse:
+    """
+    Merge the news of several children, dropping news shared by siblings.
+
+    School-wide news is returned once per child. Items are interleaved
+    round-robin across children so that the merged list stays roughly
+    newest-first, and an item is kept at its first occurrence (identity as in
+    ``news_fingerprint``).
+
+    Args:
+        results: BatchResult or dict mapping child IDs to NewsResponse objects
+
+    Returns:
+        NewsResponse with the unique news; ``total`` is the number of unique items
+    """
+    seen = set()
+    news = []
+    lists = [response.news for response in _responses(results)]
+    for item in chain.from_iterable(zip_longest(*lists)):
+        if item is None:
+            continue
+        fingerprint = news_fingerprint(item)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            news.append(item)
+    return NewsResponse(total=len(news), news=news)
+
+
+def merge_albums(results: Union[BatchResult, Dict[str, PhotoAlbumsResponse]]) -> PhotoAlbumsResponse:
+    """
+    Merge the photo albums of several children, keeping each album id once.
+
+    Args:
+        results: BatchResult or dict mapping child IDs to PhotoAlbumsResponse objects
+
+    Returns:
+        PhotoAlbumsResponse with the unique albums, in child order
+    """
+    albums: Dict[str, object] = {}
+    for response in _responses(results):
+        for album in response.albums:
+            albums.setdefault(album.id, album)
+    return PhotoAlbumsResponse(albums=list(albums.values()))
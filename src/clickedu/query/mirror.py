@@ -0,0 +1,258 @@
+"""
+Incremental mirroring of ClickEdu photo albums.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import quote, urlparse
+
+from ..models import PhotoAlbum
+from ..utils.logger import setup_logger
+
+# Name of the manifest file kept in the mirror directory
+MANIFEST_NAME = ".clickedu-mirror.json"
+
+_VARIANT_FIELDS = {"large": "pathLarge", "small": "pathSmall"}
+
+
+def _photo_filename(photo_id: str, path: str) -> str:
+    """Local file name of a photo: its id (path-safe) followed by the URL's base name."""
+    return f"{quote(str(photo_id), safe='')}-{os.path.basename(urlparse(path).path)}"
+
+
+@dataclass
+class MirrorResult:
+    """Outcome of one mirror run."""
+    albums: int = 0
+    new_albums: List[str] = field(default_factory=list)
+    downloaded: List[str] = field(default_factory=list)
+    removed_albums: List[str] = field(default_factory=list)
+    removed_photos: int = 0
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if every album and photo was mirrored."""
+        return not self.errors
+
+
+class AlbumMirror:
+    """
+    Keep a local copy of every photo album up to date.
+
+    A manifest in the mirror directory records, for each album, its name and
+    the local files of every photo id and variant already downloaded. Each
+    run lists the albums, fetches the photo lists, and downloads only photos
+    (or variants) missing from the manifest; with ``prune`` it also deletes
+    albums and photos no longer on the server. The manifest is saved after
+    every run, so an interrupted run resumes where it stopped.
+
+    Photos are saved as ``<target_dir>/<album id>/<variant>/<photo id>-<file name>``,
+    so photos whose paths share a file name do not overwrite each other.
+    Ids are percent-encoded, and albums whose id cannot name a directory
+    inside the mirror (empty, "." or "..") are skipped and reported.
+    """
+
+    def __init__(self, query_api, target_dir: str, variants: Sequence[str] = ("large",),
+                 page_size: int = 50, rescan_known: bool = True, max_workers: Optional[int] = None):
+        """
+        Initialize album mirror.
+
+        Args:
+            query_api: QueryApi used to list albums and download photos
+            target_dir: Directory of the mirror
+            variants: Photo sizes to download, "large" and/or "small"
+            page_size: Number of albums requested per page
+            rescan_known: Re-read the photo lists of albums already mirrored; when False a
+                sync only lists the albums and fetches the photos of new ones
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+        """
+        unknown = [variant for variant in variants if variant not in _VARIANT_FIELDS]
+        if unknown or not variants:
+            raise ValueError(f"Unknown photo variants: {unknown}")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        self.query_api = query_api
+        self.target_dir = target_dir
+        self.variants = tuple(variants)
+        self.page_size = page_size
+        self.rescan_known = rescan_known
+        self.max_workers = max_workers
+        self.manifest_path = os.path.join(target_dir, MANIFEST_NAME)
+        self.logger = setup_logger("clickedu.mirror")
+        self.albums: Dict[str, Dict] = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """Load the mirrored albums: {album id: {"name": ..., "photos": {photo id: {variant: relative path}}}}."""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return dict(json.load(f).get("albums", {}))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable mirror manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _save_manifest(self) -> None:
+        """Atomically persist the manifest."""
+        os.makedirs(self.target_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.target_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"albums": self.albums}, f)
+            os.replace(tmp_path, self.manifest_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def list_albums(self) -> List[PhotoAlbum]:
+        """
+        List every album on the server, page by page.
+
+        Raises:
+            APIError: If a page cannot be fetched
+        """
+        albums: Dict[str, PhotoAlbum] = {}
+        start = 0
+        while True:
+            page = self.query_api.get_photo_albums(start, start + self.page_size)
+            if not page or not page.albums:
+                break
+            for album in page.albums:
+                albums.setdefault(album.id, album)
+            if len(page.albums) < self.page_size:
+                break
+            start += self.page_size
+        return list(albums.values())
+
+    def _inside(self, path: str) -> str:
+        """Check that a path resolves strictly inside the mirror directory."""
+        root = os.path.realpath(self.target_dir)
+        resolved = os.path.realpath(path)
+        if resolved == root or os.path.commonpath([root, resolved]) != root:
+            raise ValueError(f"Path {path!r} is outside the mirror directory")
+        return path
+
+    def _album_dir(self, album_id: str) -> str:
+        """
+        Directory of an album; the server's id is percent-encoded so it cannot name another path.
+
+        Raises:
+            ValueError: If the id is empty, "." or ".."
+        """
+        name = quote(str(album_id), safe="")
+        if name in ("", ".", ".."):
+            raise ValueError(f"Invalid album id: {album_id!r}")
+        return self._inside(os.path.join(self.target_dir, name))
+
+    def _local(self, path: str) -> str:
+        """Local path of a file recorded in the manifest (relative to the mirror)."""
+        return self._inside(os.path.join(self.target_dir, path))
+
+    def _exists(self, path: str) -> bool:
+        """Whether a file recorded in the manifest is present inside the mirror."""
+        try:
+            return os.path.exists(self._local(path))
+        except ValueError:
+            return False
+
+    def _remove(self, path: str) -> None:
+        """Delete a file recorded in the manifest, ignoring missing files and paths outside the mirror."""
+        try:
+            os.remove(self._local(path))
+        except (FileNotFoundError, ValueError):
+            pass
+
+    def sync(self, prune: bool = False) -> MirrorResult:
+        """
+        Bring the mirror up to date.
+
+        Args:
+            prune: Delete local albums and photos that are no longer on the server
+
+        Returns:
+            MirrorResult; albums or photos that failed are reported in ``errors``
+            and retried on the next run
+
+        Raises:
+            APIError: If the album list cannot be fetched (nothing is changed)
+        """
+        result = MirrorResult()
+        listed = self.list_albums()
+        result.albums = len(listed)
+        albums = []
+        for album in listed:
+            try:
+                self._album_dir(album.id)
+            except ValueError as e:
+                self.logger.warning(f"Skipping album {album.name!r}: {e}")
+                result.errors[album.id] = e
+                continue
+            albums.append(album)
+        for album in albums:
+            if album.id not in self.albums:
+                self.albums[album.id] = {"name": album.name, "photos": {}}
+                result.new_albums.append(album.id)
+            else:
+                self.albums[album.id]["name"] = album.name
+
+        if prune:
+            current = {album.id for album in listed}
+            for album_id in [album_id for album_id in self.albums if album_id not in current]:
+                del self.albums[album_id]
+                try:
+                    shutil.rmtree(self._album_dir(album_id), ignore_errors=True)
+                except ValueError as e:
+                    self.logger.warning(f"Not deleting files of album {album_id!r}: {e}")
+                result.removed_albums.append(album_id)
+
+        to_scan = [album.id for album in albums if self.rescan_known or album.id in result.new_albums]
+        listings = self.query_api.get_albums_by_ids(to_scan, self.max_workers)
+        result.errors.update(listings.errors)
+
+        # Photos and variants missing locally, grouped per download directory
+        pending: Dict[str, Dict[str, tuple]] = {}
+        for album_id, response in listings.results.items():
+            if response is None:
+                continue
+            photos = self.albums[album_id]["photos"]
+            current = set()
+            for photo in response.photos:
+                current.add(photo.id)
+                saved = photos.get(photo.id, {})
+                for variant in self.variants:
+                    path = getattr(photo, _VARIANT_FIELDS[variant])
+                    if path and not (variant in saved and self._exists(saved[variant])):
+                        directory = os.path.join(self._album_dir(album_id), variant)
+                        pending.setdefault(directory, {})[path] = (album_id, photo.id, variant)
+            if prune:
+                for photo_id in [photo_id for photo_id in photos if photo_id not in current]:
+                    for path in photos.pop(photo_id).values():
+                        self._remove(path)
+                    result.removed_photos += 1
+
+        try:
+            for directory, files in pending.items():
+                filenames = {path: _photo_filename(photo_id, path) for path, (_, photo_id, _) in files.items()}
+                batch = self.query_api.download_files(list(files), directory, max_workers=self.max_workers,
+                                                      filenames=filenames)
+                for path, local_path in batch.results.items():
+                    album_id, photo_id, variant = files[path]
+                    self.albums[album_id]["photos"].setdefault(photo_id, {})[variant] = \
+                        os.path.relpath(local_path, self.target_dir)
+                    result.downloaded.append(local_path)
+                result.errors.update(batch.errors)
+        finally:
+            self._save_manifest()
+
+        self.logger.info(
+            f"Album mirror: {len(result.downloaded)} files downloaded, {len(result.new_albums)} new albums, "
+            f"{len(result.errors)} errors"
+        )
+        return result
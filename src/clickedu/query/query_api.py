@@ -2,45 +2,82 @@
 Query API for ClickEdu.
 """
 
+import io
+import time
 import requests
-from typing import Dict, Any, Optional, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Iterator, Iterable, Callable, Union
 from ..models import (
     User, InitQueryResponse, NewsResponse, NewsItem,
-    PhotoAlbumsResponse, PhotoAlbum, GetAlbumByIdResponse, Photo
+    PhotoAlbumsResponse, PhotoAlbum, GetAlbumByIdResponse, Photo, BatchResult,
+    PhotoTable, AlbumTable
 )
-from ..exceptions import APIError
+from ..models.decoders import get_decoder
+from ..models.lazy import BodySpool, LazyNewsItem, check_lazy_bodies, lazy_news_items
+from ..exceptions import APIError, ClickEduError
 from ..utils.logger import setup_logger
 from ..utils.file_handler import FileHandler
+from ..utils.download_manager import DownloadManager, DownloadProgress
+from ..utils.transport import Transport
+from ..utils.json_backend import decode_json
+from ..utils.conditional import ValidatorStore, content_hash
+from ..utils.singleflight import SingleFlight
+from ..utils.deadline import Deadline, deadline_scope
+from ..utils.json_stream import iter_json_array
+from .cache import QueryCache
+from .mirror import AlbumMirror, MirrorResult
+
+# Query parameters that are credentials and must never be part of a cache key
+_SECRET_PARAMS = frozenset({"auth_token", "auth_secret", "cons_key", "cons_secret"})
+
+# Size of the byte chunks read from streamed responses
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Compiled JSON-to-model decoders, with image paths rewritten to full URLs while decoding
+_NEWS_DECODER = get_decoder(NewsItem)
+_ALBUM_DECODER = get_decoder(PhotoAlbum, ("coverImageLarge", "coverImageSmall"))
+_PHOTO_DECODER = get_decoder(Photo, ("pathLarge", "pathSmall"))
 
 
 class QueryApi:
     """QueryApi class for handling ClickEdu query operations."""
     
-    def __init__(self, user: User, config):
+    def __init__(self, user: User, config, transport: Optional[Transport] = None,
+                 cache: Optional[QueryCache] = None, validators: Optional[ValidatorStore] = None):
         """
         Initialize QueryApi.
         
         Args:
             user: Authenticated user object
             config: Configuration object
+            transport: Shared HTTP transport (a private one is created if not provided)
+            cache: Optional response cache for query results
+            validators: Optional ETag/Last-Modified store enabling conditional requests
         """
         self.user = user
         self.config = config
         self.cons_key = config.cons_key
         self.cons_secret = config.cons_secret
-        self.session = requests.Session()
+        self.transport = transport or Transport(config)
+        self.session = self.transport.session
+        self.timeout = config.timeout_for("query")
+        self.cache = cache
+        self.validators = validators
+        self.single_flight = SingleFlight()
         self.logger = setup_logger("clickedu.query")
         
-        # Set default headers
-        self.session.headers.update({
-            'User-Agent': self.config.get_user_agent()
-        })
-        
         # Initialize file handler
-        self.file_handler = FileHandler(self.session, f"https://{self.user.base_url}")
+        self.file_handler = FileHandler(
+            self.session, f"https://{self.user.base_url}", validators, self.single_flight,
+            timeout=config.timeout_for("download"),
+            min_speed=config.download_min_speed,
+            stall_window=config.download_stall_window,
+            blob_store=self.transport.blob_store,
+        )
     
-    def _get_url_and_default_params(self) -> tuple[str, Dict[str, str]]:
-        """Get URL and default parameters for queries."""
+    def _get_url_and_default_params(self, child_id: Optional[str] = None) -> tuple[str, Dict[str, str]]:
+        """Get URL and default parameters for queries, for the user's child unless ``child_id`` is given."""
         url = f"https://{self.user.base_url}/ws/app_clickedu_query.php"
         
         default_params = {
@@ -48,24 +85,49 @@ class QueryApi:
             "auth_secret": self.user.secret_token,
             "cons_key": self.cons_key,
             "cons_secret": self.cons_secret,
-            "id_fill": self.user.child_id,
+            "id_fill": child_id or self.user.child_id,
         }
         
         return url, default_params
     
-    def _default_query(self, query: str, params: Dict[str, str | int] = None) -> Optional[Dict[str, Any]]:
-        """Execute a default query with common parameters."""
+    def _cache_key(self, query: str, query_params: Dict[str, Any]) -> tuple:
+        """Build a cache key from the query path, non-secret params, user and child."""
+        public_params = tuple(sorted(
+            (key, str(value)) for key, value in query_params.items()
+            if key not in _SECRET_PARAMS and key not in ("query", "id_fill")
+        ))
+        return (query, public_params, self.user.id, str(query_params.get("id_fill")))
+    
+    def _default_query(self, query: str, params: Dict[str, str | int] = None,
+                       use_cache: bool = True, child_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Execute a default query with common parameters.
+        
+        Identical concurrent queries share one in-flight request. When a cache
+        is configured, results are served from it while fresh. Cached and
+        coalesced results are shared and must be treated as read-only.
+        """
         try:
-            url, default_params = self._get_url_and_default_params()
+            url, default_params = self._get_url_and_default_params(child_id)
             
             # Merge default params with provided params
             query_params = {**default_params, **(params or {}), "query": query}
             
-            self.logger.info(f"Executing query: {query}")
-            response = self.session.get(url, params=query_params)
-            response.raise_for_status()
+            cache_key = None
+            if self.cache is not None and use_cache:
+                cache_key = self._cache_key(query, query_params)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    self.logger.debug(f"Query {query} served from cache")
+                    return cached
             
-            result = response.json()
+            self.logger.info(f"Executing query: {query}")
+            key = cache_key or self._cache_key(query, query_params)
+            result = self.single_flight.do(
+                ("query", key), lambda: self._fetch_json(url, query_params, key)
+            )
+            if cache_key is not None and result:
+                self.cache.set(cache_key, query, result)
             self.logger.info(f"Query {query} successful!")
             return result
             
@@ -74,7 +136,59 @@ class QueryApi:
             if hasattr(e, 'response') and e.response is not None:
                 self.logger.error(f"Response status: {e.response.status_code}")
                 self.logger.error(f"Response content: {e.response.text}")
-            raise APIError(f"Failed to execute query {query}: {e}", e.response.status_code if hasattr(e, 'response') and e.response else None) from e
+            raise APIError(f"Failed to execute query {query}: {e}", e.response.status_code if getattr(e, 'response', None) is not None else None) from e
+    
+    def _fetch_json(self, url: str, query_params: Dict[str, Any], key: tuple) -> Any:
+        """
+        GET a query and decode its JSON body.
+        
+        With a validator store, conditional headers are sent and a 304 reuses the
+        previously parsed result; if the server sends no validators, an unchanged
+        content hash also reuses it and skips decoding.
+        """
+        if self.validators is None:
+            response = self.session.get(url, params=query_params, timeout=self.timeout)
+            response.raise_for_status()
+            return decode_json(response, self.config.json_loads)
+        
+        entry = self.validators.get(key)
+        response = self.session.get(url, params=query_params, headers=self.validators.conditional_headers(entry),
+                                    timeout=self.timeout)
+        if response.status_code == 304 and entry is not None:
+            self.validators.record_not_modified(entry)
+            return entry.payload
+        response.raise_for_status()
+        
+        body = response.content
+        digest = None
+        if not (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+            digest = content_hash(body)
+            if entry is not None and entry.content_hash == digest:
+                self.validators.record_hash_match()
+                return entry.payload
+        
+        result = decode_json(response, self.config.json_loads)
+        self.validators.store(key, response.headers, len(body), result, digest)
+        return result
+    
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of queries and downloads served by another caller's in-flight request."""
+        return self.single_flight.coalesced
+    
+    def invalidate_cache(self, query: Optional[str] = None) -> int:
+        """
+        Drop cached query results.
+        
+        Args:
+            query: Only drop results for this query path, e.g. "/news" (all if None)
+            
+        Returns:
+            Number of cache entries dropped
+        """
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(query)
     
     def init(self) -> Optional[InitQueryResponse]:
         """Execute /init query."""
@@ -83,90 +197,482 @@ class QueryApi:
             return InitQueryResponse()
         return None
     
-    def get_news(self, start_limit: int = 0, end_limit: int = 10) -> Optional[NewsResponse]:
-        """Get news from ClickEdu."""
+    def validate_session(self) -> bool:
+        """
+        Cheaply check that the user's tokens are still accepted.
+        
+        Returns:
+            True if the /init query succeeds with the current tokens, False if
+            the server rejects them (401/403 or an error payload)
+        
+        Raises:
+            APIError: If the check fails for another reason (timeouts, 5xx, ...),
+                so that a transient outage is not mistaken for a rejected session
+        """
+        try:
+            result = self._default_query("/init", use_cache=False)
+        except APIError as e:
+            if e.status_code in (401, 403):
+                return False
+            raise
+        return isinstance(result, dict) and bool(result) and "error" not in result
+    
+    def get_news(self, start_limit: int = 0, end_limit: int = 10, lazy_bodies: Optional[str] = None,
+                 body_spool: Optional[BodySpool] = None,
+                 deadline: Optional[Union[float, Deadline]] = None,
+                 child_id: Optional[str] = None, use_cache: bool = True) -> Optional[NewsResponse]:
+        """
+        Get news from ClickEdu.
+        
+        Args:
+            start_limit: Starting index for news items
+            end_limit: Ending index for news items
+            lazy_bodies: None to decode bodies eagerly, "memory" to keep them
+                compressed or "disk" to spool them to a temporary file; the
+                news are then LazyNewsItem objects loading bodies on access
+            body_spool: Spool used in "disk" mode (a new one is created if None)
+            deadline: Time budget in seconds (or a Deadline) for the request and its retries
+            child_id: Child to query (defaults to the authenticated user's child)
+            use_cache: Serve the page from the query cache while fresh; False always
+                asks the server
+        """
         params = {
             "startLimit": start_limit,
             "endLimit": end_limit,
             "lan": "ca"  # Using Catalan as requested
         }
         
-        result = self._default_query("/news", params)
+        with deadline_scope(deadline):
+            result = self._default_query("/news", params, use_cache=use_cache, child_id=child_id)
         if result:
-            # Parse news items from result
-            news_data = result.get("news", [])
-            news_items = []
-            for news_item_data in news_data:
-                news_item = NewsItem(
-                    title=news_item_data.get("title", ""),
-                    subtitle=news_item_data.get("subtitle"),
-                    body=news_item_data.get("body"),
-                    imagePath=news_item_data.get("imagePath"),
-                    imageText=news_item_data.get("imageText"),
-                    filePath=news_item_data.get("filePath")
-                )
-                news_items.append(news_item)
-            
-            return NewsResponse(
-                total=result.get("total", 0),
-                news=news_items
-            )
+            items = result.get("news", [])
+            if lazy_bodies:
+                news = lazy_news_items(items, lazy_bodies, body_spool)
+            else:
+                news = _NEWS_DECODER.many(items)
+            return NewsResponse(total=result.get("total", 0), news=news)
         return None
     
-    def get_photo_albums(self, start_limit: int = 0, end_limit: int = 10) -> Optional[PhotoAlbumsResponse]:
-        """Get photo albums from ClickEdu."""
+    def iter_news(self, page_size: int = 10, prefetch: int = 1, start_limit: int = 0,
+                  lazy_bodies: Optional[str] = None) -> Iterator[NewsItem]:
+        """
+        Iterate lazily over all news items, page by page.
+        
+        While the caller processes the current page, up to ``prefetch`` following
+        pages are fetched in the background, so memory stays bounded by
+        ``prefetch + 1`` pages regardless of the size of the archive.
+        
+        Args:
+            page_size: Number of news items requested per page
+            prefetch: Number of pages fetched ahead of the consumer (0 disables prefetching)
+            start_limit: Index of the first news item
+            lazy_bodies: "memory" or "disk" to yield LazyNewsItem objects (see get_news);
+                in "disk" mode all pages share one spool
+            
+        Yields:
+            NewsItem objects in server order
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        
+        def get_page(start: int) -> Optional[NewsResponse]:
+            return self.get_news(start, start + page_size, lazy_bodies, spool)
+        
+        if lazy_bodies:
+            check_lazy_bodies(lazy_bodies)
+        spool = BodySpool() if lazy_bodies == "disk" else None
+        first_page = get_page(start_limit)
+        if not first_page:
+            return
+        
+        starts = iter(range(start_limit + page_size, first_page.total, page_size))
+        
+        if prefetch < 1:
+            yield from first_page.news
+            for start in starts:
+                page = get_page(start)
+                if not page or not page.news:
+                    return
+                yield from page.news
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="clickedu-news")
+        pending = deque()
+        
+        def schedule():
+            while len(pending) < prefetch:
+                start = next(starts, None)
+                if start is None:
+                    return
+                pending.append(executor.submit(get_page, start))
+        
+        try:
+            schedule()
+            yield from first_page.news
+            while pending:
+                page = pending.popleft().result()
+                schedule()
+                if not page or not page.news:
+                    return
+                yield from page.news
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def fetch_all_news(self, concurrency: int = 4, page_size: int = 50, retries: int = 2,
+                       retry_delay: float = 0.5) -> Optional[NewsResponse]:
+        """
+        Fetch the whole news archive, downloading pages concurrently.
+        
+        The first page is fetched to learn ``total``; the remaining
+        ``startLimit``/``endLimit`` windows are then fetched in parallel over the
+        shared session and reassembled in order. Failed or short windows are
+        retried individually, bypassing the query cache.
+        
+        Args:
+            concurrency: Maximum number of windows fetched at the same time
+            page_size: Number of news items per window
+            retries: Extra attempts for each failed or short window
+            retry_delay: Initial delay between attempts, doubled after each one
+            
+        Returns:
+            NewsResponse with every news item, or None if the first page failed
+            
+        Raises:
+            APIError: If a window still fails after all retries
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        
+        first_page = self.get_news(0, page_size)
+        if not first_page:
+            return None
+        
+        total = first_page.total
+        windows = [(start, min(start + page_size, total)) for start in range(page_size, total, page_size)]
+        
+        def fetch_window(window: tuple[int, int]) -> List[NewsItem]:
+            start, end = window
+            items: List[NewsItem] = []
+            delay = retry_delay
+            for attempt in range(retries + 1):
+                if attempt:
+                    time.sleep(delay)
+                    delay *= 2
+                try:
+                    page = self.get_news(start, end, use_cache=not attempt)
+                except APIError:
+                    if attempt == retries:
+                        raise
+                    self.logger.warning(f"News window {start}-{end} failed, retrying...")
+                    continue
+                items = page.news if page else []
+                if len(items) >= end - start:
+                    return items
+                self.logger.warning(f"News window {start}-{end} returned {len(items)} items, retrying...")
+            return items
+        
+        news = list(first_page.news)
+        if windows:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="clickedu-news") as executor:
+                for items in executor.map(fetch_window, windows):
+                    news.extend(items)
+        
+        return NewsResponse(total=total, news=news)
+    
+    def get_photo_albums(self, start_limit: int = 0, end_limit: int = 10,
+                         child_id: Optional[str] = None) -> Optional[PhotoAlbumsResponse]:
+        """Get photo albums from ClickEdu, for the user's child unless ``child_id`` is given."""
         params = {
             "startLimit": start_limit,
             "endLimit": end_limit,
             "lan": "ca"  # Using Catalan as requested
         }
         
-        result = self._default_query("/photo_albums", params)
+        result = self._default_query("/photo_albums", params, child_id=child_id)
         if result:
-            # Parse albums from result
-            albums_data = result.get("albums", [])
-            albums = []
-            for album_data in albums_data:
-                album = PhotoAlbum(
-                    id=album_data.get("id", ""),
-                    name=album_data.get("name", ""),
-                    coverImageLarge=album_data.get("coverImageLarge"),
-                    coverImageSmall=album_data.get("coverImageSmall")
-                )
-                albums.append(album)
-            
-            # Fix image URLs
-            albums = self._fix_images_urls(albums, ["coverImageLarge", "coverImageSmall"])
-            
+            # Parse albums and fix image URLs in one pass
+            albums = _ALBUM_DECODER.many(result.get("albums", []), self._get_photo_base_url())
             return PhotoAlbumsResponse(albums=albums)
         return None
     
-    def get_album_by_id(self, album_id: str) -> Optional[GetAlbumByIdResponse]:
-        """Get photos from a specific album."""
+    def get_album_by_id(self, album_id: str, child_id: Optional[str] = None) -> Optional[GetAlbumByIdResponse]:
+        """Get photos from a specific album, for the user's child unless ``child_id`` is given."""
         params = {
             "albumId": album_id,
             "lan": "ca"  # Using Catalan as requested
         }
         
-        result = self._default_query("/pictures", params)
+        result = self._default_query("/pictures", params, child_id=child_id)
         if result:
-            # Parse photos from result
-            photos_data = result.get("photos", [])
-            photos = []
-            for photo_data in photos_data:
-                photo = Photo(
-                    id=photo_data.get("id", ""),
-                    pathLarge=photo_data.get("pathLarge"),
-                    pathSmall=photo_data.get("pathSmall")
-                )
-                photos.append(photo)
-            
-            # Fix image URLs
-            photos = self._fix_images_urls(photos, ["pathLarge", "pathSmall"])
-            
+            # Parse photos and fix image URLs in one pass
+            photos = _PHOTO_DECODER.many(result.get("photos", []), self._get_photo_base_url())
             return GetAlbumByIdResponse(photos=photos)
         return None
     
+    def get_photo_album_table(self, start_limit: int = 0, end_limit: int = 10) -> Optional[AlbumTable]:
+        """Get photo albums as a compact columnar AlbumTable."""
+        params = {
+            "startLimit": start_limit,
+            "endLimit": end_limit,
+            "lan": "ca"  # Using Catalan as requested
+        }
+        
+        result = self._default_query("/photo_albums", params)
+        if result:
+            return AlbumTable.from_json(result.get("albums", []), self._get_photo_base_url())
+        return None
+    
+    def get_album_photo_table(self, album_id: str) -> Optional[PhotoTable]:
+        """
+        Get photos from a specific album as a compact columnar PhotoTable.
+        
+        The table shares the photo base URL between all photos and builds
+        full URLs only on access, which keeps very large albums small in memory.
+        """
+        params = {
+            "albumId": album_id,
+            "lan": "ca"  # Using Catalan as requested
+        }
+        
+        result = self._default_query("/pictures", params)
+        if result:
+            return PhotoTable.from_json(result.get("photos", []), self._get_photo_base_url())
+        return None
+    
+    def _stream_query(self, query: str, params: Dict[str, str | int], key: str) -> Iterator[Any]:
+        """
+        Execute a query with a streamed response and yield the items of one array.
+        
+        The body is parsed incrementally while it is downloaded, so memory is
+        bounded by one item instead of the whole response. Streamed queries
+        bypass the cache, conditional requests and request coalescing.
+        
+        Args:
+            query: Query path, e.g. "/pictures"
+            params: Query specific parameters
+            key: Top-level key of the array to stream
+            
+        Yields:
+            Decoded JSON array items
+            
+        Raises:
+            APIError: If the request fails or the body is not valid JSON
+        """
+        url, default_params = self._get_url_and_default_params()
+        query_params = {**default_params, **params, "query": query}
+        
+        self.logger.info(f"Streaming query: {query}")
+        try:
+            response = self.session.get(url, params=query_params, stream=True, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error executing query {query}: {e}")
+            raise APIError(f"Failed to execute query {query}: {e}") from e
+        
+        try:
+            if not response.ok:
+                self.logger.error(f"Response status: {response.status_code}")
+                raise APIError(f"Failed to execute query {query}: HTTP {response.status_code}",
+                               response.status_code)
+            yield from iter_json_array(response.iter_content(chunk_size=_STREAM_CHUNK_SIZE), key)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self.logger.error(f"Error streaming query {query}: {e}")
+            raise APIError(f"Failed to execute query {query}: {e}", response.status_code) from e
+        finally:
+            response.close()
+    
+    def iter_album_photos(self, album_id: str) -> Iterator[Photo]:
+        """
+        Iterate over the photos of an album while the response is downloaded.
+        
+        Unlike get_album_by_id, the /pictures response is never held in memory
+        as a whole, which keeps peak memory flat for albums with thousands of
+        photos. Closing the iterator early closes the connection.
+        
+        Args:
+            album_id: ID of the album
+            
+        Yields:
+            Photo objects with full image URLs
+        """
+        params = {
+            "albumId": album_id,
+            "lan": "ca"  # Using Catalan as requested
+        }
+        base_url = self._get_photo_base_url()
+        for photo_data in self._stream_query("/pictures", params, "photos"):
+            yield _PHOTO_DECODER(photo_data, base_url)
+    
+    def stream_news(self, start_limit: int = 0, end_limit: int = 10,
+                    lazy_bodies: Optional[str] = None) -> Iterator[NewsItem]:
+        """
+        Iterate over one window of news while the response is downloaded.
+        
+        Args:
+            start_limit: Starting index for news items
+            end_limit: Ending index for news items
+            lazy_bodies: "memory" or "disk" to yield LazyNewsItem objects (see get_news)
+            
+        Yields:
+            NewsItem objects in server order
+        """
+        params = {
+            "startLimit": start_limit,
+            "endLimit": end_limit,
+            "lan": "ca"  # Using Catalan as requested
+        }
+        items = self._stream_query("/news", params, "news")
+        if lazy_bodies:
+            check_lazy_bodies(lazy_bodies)
+            spool = BodySpool() if lazy_bodies == "disk" else None
+            for item_data in items:
+                yield LazyNewsItem.from_json(item_data, spool)
+        else:
+            for item_data in items:
+                yield _NEWS_DECODER(item_data)
+    
+    def _batch_workers(self, max_workers: Optional[int], count: int) -> int:
+        """Number of workers for a batch, capped by the per-domain limit in the config."""
+        limit = self.config.max_workers
+        if max_workers is not None:
+            limit = min(limit, max_workers)
+        return max(1, min(limit, count))
+    
+    def albums_by_ids_as_completed(
+        self,
+        album_ids: Iterable[str],
+        max_workers: Optional[int] = None,
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ) -> Iterator[tuple[str, GetAlbumByIdResponse]]:
+        """
+        Fetch several albums concurrently, yielding them as they complete.
+        
+        Args:
+            album_ids: IDs of the albums to fetch
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+            on_error: Called with (album_id, exception) for albums that failed;
+                failures are logged and skipped if not provided
+            
+        Yields:
+            (album_id, GetAlbumByIdResponse) tuples in completion order
+        """
+        album_ids = list(album_ids)
+        if not album_ids:
+            return
+        
+        with ThreadPoolExecutor(max_workers=self._batch_workers(max_workers, len(album_ids)),
+                                thread_name_prefix="clickedu-albums") as executor:
+            futures = {executor.submit(self.get_album_by_id, album_id): album_id for album_id in album_ids}
+            for future in as_completed(futures):
+                album_id = futures[future]
+                try:
+                    result = future.result()
+                except ClickEduError as e:
+                    if on_error is None:
+                        self.logger.error(f"Error fetching album {album_id}: {e}")
+                    else:
+                        on_error(album_id, e)
+                    continue
+                yield album_id, result
+    
+    def get_albums_by_ids(self, album_ids: Iterable[str], max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Fetch several albums concurrently.
+        
+        Args:
+            album_ids: IDs of the albums to fetch
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+            
+        Returns:
+            BatchResult mapping album IDs, in input order, to GetAlbumByIdResponse
+            objects, with failed albums reported in ``errors``
+        """
+        album_ids = list(dict.fromkeys(album_ids))
+        completed: Dict[str, GetAlbumByIdResponse] = {}
+        batch = BatchResult()
+        
+        def record_error(album_id: str, error: Exception) -> None:
+            batch.errors[album_id] = error
+        
+        for album_id, result in self.albums_by_ids_as_completed(album_ids, max_workers, record_error):
+            completed[album_id] = result
+        
+        batch.results = {album_id: completed[album_id] for album_id in album_ids if album_id in completed}
+        return batch
+    
+    def _fan_out(self, keys: Iterable[Any], func: Callable[[Any], Any], max_workers: Optional[int],
+                 name: str) -> BatchResult:
+        """Run ``func`` for every key concurrently and collect results and failures in input order."""
+        keys = list(dict.fromkeys(keys))
+        batch = BatchResult()
+        if not keys:
+            return batch
+        
+        completed: Dict[Any, Any] = {}
+        with ThreadPoolExecutor(max_workers=self._batch_workers(max_workers, len(keys)),
+                                thread_name_prefix=f"clickedu-{name}") as executor:
+            futures = {executor.submit(func, key): key for key in keys}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    completed[key] = future.result()
+                except ClickEduError as e:
+                    self.logger.error(f"Error fetching {name} for {key}: {e}")
+                    batch.errors[key] = e
+        
+        batch.results = {key: completed[key] for key in keys if key in completed}
+        return batch
+    
+    def get_news_for_children(self, child_ids: Iterable[str], start_limit: int = 0, end_limit: int = 10,
+                              max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Get news for several children of the account concurrently.
+        
+        Args:
+            child_ids: Children to query (``id_fill`` values)
+            start_limit: Starting index for news items
+            end_limit: Ending index for news items
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+            
+        Returns:
+            BatchResult mapping child IDs to NewsResponse objects; see merge_news
+            to combine them without duplicates
+        """
+        return self._fan_out(
+            child_ids, lambda child_id: self.get_news(start_limit, end_limit, child_id=child_id),
+            max_workers, "news",
+        )
+    
+    def get_photo_albums_for_children(self, child_ids: Iterable[str], start_limit: int = 0,
+                                      end_limit: int = 10, max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Get photo albums for several children of the account concurrently.
+        
+        Returns:
+            BatchResult mapping child IDs to PhotoAlbumsResponse objects; see
+            merge_albums to combine them without duplicates
+        """
+        return self._fan_out(
+            child_ids, lambda child_id: self.get_photo_albums(start_limit, end_limit, child_id=child_id),
+            max_workers, "albums",
+        )
+    
+    def get_albums_for_children(self, albums: Iterable[tuple[str, str]],
+                                max_workers: Optional[int] = None) -> BatchResult:
+        """
+        Get the photos of albums belonging to different children concurrently.
+        
+        Args:
+            albums: (child_id, album_id) pairs
+            max_workers: Maximum concurrent requests (capped by ``config.max_workers``)
+            
+        Returns:
+            BatchResult mapping (child_id, album_id) pairs to GetAlbumByIdResponse objects
+        """
+        return self._fan_out(
+            albums, lambda pair: self.get_album_by_id(pair[1], child_id=pair[0]),
+            max_workers, "pictures",
+        )
+    
     def _fix_images_urls(self, items: List, image_fields: List[str]) -> List:
         """Fix image URLs by adding the base URL."""
         base_url = self._get_photo_base_url()
@@ -218,3 +724,80 @@ class QueryApi:
         except Exception as e:
             self.logger.error(f"Error downloading file {file_path}: {e}")
             return None
+    
+    def iter_file(self, file_path: str, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Download a file as an iterator of byte chunks, without writing it to disk.
+        
+        Args:
+            file_path: The file path from the news item (e.g., "../private/...")
+            chunk_size: Size of the chunks
+            
+        Returns:
+            Iterator over the body chunks
+            
+        Raises:
+            FileDownloadError: If the download fails
+        """
+        return self.file_handler.iter_file(file_path, chunk_size)
+    
+    def open_file(self, file_path: str, buffer_size: Optional[int] = None) -> io.BufferedReader:
+        """
+        Open a file for reading straight from the server, without writing it to disk.
+        
+        Args:
+            file_path: The file path from the news item (e.g., "../private/...")
+            buffer_size: Size of the read buffer
+            
+        Returns:
+            Binary file-like object supporting ``read`` and ``readinto``
+            
+        Raises:
+            FileDownloadError: If the download fails
+        """
+        return self.file_handler.open_file(file_path, buffer_size)
+    
+    def download_files(self, items: Iterable[Any], download_dir: str = "files", variant: str = "large",
+                       max_workers: Optional[int] = None,
+                       progress: Optional[Callable[[DownloadProgress], None]] = None,
+                       filenames: Optional[Dict[str, str]] = None) -> BatchResult:
+        """
+        Download many files concurrently over the shared session.
+        
+        Args:
+            items: File paths (e.g., "../private/...") or Photo objects
+            download_dir: Directory to save the files (default: "files")
+            variant: Photo size to download, "large" or "small"
+            max_workers: Maximum concurrent downloads (capped by ``config.max_workers``)
+            progress: Called with a DownloadProgress after each chunk of every file
+            filenames: Names to save files under, by file path (defaults to the URL's base name)
+            
+        Returns:
+            BatchResult mapping file paths, in input order, to local paths, with
+            failed downloads reported in ``errors``
+        """
+        manager = DownloadManager(
+            self.file_handler,
+            max_workers=max(1, self.config.max_workers),
+            per_host=self.config.download_per_host,
+            max_inflight_bytes=self.config.download_max_inflight_bytes,
+            progress=progress,
+        )
+        return manager.download(items, download_dir, variant, max_workers, filenames)
+    
+    def mirror_albums(self, target_dir: str, prune: bool = False, variants: Iterable[str] = ("large",),
+                      rescan_known: bool = True) -> MirrorResult:
+        """
+        Mirror every photo album into a local directory, downloading only new photos.
+        
+        Args:
+            target_dir: Directory of the mirror; its manifest is kept there
+            prune: Delete local albums and photos that are no longer on the server
+            variants: Photo sizes to download, "large" and/or "small"
+            rescan_known: Re-read the photo lists of albums already mirrored
+            
+        Returns:
+            MirrorResult describing what was downloaded, removed or failed
+        """
+        mirror = AlbumMirror(self, target_dir, tuple(variants), rescan_known=rescan_known)
+        return mirror.sync(prune)
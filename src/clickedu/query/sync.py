@@ -0,0 +1,136 @@
+"""
+Incremental news synchronisation for ClickEdu.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional
+from ..models import NewsItem
+from ..utils.logger import setup_logger
+
+
+def news_fingerprint(item: NewsItem) -> str:
+    """
+    Build a stable fingerprint for a news item.
+
+    News items have no id, so the fingerprint is derived from the title,
+    subtitle and attached file path.
+    """
+    data = "\x1f".join([item.title or "", item.subtitle or "", item.filePath or ""])
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+class NewsSyncer:
+    """
+    Fetch only the news published since the previous sync.
+
+    News is read newest-first, page by page, and reading stops at the first
+    item that was already seen, so polling cost scales with the number of
+    new items rather than with the size of the archive. The fingerprints of
+    the most recent items are kept as a high-water mark, optionally
+    persisted to a JSON file.
+    """
+
+    def __init__(self, query_api, state_path: Optional[str] = None, page_size: int = 10,
+                 max_known: int = 200, max_pages: Optional[int] = None):
+        """
+        Initialize news syncer.
+
+        Args:
+            query_api: QueryApi used to fetch news
+            state_path: JSON file where the high-water mark is persisted (in memory only if None)
+            page_size: Number of news items requested per page
+            max_known: Number of recent fingerprints remembered, so deleting the newest
+                item does not force a full re-read
+            max_pages: Optional limit on pages read per sync, e.g. for the first sync
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        self.query_api = query_api
+        self.state_path = state_path
+        self.page_size = page_size
+        self.max_known = max_known
+        self.max_pages = max_pages
+        self.logger = setup_logger("clickedu.sync")
+        self.known: List[str] = self._load_state()
+
+    def _load_state(self) -> List[str]:
+        """Load remembered fingerprints, newest first."""
+        if not self.state_path or not os.path.exists(self.state_path):
+            return []
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return list(json.load(f).get("fingerprints", []))
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable sync state {self.state_path}: {e}")
+            return []
+
+    def _save_state(self) -> None:
+        """Atomically persist remembered fingerprints."""
+        if not self.state_path:
+            return
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fingerprints": self.known}, f)
+            os.replace(tmp_path, self.state_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def sync(self) -> List[NewsItem]:
+        """
+        Fetch news published since the last sync.
+
+        Returns:
+            New news items, newest first
+
+        Raises:
+            APIError: If a news query fails (the high-water mark is left unchanged)
+        """
+        known = set(self.known)
+        new_items: List[NewsItem] = []
+        seen_in_run = set()
+        start = 0
+        pages = 0
+
+        while self.max_pages is None or pages < self.max_pages:
+            # A cached page could hide items published within the /news TTL
+            page = self.query_api.get_news(start, start + self.page_size, use_cache=False)
+            pages += 1
+            if not page or not page.news:
+                break
+
+            reached_known = False
+            for item in page.news:
+                fingerprint = news_fingerprint(item)
+                if fingerprint in known:
+                    reached_known = True
+                    break
+                # Items can shift between pages when news is published mid-sync
+                if fingerprint not in seen_in_run:
+                    seen_in_run.add(fingerprint)
+                    new_items.append(item)
+
+            start += self.page_size
+            if reached_known or start >= page.total:
+                break
+
+        if new_items:
+            fingerprints = [news_fingerprint(item) for item in new_items]
+            self.known = (fingerprints + self.known)[:self.max_known]
+            self._save_state()
+
+        self.logger.info(f"News sync found {len(new_items)} new items in {pages} pages")
+        return new_items
+
+    def reset(self) -> None:
+        """Forget the high-water mark so the next sync reads everything again."""
+        self.known = []
+        self._save_state()
@@ -3,6 +3,44 @@ Utility functions for ClickEdu API client.
 """
 
 from .logger import setup_logger
-from .file_handler import FileHandler
+from .file_handler import FileHandler, ResponseStream
+from .transport import Transport, TransportStats
+from .conditional import ValidatorStore, ConditionalStats
+from .singleflight import SingleFlight
+from .json_backend import get_json_loads, decode_json
+from .json_stream import iter_json_array
+from .rate_limit import RateLimiter, TokenBucket, AIMDController, HostLimitStats
+from .retry import RetryPolicy, CircuitBreaker, CircuitBreakers, BreakerStats
+from .deadline import Deadline, current_deadline, deadline_scope
+from .blob_store import BlobStore, BlobStoreStats
+from .download_manager import DownloadManager, DownloadProgress, ByteBudget
 
-__all__ = ["setup_logger", "FileHandler"]
+__all__ = [
+    "setup_logger",
+    "FileHandler",
+    "ResponseStream",
+    "Transport",
+    "TransportStats",
+    "ValidatorStore",
+    "ConditionalStats",
+    "SingleFlight",
+    "get_json_loads",
+    "decode_json",
+    "iter_json_array",
+    "RateLimiter",
+    "TokenBucket",
+    "AIMDController",
+    "HostLimitStats",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "BreakerStats",
+    "Deadline",
+    "current_deadline",
+    "deadline_scope",
+    "DownloadManager",
+    "DownloadProgress",
+    "ByteBudget",
+    "BlobStore",
+    "BlobStoreStats",
+]
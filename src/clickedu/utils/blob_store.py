@@ -0,0 +1,318 @@
+"""
+Content-addressed file store for ClickEdu API client.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+def index_key(url: str) -> str:
+    """
+    Credential-free key of a download URL in the blob index.
+
+    Photo URLs embed ``app-<cons_key>-<cons_secret>-<auth_token>-<secret_token>``
+    after ``/private/``; that segment changes with every login and must not be
+    written to disk, so the key is the host plus the path below it.
+    """
+    parsed = urlparse(url)
+    path = parsed.path
+    if "/private/" in path:
+        path = path.split("/private/", 1)[1]
+        first, _, rest = path.partition("/")
+        if first.startswith("app-") and rest:
+            path = rest
+    return f"{parsed.netloc}/{path.lstrip('/')}"
+
+
+@dataclass
+class BlobStoreStats:
+    """Snapshot of blob store counters."""
+    blobs: int = 0
+    bytes_stored: int = 0
+    duplicates: int = 0
+    skipped_downloads: int = 0
+    bytes_saved: int = 0
+
+
+class BlobStore:
+    """
+    Deduplicating store of downloaded files keyed by their SHA-256 digest.
+
+    Each distinct content is kept once under ``objects/<2 hex>/<digest>``
+    and hardlinked (copied where hardlinks are unavailable) to the paths it
+    was requested under. An index maps every downloaded URL to its digest,
+    so a URL seen before is linked from the store without being downloaded
+    again. URLs are indexed without their session credentials (see
+    ``index_key``), so entries survive a re-login. Linked files share their
+    data with the store and should be treated as read-only.
+
+    The index is an ``index.json`` snapshot plus an ``index.journal`` of
+    JSON lines appended by every change, so recording a download costs one
+    small write. Several stores, in this or other processes, can share a
+    directory: changes are appended under a file lock, each store reads the
+    lines written by the others before appending and on a lookup miss, and
+    the journal is merged into the snapshot on ``close`` or once it grows
+    past ``compact_every`` entries. Within a process, use ``shared`` to get
+    one store per directory.
+    """
+
+    _shared: Dict[str, "BlobStore"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, root: str, compact_every: int = 1000):
+        """
+        Initialize blob store.
+
+        Args:
+            root: Directory holding the objects and the index
+            compact_every: Journal entries appended by this store after which
+                the journal is merged into the snapshot
+        """
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        self.journal_path = os.path.join(root, "index.journal")
+        self.compact_every = compact_every
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats = BlobStoreStats()
+        self._index: Dict[str, Dict] = {}
+        self._snapshot_id = None
+        self._journal_offset = 0
+        self._appended = 0
+        with self._lock, self._locked():
+            migrated = self._reload()
+            if migrated or self._journal_offset:
+                self._compact()
+
+    @classmethod
+    def shared(cls, root: str) -> "BlobStore":
+        """Get the store for a directory, creating it on first use; later calls return the same store."""
+        root = os.path.realpath(os.path.expanduser(root))
+        with cls._shared_lock:
+            store = cls._shared.get(root)
+            if store is None:
+                store = cls._shared[root] = cls(root)
+            return store
+
+    @classmethod
+    def from_config(cls, config) -> Optional["BlobStore"]:
+        """Get the shared store for the configured directory, or None if disabled."""
+        root = getattr(config, "blob_store_dir", "")
+        return cls.shared(root) if root else None
+
+    def path_for(self, digest: str) -> str:
+        """Path of the blob with a given digest."""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def has(self, digest: str) -> bool:
+        """Whether a blob is stored."""
+        return os.path.exists(self.path_for(digest))
+
+    def lookup(self, url: str) -> Optional[str]:
+        """Digest of the content last downloaded from a URL, if its blob is still stored."""
+        key = index_key(url)
+        with self._lock:
+            record = self._index.get(key)
+            if record is None:
+                # Another store sharing the directory may have downloaded it since
+                with self._locked():
+                    self._refresh()
+                record = self._index.get(key)
+        if record is None or not self.has(record["digest"]):
+            return None
+        return record["digest"]
+
+    def add(self, path: str, digest: str, url: Optional[str] = None) -> str:
+        """
+        Move a downloaded file into the store.
+
+        Args:
+            path: File to store; it is moved, or removed if the content is already stored
+            digest: SHA-256 hex digest of the file
+            url: URL the file was downloaded from, remembered in the index
+
+        Returns:
+            Path of the blob
+        """
+        blob_path = self.path_for(digest)
+        size = os.path.getsize(path)
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        with self._lock:
+            if os.path.exists(blob_path):
+                os.remove(path)
+                self._stats.duplicates += 1
+                self._stats.bytes_saved += size
+            else:
+                os.replace(path, blob_path)
+                self._stats.blobs += 1
+                self._stats.bytes_stored += size
+            if url is not None:
+                self._record(index_key(url), {"digest": digest, "size": size})
+        return blob_path
+
+    def link(self, digest: str, dest: str) -> str:
+        """
+        Make a blob available at ``dest``, replacing any file there.
+
+        Returns:
+            ``dest``
+        """
+        blob_path = self.path_for(digest)
+        directory = os.path.dirname(dest) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".blob-")
+        os.close(fd)
+        os.remove(tmp_path)
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            # Different filesystem or no hardlink support
+            shutil.copyfile(blob_path, tmp_path)
+        os.replace(tmp_path, dest)
+        return dest
+
+    def record_skip(self, url: str) -> None:
+        """Record a download answered from the store."""
+        with self._lock:
+            self._stats.skipped_downloads += 1
+            self._stats.bytes_saved += self._index.get(index_key(url), {}).get("size", 0)
+
+    def forget(self, url: str) -> bool:
+        """Drop a URL from the index so that it is downloaded again. Returns True if it was known."""
+        key = index_key(url)
+        with self._lock:
+            known = key in self._index
+            if known:
+                self._record(key, None)
+        return known
+
+    def close(self) -> None:
+        """Merge the journal into the index snapshot. The store remains usable."""
+        with self._lock, self._locked():
+            self._compact()
+
+    @contextmanager
+    def _locked(self):
+        """Hold the advisory lock guarding the index files against other processes."""
+        with open(os.path.join(self.root, "index.lock"), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _snapshot_identity(self):
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    def _reload(self) -> bool:
+        """
+        Read the snapshot and the whole journal (both locks held).
+
+        Returns:
+            True if the snapshot used the old URL keys and must be rewritten
+        """
+        self._snapshot_id = self._snapshot_identity()
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        # Older indexes were keyed by full URLs, credentials included
+        migrated = any("://" in key for key in index)
+        self._index = {index_key(key) if "://" in key else key: record for key, record in index.items()}
+        self._journal_offset = 0
+        self._replay()
+        return migrated
+
+    def _replay(self) -> None:
+        """Apply journal lines written since the last read (both locks held)."""
+        try:
+            with open(self.journal_path, "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # A line cut short by a crash has no newline yet and is read again later
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get("record") is None:
+                self._index.pop(entry["key"], None)
+            else:
+                self._index[entry["key"]] = entry["record"]
+        self._journal_offset += end
+
+    def _refresh(self) -> None:
+        """Catch up with changes made by other stores (both locks held)."""
+        try:
+            journal_size = os.path.getsize(self.journal_path)
+        except FileNotFoundError:
+            journal_size = 0
+        if self._snapshot_identity() != self._snapshot_id or journal_size < self._journal_offset:
+            # Another store compacted the journal into a new snapshot
+            self._reload()
+        else:
+            self._replay()
+
+    def _record(self, key: str, record: Optional[Dict]) -> None:
+        """Apply an index change and append it to the journal (lock held)."""
+        line = (json.dumps({"key": key, "record": record}) + "\n").encode("utf-8")
+        with self._locked():
+            self._refresh()
+            if record is None:
+                self._index.pop(key, None)
+            else:
+                self._index[key] = record
+            with open(self.journal_path, "ab") as f:
+                if f.tell() > self._journal_offset:
+                    # Terminate a line left unfinished by a crashed writer
+                    line = b"\n" + line
+                f.write(line)
+                self._journal_offset = f.tell()
+            self._appended += 1
+            if self._appended >= self.compact_every:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Write the merged index as a new snapshot and empty the journal (both locks held)."""
+        self._refresh()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        open(self.journal_path, "wb").close()
+        self._snapshot_id = self._snapshot_identity()
+        self._journal_offset = 0
+        self._appended = 0
+
+    @property
+    def stats(self) -> BlobStoreStats:
+        """Get a snapshot of the store counters for this process."""
+        with self._lock:
+            return BlobStoreStats(**vars(self._stats))
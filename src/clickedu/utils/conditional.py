@@ -0,0 +1,124 @@
+"""
+HTTP conditional request support for ClickEdu API client.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional
+
+
+@dataclass
+class ValidatorEntry:
+    """Validators and payload remembered for one URL and parameter set."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    size: int = 0
+    payload: Any = None
+
+    @property
+    def has_validators(self) -> bool:
+        """True if the server sent an ETag or Last-Modified header."""
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass
+class ConditionalStats:
+    """Snapshot of conditional request counters."""
+    conditional_requests: int = 0
+    not_modified: int = 0
+    hash_matches: int = 0
+    bytes_saved: int = 0
+
+
+def content_hash(data: bytes) -> str:
+    """Hash response content for servers that send no validators."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ValidatorStore:
+    """
+    Thread-safe LRU store of ETag / Last-Modified validators.
+
+    Used to send ``If-None-Match`` / ``If-Modified-Since`` headers and to
+    reuse the previous payload on ``304 Not Modified``. When a server sends
+    no validators, a content hash detects unchanged responses instead.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize validator store.
+
+        Args:
+            max_entries: Maximum number of URLs remembered
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, ValidatorEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = ConditionalStats()
+
+    def get(self, key: Hashable) -> Optional[ValidatorEntry]:
+        """Get the entry for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def conditional_headers(self, entry: Optional[ValidatorEntry]) -> Dict[str, str]:
+        """Get conditional request headers for an entry (empty if nothing is known)."""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        if headers:
+            with self._lock:
+                self._stats.conditional_requests += 1
+        return headers
+
+    def store(self, key: Hashable, headers, size: int, payload: Any,
+              digest: Optional[str] = None) -> ValidatorEntry:
+        """
+        Remember validators and payload from a full (200) response.
+
+        Args:
+            key: URL and parameter key
+            headers: Response headers
+            size: Size of the response body in bytes
+            payload: Parsed response or local file path to reuse later
+            digest: Content hash of the body, if already computed
+        """
+        entry = ValidatorEntry(
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            content_hash=digest,
+            size=size,
+            payload=payload,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def record_not_modified(self, entry: ValidatorEntry) -> None:
+        """Record a 304 response that reused a previous payload."""
+        with self._lock:
+            self._stats.not_modified += 1
+            self._stats.bytes_saved += entry.size
+
+    def record_hash_match(self) -> None:
+        """Record a full response whose content hash matched the previous one."""
+        with self._lock:
+            self._stats.hash_matches += 1
+
+    @property
+    def stats(self) -> ConditionalStats:
+        """Get a snapshot of the conditional request counters."""
+        with self._lock:
+            return ConditionalStats(**vars(self._stats))
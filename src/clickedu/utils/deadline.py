@@ -0,0 +1,125 @@
+"""
+Deadlines propagated across the ClickEdu call chain.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple, Union
+
+from ..exceptions import DeadlineExceededError
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+_current: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar("clickedu_deadline", default=None)
+
+
+class Deadline:
+    """
+    Point in time by which an operation and all of its requests must finish.
+
+    While a deadline is active (see ``deadline_scope``), the transport caps
+    each request timeout by the remaining budget, skips retries that would
+    overrun it and raises DeadlineExceededError once it has passed, so one
+    budget is shared by every step of a multi-request flow.
+    """
+
+    def __init__(self, seconds: float):
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Budget from now, in seconds
+        """
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0 once expired)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, what: str = "operation") -> None:
+        """Raise DeadlineExceededError if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceededError(f"Deadline of {self.budget:.1f}s exceeded before {what}")
+
+    def cap(self, timeout: Timeout) -> Tuple[float, float]:
+        """
+        Cap a requests ``timeout`` by the remaining budget.
+
+        Args:
+            timeout: None, a single timeout or a (connect, read) tuple
+
+        Returns:
+            (connect, read) timeout tuple no longer than the remaining budget
+        """
+        remaining = self.remaining
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+        return (
+            remaining if connect is None else min(connect, remaining),
+            remaining if read is None else min(read, remaining),
+        )
+
+    def __repr__(self) -> str:
+        return f"Deadline(budget={self.budget}, remaining={self.remaining:.3f})"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline active in the current context, if any."""
+    return _current.get()
+
+
+def wait_budget(what: str = "waiting") -> Optional[float]:
+    """
+    Timeout for one blocking wait under the active deadline.
+
+    Callers waiting on a lock, condition or event pass this as the wait
+    timeout and call it again after every wake-up, so a wait never outlives
+    the caller's budget.
+
+    Returns:
+        Seconds left, or None (wait without timeout) when no deadline is active
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return None
+    deadline.check(what)
+    return deadline.remaining
+
+
+@contextmanager
+def deadline_scope(deadline: Union[None, float, Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make a deadline active for the requests issued inside the block.
+
+    Args:
+        deadline: Deadline, budget in seconds, or None to keep the enclosing one
+
+    Yields:
+        The effective deadline: the earlier of the given and the enclosing one
+    """
+    outer = _current.get()
+    if deadline is None:
+        yield outer
+        return
+    if not isinstance(deadline, Deadline):
+        deadline = Deadline(deadline)
+    if outer is not None and outer.expires_at <= deadline.expires_at:
+        deadline = outer
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
@@ -0,0 +1,188 @@
+"""
+Concurrent file downloads for ClickEdu API client.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from ..exceptions import ClickEduError
+from ..models import BatchResult
+from .deadline import wait_budget
+from .file_handler import FileHandler
+from .logger import setup_logger
+
+
+class ByteBudget:
+    """
+    Bound on the number of bytes being downloaded at the same time.
+
+    A download reserves its expected size before its body is read and
+    releases it when done. A file larger than the whole budget reserves the
+    whole budget, so it still runs, but alone.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize byte budget.
+
+        Args:
+            max_bytes: Maximum bytes reserved at the same time
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self._reserved = 0
+        self._condition = threading.Condition()
+
+    @property
+    def reserved(self) -> int:
+        """Bytes currently reserved."""
+        return self._reserved
+
+    @contextmanager
+    def reserve(self, size: Optional[int]) -> Iterator[int]:
+        """
+        Reserve bytes for the duration of the block, waiting until they are available.
+
+        Args:
+            size: Expected size of the download (None or 0 reserves nothing)
+
+        Yields:
+            The number of bytes reserved
+
+        Raises:
+            DeadlineExceededError: If the active deadline passes while waiting
+        """
+        size = min(size or 0, self.max_bytes)
+        with self._condition:
+            while self._reserved + size > self.max_bytes:
+                self._condition.wait(wait_budget("waiting for download budget"))
+            self._reserved += size
+        try:
+            yield size
+        finally:
+            with self._condition:
+                self._reserved -= size
+                self._condition.notify_all()
+
+
+@dataclass
+class DownloadProgress:
+    """Progress of one file in a DownloadManager batch."""
+    file_path: str
+    downloaded: int
+    total: Optional[int] = None
+
+
+class DownloadManager:
+    """
+    Downloads many files over a shared session with a bounded worker pool.
+
+    Besides the worker pool, at most ``per_host`` downloads run against one
+    host and at most ``max_inflight_bytes`` (by Content-Length) are being
+    received at the same time. Failures are collected per file instead of
+    being logged and dropped.
+    """
+
+    def __init__(self, file_handler: FileHandler, max_workers: int = 4, per_host: int = 2,
+                 max_inflight_bytes: int = 64 * 1024 * 1024,
+                 progress: Optional[Callable[[DownloadProgress], None]] = None):
+        """
+        Initialize download manager.
+
+        Args:
+            file_handler: File handler performing the individual downloads
+            max_workers: Maximum concurrent downloads
+            per_host: Maximum concurrent downloads from one host
+            max_inflight_bytes: Maximum bytes being downloaded at the same time
+            progress: Called with a DownloadProgress after each chunk of every file
+        """
+        if max_workers < 1 or per_host < 1:
+            raise ValueError("max_workers and per_host must be at least 1")
+        self.file_handler = file_handler
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.budget = ByteBudget(max_inflight_bytes)
+        self.progress = progress
+        self.logger = setup_logger("clickedu.downloads")
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    @staticmethod
+    def file_paths(items: Iterable[Any], variant: str = "large") -> List[str]:
+        """
+        Resolve download items to file paths, dropping duplicates and missing paths.
+
+        Args:
+            items: File paths or Photo objects
+            variant: Photo size to download, "large" or "small"
+
+        Returns:
+            File paths in input order
+        """
+        if variant not in ("large", "small"):
+            raise ValueError(f"Unknown photo variant: {variant!r}")
+        attribute = "pathLarge" if variant == "large" else "pathSmall"
+        paths = [item if isinstance(item, str) else getattr(item, attribute, None) for item in items]
+        return list(dict.fromkeys(path for path in paths if path))
+
+    def _download_one(self, file_path: str, download_dir: str, filename: Optional[str]) -> Optional[str]:
+        progress = None
+        if self.progress is not None:
+            def progress(downloaded: int, total: Optional[int]) -> None:
+                self.progress(DownloadProgress(file_path, downloaded, total))
+
+        host = urlparse(self.file_handler.resolve_url(file_path)).netloc
+        with self._host_slot(host):
+            return self.file_handler.download_file(file_path, download_dir, progress, self.budget, filename)
+
+    def download(self, items: Iterable[Any], download_dir: str = "files", variant: str = "large",
+                 max_workers: Optional[int] = None, filenames: Optional[Dict[str, str]] = None) -> BatchResult:
+        """
+        Download files concurrently.
+
+        Args:
+            items: File paths or Photo objects
+            download_dir: Directory to save the files
+            variant: Photo size to download, "large" or "small"
+            max_workers: Maximum concurrent downloads (capped by ``self.max_workers``)
+            filenames: Names to save files under, by file path (defaults to the URL's base name);
+                files sharing a base name must be given distinct names
+
+        Returns:
+            BatchResult mapping file paths, in input order, to local paths, with
+            failed downloads reported in ``errors``
+        """
+        paths = self.file_paths(items, variant)
+        batch = BatchResult()
+        if not paths:
+            return batch
+
+        workers = min(self.max_workers, max_workers or self.max_workers, len(paths))
+        completed: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clickedu-download") as executor:
+            futures = {
+                executor.submit(self._download_one, path, download_dir, (filenames or {}).get(path)): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    completed[path] = future.result()
+                except ClickEduError as e:
+                    self.logger.error(f"Error downloading file {path}: {e}")
+                    batch.errors[path] = e
+
+        batch.results = {path: completed[path] for path in paths if path in completed}
+        return batch
@@ -2,33 +2,229 @@
 File handling utilities for ClickEdu API client.
 """
 
+import hashlib
+import io
+import json
 import os
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
 from urllib.parse import urlparse
-from typing import Optional
-from ..exceptions import FileDownloadError
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+import requests
+from ..exceptions import DeadlineExceededError, FileDownloadError
+from .blob_store import BlobStore
+from .conditional import ValidatorStore
+from .deadline import current_deadline
+from .singleflight import SingleFlight
+
+# Suffix of partially downloaded files; the checkpoint sidecar adds ".json"
+PART_SUFFIX = ".part"
+
+
+# Downloads ask for the body unencoded so that lengths and Range offsets count file bytes
+_DOWNLOAD_HEADERS = {"Accept-Encoding": "identity"}
+
+
+def _is_encoded(response) -> bool:
+    """Whether the body has a Content-Encoding (gzip, ...) that requests decodes while reading."""
+    return response.headers.get("Content-Encoding", "identity").strip().lower() not in ("", "identity")
+
+
+def _expected_length(response, offset: int) -> Optional[int]:
+    """Total size of the file being downloaded, if the response tells."""
+    if _is_encoded(response):
+        # Content-Length and Content-Range count encoded bytes, not the decoded file
+        return None
+    if response.status_code == 206:
+        # Content-Range: bytes <start>-<end>/<total>
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        if total.isdigit():
+            return int(total)
+    length = response.headers.get("Content-Length")
+    return offset + int(length) if length and length.isdigit() else None
+
+
+@dataclass
+class _Checkpoint:
+    """State of an interrupted download, stored next to its part file."""
+    url: str
+    offset: int
+    length: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @property
+    def if_range(self) -> str:
+        """Validator sent in If-Range so the server only resumes an unchanged file."""
+        return self.etag or self.last_modified
+    
+    @staticmethod
+    def load(part_path: str, url: str) -> Optional["_Checkpoint"]:
+        """Load the checkpoint of a part file, or None if it cannot be resumed."""
+        try:
+            with open(part_path + ".json", encoding="utf-8") as f:
+                data = json.load(f)
+            offset = os.path.getsize(part_path)
+        except (OSError, ValueError):
+            return None
+        checkpoint = _Checkpoint(url, offset, data.get("length"), data.get("etag"), data.get("last_modified"))
+        if data.get("url") != url or not checkpoint.if_range or offset == 0:
+            return None
+        if checkpoint.length is not None and offset >= checkpoint.length:
+            return None
+        return checkpoint
+    
+    @staticmethod
+    def save(part_path: str, url: str, length: Optional[int], response) -> None:
+        """Record the validators of a download about to start (skipped if it could not be resumed)."""
+        headers = response.headers
+        etag = headers.get("ETag")
+        if etag and etag.startswith("W/"):
+            # Weak validators cannot be used in If-Range
+            etag = None
+        last_modified = headers.get("Last-Modified")
+        if not (etag or last_modified) or _is_encoded(response):
+            # Offsets of an encoded body do not match the decoded part file
+            _Checkpoint.discard(part_path, keep_part=True)
+            return
+        with open(part_path + ".json", "w", encoding="utf-8") as f:
+            json.dump({"url": url, "length": length, "etag": etag, "last_modified": last_modified}, f)
+    
+    @staticmethod
+    def discard(part_path: str, keep_part: bool = False) -> None:
+        """Remove a checkpoint and, unless ``keep_part``, its part file."""
+        paths = [part_path + ".json"] if keep_part else [part_path + ".json", part_path]
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def matches(self, response) -> bool:
+        """Whether a response continues this download (206 at our offset, same validators)."""
+        if response.status_code != 206 or _is_encoded(response):
+            return False
+        content_range = response.headers.get("Content-Range", "")
+        if not content_range.startswith(f"bytes {self.offset}-"):
+            return False
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        return (not etag or not self.etag or etag == self.etag) and \
+            (not last_modified or not self.last_modified or last_modified == self.last_modified)
+
+
+class ResponseStream(io.RawIOBase):
+    """
+    Read-only raw stream over the body of a download.
+    
+    ``readinto`` copies each received chunk straight into the caller's
+    buffer; nothing is written to disk. Closing the stream releases the
+    connection.
+    """
+    
+    def __init__(self, chunks: Iterator[bytes], length: Optional[int] = None,
+                 release: Optional[Callable[[], None]] = None):
+        """
+        Initialize response stream.
+        
+        Args:
+            chunks: Body chunks, closed together with the stream
+            length: Size of the body from Content-Length, if known
+            release: Called on close, e.g. to release the connection of an unread body
+        """
+        self.length = length
+        self._chunks = chunks
+        self._release = release
+        self._pending = memoryview(b"")
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        """Read up to ``len(buffer)`` bytes into ``buffer``. Returns 0 at the end of the body."""
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._chunks.close()
+            if self._release is not None:
+                self._release()
+        super().close()
 
 
 class FileHandler:
     """Handles file download operations."""
     
-    def __init__(self, session, base_url: str):
+    def __init__(self, session, base_url: str, validators: Optional[ValidatorStore] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 timeout: Union[None, float, Tuple[float, float]] = None,
+                 min_speed: float = 0.0, stall_window: float = 30.0, chunk_size: int = 8192,
+                 resume: bool = True, blob_store: Optional[BlobStore] = None):
         """
         Initialize file handler.
         
         Args:
             session: Requests session object
             base_url: Base URL for file downloads
+            validators: Optional ETag/Last-Modified store enabling conditional downloads
+            single_flight: Coalescer shared with other components (a private one is created if not provided)
+            timeout: Connect/read timeout of download requests
+            min_speed: Abort downloads slower than this many bytes per second (0 disables)
+            stall_window: Seconds over which the download speed is measured
+            chunk_size: Size of the chunks read from the response and written to disk
+            resume: Keep interrupted downloads as ``.part`` files and continue them with Range requests
+            blob_store: Optional content-addressed store deduplicating downloaded files
         """
         self.session = session
         self.base_url = base_url
+        self.validators = validators
+        self.single_flight = single_flight or SingleFlight()
+        self.timeout = timeout
+        self.min_speed = min_speed
+        self.stall_window = stall_window
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.blob_store = blob_store
+    
+    def resolve_url(self, file_path: str) -> str:
+        """Get the full URL for a file path from the API."""
+        if file_path.startswith("../private/"):
+            # Remove the "../private/" prefix and construct URL
+            clean_path = file_path.replace("../private/", "")
+            return f"{self.base_url}/private/{clean_path}"
+        # If it's already a full path, use it as is
+        return file_path
+    
+    def local_path_for(self, file_url: str, download_dir: str) -> str:
+        """Get the local path a file URL is saved to."""
+        # Extract filename from the path
+        filename = os.path.basename(urlparse(file_url).path)
+        return os.path.join(download_dir, filename)
     
-    def download_file(self, file_path: str, download_dir: str = "files") -> Optional[str]:
+    def download_file(self, file_path: str, download_dir: str = "files",
+                      progress: Optional[Callable[[int, Optional[int]], None]] = None,
+                      budget=None, filename: Optional[str] = None) -> Optional[str]:
         """
         Download a file from ClickEdu to the specified directory.
         
+        Concurrent downloads of the same URL to the same path share one request.
+        
         Args:
             file_path: The file path from the news item (e.g., "../private/...")
             download_dir: Directory to save the file (default: "files")
+            progress: Called with (bytes downloaded, total bytes or None) after each chunk
+            budget: Byte budget (see DownloadManager) reserved for the body while it is read
+            filename: Name to save the file under (defaults to the URL's base name)
             
         Returns:
             Path to the downloaded file or None if failed
@@ -40,32 +236,202 @@ class FileHandler:
             # Create download directory if it doesn't exist
             os.makedirs(download_dir, exist_ok=True)
             
-            # Construct the full URL for the file
-            if file_path.startswith("../private/"):
-                # Remove the "../private/" prefix and construct URL
-                clean_path = file_path.replace("../private/", "")
-                file_url = f"{self.base_url}/private/{clean_path}"
+            file_url = self.resolve_url(file_path)
+            if filename is not None:
+                if not filename or os.path.basename(filename) != filename or filename in (".", ".."):
+                    raise ValueError(f"Invalid file name: {filename!r}")
+                local_file_path = os.path.join(download_dir, filename)
             else:
-                # If it's already a full path, use it as is
-                file_url = file_path
-            
-            # Extract filename from the path
-            parsed_url = urlparse(file_url)
-            filename = os.path.basename(parsed_url.path)
+                local_file_path = self.local_path_for(file_url, download_dir)
             
-            # Full path where the file will be saved
-            local_file_path = os.path.join(download_dir, filename)
+            return self.single_flight.do(
+                ("file", file_url, os.path.abspath(local_file_path)),
+                lambda: self._download(file_url, local_file_path, progress, budget),
+            )
             
-            # Download the file
-            response = self.session.get(file_url, stream=True)
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            raise FileDownloadError(f"Failed to download file {file_path}: {e}") from e
+    
+    def _download(self, file_url: str, local_file_path: str,
+                  progress: Optional[Callable[[int, Optional[int]], None]] = None, budget=None) -> str:
+        """
+        Download a file URL to a local path.
+        
+        The body is written to ``<path>.part`` and renamed once complete. A
+        checkpoint sidecar records the expected length and validators so that
+        an interrupted download continues with a Range request. With a blob
+        store, completed files are moved into the store and linked to the
+        path, and URLs already in the store are not downloaded again.
+        """
+        if self.blob_store is not None:
+            digest = self.blob_store.lookup(file_url)
+            if digest is not None:
+                self.blob_store.record_skip(file_url)
+                return self.blob_store.link(digest, local_file_path)
+        
+        part_path = local_file_path + PART_SUFFIX
+        checkpoint = _Checkpoint.load(part_path, file_url) if self.resume else None
+        
+        # Send conditional headers if this URL was already saved to the same path
+        key = ("file", file_url)
+        entry = self.validators.get(key) if self.validators is not None else None
+        if entry is not None and (entry.payload != local_file_path or not os.path.exists(local_file_path)):
+            entry = None
+        headers = dict(_DOWNLOAD_HEADERS)
+        if checkpoint is not None:
+            headers.update({"Range": f"bytes={checkpoint.offset}-", "If-Range": checkpoint.if_range})
+        elif self.validators is not None:
+            headers.update(self.validators.conditional_headers(entry))
+        
+        # Download the file
+        response = self.session.get(file_url, stream=True, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.validators.record_not_modified(entry)
+            return local_file_path
+        if checkpoint is not None and not checkpoint.matches(response):
+            # The file changed (a 200 carries the new version) or the range was not honoured
+            _Checkpoint.discard(part_path)
+            checkpoint = None
+            if response.status_code != 200:
+                response.close()
+                response = self.session.get(file_url, stream=True, headers=_DOWNLOAD_HEADERS,
+                                            timeout=self.timeout)
+        response.raise_for_status()
+        
+        # Save the file
+        offset = checkpoint.offset if checkpoint is not None else 0
+        total = _expected_length(response, offset)
+        digest = hashlib.sha256()
+        if offset:
+            with open(part_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+        elif self.resume:
+            _Checkpoint.save(part_path, file_url, total, response)
+        size = offset
+        reservation = budget.reserve(total - offset if total is not None else None) \
+            if budget is not None else nullcontext()
+        with reservation, response, open(part_path, 'ab' if offset else 'wb') as f:
+            for chunk in self._iter_checked(response, file_url):
+                f.write(chunk)
+                digest.update(chunk)
+                size += len(chunk)
+                if progress is not None:
+                    progress(size, total)
+        
+        if total is not None and size != total:
+            raise FileDownloadError(f"Download of {file_url} incomplete: got {size} of {total} bytes")
+        if self.blob_store is not None:
+            self.blob_store.add(part_path, digest.hexdigest(), file_url)
+            self.blob_store.link(digest.hexdigest(), local_file_path)
+        else:
+            os.replace(part_path, local_file_path)
+        _Checkpoint.discard(part_path, keep_part=True)
+        
+        if self.validators is not None:
+            if entry is not None and entry.content_hash == digest.hexdigest():
+                self.validators.record_hash_match()
+            self.validators.store(key, response.headers, size, local_file_path, digest.hexdigest())
+        
+        return local_file_path
+    
+    def _get(self, file_path: str):
+        """Send a streamed GET for a file and check its status."""
+        file_url = self.resolve_url(file_path)
+        try:
+            response = self.session.get(file_url, stream=True, timeout=self.timeout)
             response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise FileDownloadError(f"Failed to download file {file_path}: {e}") from e
+        return file_url, response
+    
+    def _iter_body(self, response, file_url: str, chunk_size: Optional[int]) -> Iterator[bytes]:
+        """Yield the chunks of a response body, releasing the connection when done or closed."""
+        try:
+            with response:
+                yield from self._iter_checked(response, file_url, chunk_size)
+        except requests.exceptions.RequestException as e:
+            raise FileDownloadError(f"Failed to download file {file_url}: {e}") from e
+    
+    def iter_file(self, file_path: str, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Download a file as an iterator of byte chunks, without writing it to disk.
+        
+        The request is sent immediately; the body is read as the iterator is
+        consumed. Close the iterator to abandon the download early.
+        
+        Args:
+            file_path: The file path from the news item (e.g., "../private/...")
+            chunk_size: Size of the chunks (defaults to ``self.chunk_size``)
+            
+        Returns:
+            Iterator over the body chunks
             
-            # Save the file
-            with open(local_file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        Raises:
+            FileDownloadError: If the request fails (also raised while iterating)
+        """
+        file_url, response = self._get(file_path)
+        return self._iter_body(response, file_url, chunk_size)
+    
+    def open_file(self, file_path: str, buffer_size: Optional[int] = None) -> io.BufferedReader:
+        """
+        Open a file for reading straight from the server, without writing it to disk.
+        
+        The returned reader supports ``read``, ``readinto`` and use as a
+        context manager; reads into a caller-supplied buffer of at least
+        ``buffer_size`` bytes bypass the internal buffer.
+        
+        Args:
+            file_path: The file path from the news item (e.g., "../private/...")
+            buffer_size: Size of the read buffer (defaults to ``self.chunk_size``)
             
-            return local_file_path
+        Returns:
+            Binary file-like object over the body; close it to release the connection
             
-        except Exception as e:
-            raise FileDownloadError(f"Failed to download file {file_path}: {e}") from e
+        Raises:
+            FileDownloadError: If the request fails (also raised while reading)
+        """
+        file_url, response = self._get(file_path)
+        length = response.headers.get("Content-Length")
+        raw = ResponseStream(
+            self._iter_body(response, file_url, buffer_size),
+            int(length) if length and length.isdigit() else None,
+            response.close,
+        )
+        return io.BufferedReader(raw, buffer_size or self.chunk_size)
+    
+    def _iter_checked(self, response, file_url: str, chunk_size: Optional[int] = None):
+        """
+        Iterate over a response body, enforcing the minimum speed and active deadline.
+        
+        The read timeout only catches a connection that goes fully silent; this
+        also aborts a transfer trickling in slower than ``min_speed`` over a
+        ``stall_window``. Only time spent waiting for the network counts
+        towards the window, so a slow consumer is not mistaken for a stall.
+        """
+        deadline = current_deadline()
+        chunks = response.iter_content(chunk_size=chunk_size or self.chunk_size)
+        window_time = 0.0
+        window_bytes = 0
+        while True:
+            start = time.monotonic()
+            chunk = next(chunks, None)
+            if chunk is None:
+                return
+            if self.min_speed > 0:
+                window_time += time.monotonic() - start
+                window_bytes += len(chunk)
+                if window_time >= self.stall_window:
+                    if window_bytes < self.min_speed * window_time:
+                        raise FileDownloadError(
+                            f"Download of {file_url} stalled: {window_bytes / window_time:.0f} B/s "
+                            f"over {window_time:.0f}s"
+                        )
+                    window_time = 0.0
+                    window_bytes = 0
+            yield chunk
+            if deadline is not None:
+                deadline.check(f"download of {file_url} completed")
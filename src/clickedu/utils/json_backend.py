@@ -0,0 +1,75 @@
+"""
+Pluggable JSON decoding for ClickEdu API responses.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Union
+
+import requests
+
+JsonLoads = Callable[[bytes], Any]
+
+# Backends tried, in order, by the "auto" setting (ujson is not faster than
+# the standard library on these payloads, so it is only used when named)
+_AUTO_ORDER = ("orjson", "json")
+
+
+def _import_backend(name: str) -> JsonLoads:
+    """Import a backend and return its loads function."""
+    if name in ("json", "stdlib"):
+        return json.loads
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    if name == "ujson":
+        import ujson
+        return ujson.loads
+    raise ValueError(f"Unknown JSON backend: {name}")
+
+
+@lru_cache(maxsize=None)
+def _resolve(name: str) -> JsonLoads:
+    if name != "auto":
+        return _import_backend(name)
+    for candidate in _AUTO_ORDER:
+        try:
+            return _import_backend(candidate)
+        except ImportError:
+            continue
+    return json.loads  # pragma: no cover - stdlib is always available
+
+
+def get_json_loads(backend: Union[str, JsonLoads] = "auto") -> JsonLoads:
+    """
+    Get a JSON decoding function that accepts raw bytes.
+
+    Args:
+        backend: "auto" (orjson if installed, otherwise the standard library),
+            "orjson", "ujson", "json"/"stdlib", or a callable taking bytes
+
+    Returns:
+        Function decoding JSON from bytes
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If a named optional backend is not installed
+    """
+    if callable(backend):
+        return backend
+    return _resolve(backend.lower())
+
+
+def decode_json(response: requests.Response, loads: JsonLoads) -> Any:
+    """
+    Decode a response body straight from its bytes.
+
+    Decoding errors are raised as ``requests.exceptions.InvalidJSONError``,
+    so callers handle them like ``response.json()`` failures.
+    """
+    try:
+        return loads(response.content)
+    except ValueError as e:
+        raise requests.exceptions.InvalidJSONError(
+            f"Invalid JSON in response: {e}", response=response
+        ) from e
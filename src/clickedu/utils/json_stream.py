@@ -0,0 +1,165 @@
+"""
+Incremental JSON parsing for large ClickEdu responses.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+# Consumed text is dropped from the buffer once it grows past this many characters
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class _Buffer:
+    """Text buffer filled incrementally from a stream of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def fill(self, min_chars: int = 1) -> bool:
+        """Read until at least ``min_chars`` more characters arrived. Returns False at end of stream."""
+        added = 0
+        while added < min_chars:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                tail = self._decoder.decode(b"", final=True)
+                self.text += tail
+                self.exhausted = True
+                return bool(tail) or added > 0
+            if not chunk:
+                continue
+            text = self._decoder.decode(chunk)
+            self.text += text
+            added += len(text)
+        return True
+
+    def compact(self) -> None:
+        """Drop consumed text."""
+        if self.pos > _COMPACT_THRESHOLD:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character, reading more input if needed ("" at end of stream)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            self.compact()
+            if not self.fill():
+                return ""
+
+
+def _seek_array(buffer: _Buffer, key: str) -> None:
+    """Advance the buffer to just after the ``[`` opening the top-level array at ``key``."""
+    depth = 0
+    in_string = False
+    escaped = False
+    string_start = 0
+    last_string = None
+    current_key = None
+
+    while True:
+        if buffer.pos >= len(buffer.text):
+            if not in_string:
+                # Keep the current string in the buffer, it may be a key
+                buffer.compact()
+            if not buffer.fill():
+                raise ValueError(f"Key {key!r} with an array value not found in response")
+            continue
+
+        char = buffer.text[buffer.pos]
+        buffer.pos += 1
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                if depth == 1:
+                    last_string = buffer.text[string_start:buffer.pos - 1]
+            continue
+
+        if char == '"':
+            in_string = True
+            string_start = buffer.pos
+        elif char == ":" and depth == 1:
+            current_key = last_string
+        elif char == "," and depth == 1:
+            current_key = None
+        elif char in "{[":
+            if char == "[" and depth == 1 and current_key == key:
+                return
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level array in a JSON object as bytes arrive.
+
+    For a body like ``{"total": 3, "photos": [{...}, {...}]}`` and key
+    ``"photos"``, each photo dict is yielded as soon as it is complete, so
+    memory is bounded by the size of one element plus one chunk rather than
+    by the whole response.
+
+    Args:
+        chunks: Iterable of raw response byte chunks
+        key: Top-level key whose array value is streamed
+
+    Yields:
+        Decoded array elements
+
+    Raises:
+        ValueError: If the JSON is malformed or the key is missing
+    """
+    buffer = _Buffer(chunks)
+    _seek_array(buffer, key)
+    decoder = json.JSONDecoder()
+
+    expect_value = True
+    while True:
+        char = buffer.peek()
+        if char == "":
+            raise ValueError("Unexpected end of JSON array")
+        if char == "]":
+            return
+        if char == ",":
+            if expect_value:
+                raise ValueError("Unexpected ',' in JSON array")
+            buffer.pos += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer.text, buffer.pos)
+            except json.JSONDecodeError:
+                if buffer.exhausted:
+                    raise
+                # Grow geometrically so a large element is not re-parsed once per chunk
+                buffer.fill(max(1, len(buffer.text) - buffer.pos))
+                continue
+            if not buffer.exhausted and (end == len(buffer.text) or buffer.text[end] not in _DELIMITERS):
+                # A number cut at a chunk boundary may continue in the next chunk
+                buffer.fill()
+                continue
+            break
+
+        buffer.pos = end
+        buffer.compact()
+        expect_value = False
+        yield value
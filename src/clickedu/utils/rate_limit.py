@@ -0,0 +1,331 @@
+"""
+Adaptive client-side rate limiting for ClickEdu API client.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .deadline import wait_budget
+
+# Status codes that mean the server is throttling or overloaded
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+class TokenBucket:
+    """
+    Token bucket limiting the request rate.
+
+    Tokens are refilled continuously at ``rate`` per second up to ``burst``;
+    each request takes one token and waits while the bucket is empty.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (defaults to ``rate``, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if available. Returns 0 on success, otherwise the seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available. Returns the time waited.
+
+        Raises:
+            DeadlineExceededError: If the active deadline passes while waiting
+        """
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return waited
+            budget = wait_budget("waiting for a rate limit token")
+            if budget is not None:
+                delay = min(delay, budget)
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds`` (e.g. after a Retry-After header)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+class AIMDController:
+    """
+    Concurrency window adjusted by additive increase, multiplicative decrease.
+
+    Every healthy response grows the window by ``increase / limit`` (about
+    ``increase`` per full window of responses); a throttling status, an error
+    or a latency above ``latency_factor`` times the observed baseline shrinks
+    it by ``decrease``, at most once per ``cooldown`` seconds so one burst of
+    failures counts as a single congestion signal. The latency baseline
+    follows every successful response, so it adapts upward to a sustained
+    slower but healthy server instead of treating it as congested forever.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 16,
+                 increase: float = 1.0, decrease: float = 0.5, latency_factor: float = 3.0,
+                 cooldown: float = 1.0):
+        """
+        Initialize controller.
+
+        Args:
+            initial: Initial number of concurrent requests
+            minimum: Lower bound of the window
+            maximum: Upper bound of the window
+            increase: Window growth per window of healthy responses
+            decrease: Factor applied to the window on congestion
+            latency_factor: Latency, relative to the baseline, treated as congestion
+            cooldown: Minimum seconds between two decreases
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Smoothed latency of successful responses."""
+        return self._baseline
+
+    def acquire(self) -> None:
+        """
+        Wait for a free slot in the window.
+
+        Raises:
+            DeadlineExceededError: If the active deadline passes while waiting
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait(wait_budget("waiting for a concurrency slot"))
+            self._in_flight += 1
+
+    def cancel(self) -> None:
+        """Free a slot taken by ``acquire`` without a request outcome (the window is unchanged)."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def release(self, latency: Optional[float] = None, throttled: bool = False) -> bool:
+        """
+        Free a slot and adapt the window to the outcome of the request.
+
+        Args:
+            latency: Seconds until the response arrived (None if unknown)
+            throttled: The server throttled or the request failed
+
+        Returns:
+            True if the outcome was treated as congestion
+        """
+        with self._condition:
+            self._in_flight -= 1
+            congested = throttled
+            if latency is not None and not throttled:
+                if self._baseline is not None and latency > self._baseline * self.latency_factor:
+                    congested = True
+                # Slow-moving average of every successful response, slow ones included, so
+                # a sustained higher latency (e.g. a slower endpoint) becomes the new normal
+                self._baseline = latency if self._baseline is None else 0.9 * self._baseline + 0.1 * latency
+
+            if congested:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(self.minimum, self._limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                self._limit = min(self.maximum, self._limit + self.increase / self._limit)
+            self._condition.notify_all()
+            return congested
+
+
+@dataclass
+class HostLimitStats:
+    """Snapshot of the limiter state for one host."""
+    concurrency_limit: int
+    in_flight: int
+    requests: int
+    throttled: int
+    waited: float
+    baseline_latency: Optional[float] = None
+
+
+class HostLimiter:
+    """Token bucket and AIMD window guarding the requests to one host."""
+
+    def __init__(self, bucket: Optional[TokenBucket], controller: AIMDController):
+        self.bucket = bucket
+        self.controller = controller
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._throttled = 0
+        self._waited = 0.0
+
+    def acquire(self) -> None:
+        """Wait for a concurrency slot and a rate token."""
+        start = time.monotonic()
+        self.controller.acquire()
+        if self.bucket is not None:
+            try:
+                self.bucket.acquire()
+            except BaseException:
+                self.controller.cancel()
+                raise
+        with self._lock:
+            self._requests += 1
+            self._waited += time.monotonic() - start
+
+    def release(self, latency: Optional[float], status: Optional[int] = None,
+                retry_after: Optional[float] = None) -> None:
+        """
+        Report the outcome of a request.
+
+        Args:
+            latency: Seconds until the response arrived
+            status: Response status code (None if the request failed)
+            retry_after: Seconds the server asked us to wait, if any
+        """
+        throttled = status is None or status in THROTTLE_STATUSES
+        self.controller.release(latency, throttled)
+        if throttled:
+            with self._lock:
+                self._throttled += 1
+        if retry_after and self.bucket is not None:
+            self.bucket.pause(retry_after)
+
+    def stats(self) -> HostLimitStats:
+        """Get a snapshot of the limiter state."""
+        with self._lock:
+            return HostLimitStats(
+                concurrency_limit=self.controller.limit,
+                in_flight=self.controller.in_flight,
+                requests=self._requests,
+                throttled=self._throttled,
+                waited=self._waited,
+                baseline_latency=self.controller.baseline_latency,
+            )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Per-host rate and concurrency limits shared by every request path.
+
+    Each host (a school domain, ``api.clickedu.eu``) gets its own token
+    bucket and AIMD concurrency window, created on first use, so throttling
+    by one server does not slow down the others.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 initial_concurrency: int = 4, min_concurrency: int = 1, max_concurrency: int = 16,
+                 latency_factor: float = 3.0, cooldown: float = 1.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Requests per second per host (None for no rate limit)
+            burst: Token bucket capacity per host
+            initial_concurrency: Initial concurrency window per host
+            min_concurrency: Lower bound of the concurrency window
+            max_concurrency: Upper bound of the concurrency window
+            latency_factor: Latency, relative to the baseline, treated as congestion
+            cooldown: Minimum seconds between two window decreases
+        """
+        self.rate = rate
+        self.burst = burst
+        self.initial_concurrency = initial_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> Optional["RateLimiter"]:
+        """Build a limiter from the configuration, or None if rate limiting is disabled."""
+        if not (getattr(config, "rate_limit", 0) or getattr(config, "adaptive_concurrency", False)):
+            return None
+        return cls(
+            rate=config.rate_limit or None,
+            initial_concurrency=min(config.max_concurrency, max(1, config.max_workers)),
+            max_concurrency=config.max_concurrency,
+        )
+
+    def for_host(self, host: str) -> HostLimiter:
+        """Get the limiter of a host, creating it on first use."""
+        with self._lock:
+            limiter = self._hosts.get(host)
+            if limiter is None:
+                bucket = TokenBucket(self.rate, self.burst) if self.rate else None
+                controller = AIMDController(
+                    initial=self.initial_concurrency,
+                    minimum=self.min_concurrency,
+                    maximum=self.max_concurrency,
+                    latency_factor=self.latency_factor,
+                    cooldown=self.cooldown,
+                )
+                limiter = self._hosts[host] = HostLimiter(bucket, controller)
+            return limiter
+
+    def stats(self) -> Dict[str, HostLimitStats]:
+        """Get a snapshot of the limiter state of every host."""
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {host: limiter.stats() for host, limiter in hosts.items()}
@@ -0,0 +1,268 @@
+"""
+Retry policy and circuit breakers for ClickEdu API client.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+# Methods that can be repeated without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Statuses worth retrying: throttling and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def _never_sent(error: Exception) -> bool:
+    """Whether a request failed before a connection to the server was opened."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    reason = error.args[0]
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
+
+class RetryPolicy:
+    """
+    Idempotency-aware retry policy with exponential backoff and full jitter.
+
+    Idempotent requests are retried on connection errors, timeouts and
+    ``RETRY_STATUSES``. Other methods (the login POSTs) are only retried when
+    their path is listed in ``retry_post_paths``, or when the connection
+    could not be opened at all (connect timeout, refused or unresolvable
+    host), since the server then never saw the request.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 jitter: bool = True, retry_statuses: Iterable[int] = RETRY_STATUSES,
+                 retry_post_paths: Iterable[str] = (), max_retry_after: float = 60.0):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first one
+            backoff: Base delay in seconds, doubled after each attempt
+            max_backoff: Upper bound of a single delay
+            jitter: Draw each delay uniformly between 0 and the backoff ("full jitter")
+            retry_statuses: Response statuses that trigger a retry
+            retry_post_paths: URL paths of non-idempotent requests that are safe to retry,
+                e.g. "/ws/app_clickedu_permissions.php"
+            max_retry_after: Longest Retry-After honoured; longer waits are not retried
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_post_paths = frozenset(retry_post_paths)
+        self.max_retry_after = max_retry_after
+
+    @classmethod
+    def from_config(cls, config) -> Optional["RetryPolicy"]:
+        """Build a policy from the configuration, or None if retries are disabled."""
+        attempts = getattr(config, "retry_attempts", 0)
+        if attempts <= 0:
+            return None
+        return cls(
+            max_attempts=attempts + 1,
+            backoff=config.retry_backoff,
+            retry_post_paths=config.retry_post_paths,
+        )
+
+    def is_retryable(self, method: str, path: str) -> bool:
+        """Whether a request may be repeated after the server has seen it."""
+        return method.upper() in IDEMPOTENT_METHODS or path in self.retry_post_paths
+
+    def should_retry_error(self, method: str, path: str, error: Exception) -> bool:
+        """Whether a failed request should be retried."""
+        if _never_sent(error):
+            return True
+        if not isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return False
+        return self.is_retryable(method, path)
+
+    def should_retry_status(self, method: str, path: str, status: int) -> bool:
+        """Whether a response status should be retried."""
+        return status in self.retry_statuses and self.is_retryable(method, path)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Delay before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure)
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Seconds to wait, or None if no further attempt should be made
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+@dataclass
+class BreakerStats:
+    """Snapshot of one circuit breaker."""
+    state: str
+    consecutive_failures: int
+    failures: int
+    successes: int
+    rejected: int
+    opened: int
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one endpoint.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    requests are rejected immediately. Once ``reset_timeout`` has passed, a
+    single trial request is let through (half-open). The breaker closes if
+    that request succeeds and opens again if it fails.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds an open breaker waits before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._successes = 0
+        self._rejected = 0
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (rejections are counted)."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            self._rejected += 1
+            return False
+
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a trial request through."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        """Record a healthy response."""
+        with self._lock:
+            self._successes += 1
+            self._consecutive_failures = 0
+            self._state = self.CLOSED
+            self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """Give back a half-open trial slot whose request ended without an outcome."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request or an unhealthy response."""
+        with self._lock:
+            self._failures += 1
+            self._consecutive_failures += 1
+            if self._state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+    def stats(self) -> BreakerStats:
+        """Get a snapshot of the breaker."""
+        with self._lock:
+            return BreakerStats(
+                state=self._current_state(time.monotonic()),
+                consecutive_failures=self._consecutive_failures,
+                failures=self._failures,
+                successes=self._successes,
+                rejected=self._rejected,
+                opened=self._opened,
+            )
+
+
+class CircuitBreakers:
+    """Registry of circuit breakers keyed by endpoint class ("host/ws/<script>.php" or "host/private")."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize circuit breaker registry.
+
+        Args:
+            failure_threshold: Consecutive failures that open an endpoint's breaker
+            reset_timeout: Seconds an open breaker waits before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> Optional["CircuitBreakers"]:
+        """Build the registry from the configuration, or None if breakers are disabled."""
+        threshold = getattr(config, "breaker_threshold", 0)
+        if threshold <= 0:
+            return None
+        return cls(threshold, config.breaker_reset_timeout)
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        """Get the breaker of an endpoint, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def stats(self) -> Dict[str, BreakerStats]:
+        """Get a snapshot of every breaker."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {endpoint: breaker.stats() for endpoint, breaker in breakers.items()}
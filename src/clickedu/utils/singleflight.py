@@ -0,0 +1,80 @@
+"""
+Request coalescing for ClickEdu API client.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from .deadline import wait_budget
+
+
+class _Call:
+    """An in-flight call whose outcome is shared with waiting callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls into one.
+
+    While a call for a key is in flight, other callers asking for the same
+    key wait for it and receive the same result or exception instead of
+    issuing their own request. A waiting caller gives up with
+    DeadlineExceededError when its own deadline passes first.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Function performing the call
+
+        Returns:
+            The result of the (possibly shared) call
+
+        Raises:
+            DeadlineExceededError: If the caller's deadline passes while waiting for another caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            while not call.done.is_set():
+                call.done.wait(wait_budget("waiting for a shared request"))
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's request."""
+        with self._lock:
+            return self._coalesced
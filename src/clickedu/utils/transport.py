@@ -0,0 +1,319 @@
+"""
+Shared HTTP transport for ClickEdu API client.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from ..exceptions import CircuitOpenError, DeadlineExceededError
+from .blob_store import BlobStore
+from .deadline import current_deadline
+from .rate_limit import HostLimitStats, RateLimiter, parse_retry_after
+from .retry import BreakerStats, CircuitBreakers, RetryPolicy
+
+
+@dataclass
+class TransportStats:
+    """Snapshot of connection reuse statistics."""
+    requests: int = 0
+    new_connections: int = 0
+    requests_by_host: Dict[str, int] = field(default_factory=dict)
+    connections_by_host: Dict[str, int] = field(default_factory=dict)
+    retries: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests served over an already open connection."""
+        return max(0, self.requests - self.new_connections)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that did not need a new connection."""
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+
+class _StatsRecorder:
+    """Thread-safe counters shared by an adapter and its connection pools."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = TransportStats()
+
+    def record_request(self, host: str) -> None:
+        with self._lock:
+            self._stats.requests += 1
+            self._stats.requests_by_host[host] = self._stats.requests_by_host.get(host, 0) + 1
+
+    def record_connection(self, host: str) -> None:
+        with self._lock:
+            self._stats.new_connections += 1
+            self._stats.connections_by_host[host] = self._stats.connections_by_host.get(host, 0) + 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self._stats.retries += 1
+
+    def snapshot(self) -> TransportStats:
+        with self._lock:
+            return TransportStats(
+                requests=self._stats.requests,
+                new_connections=self._stats.new_connections,
+                requests_by_host=dict(self._stats.requests_by_host),
+                connections_by_host=dict(self._stats.connections_by_host),
+                retries=self._stats.retries,
+            )
+
+
+def endpoint_key(host: str, path: str) -> str:
+    """
+    Endpoint class of a request, used to key circuit breakers and in messages.
+
+    API calls are keyed by their ``/ws/*.php`` script. Files under
+    ``/private/`` share one key per host, since their paths are unbounded and
+    embed the consumer secret and session tokens; other paths are reduced to
+    their first segment.
+    """
+    if path.startswith("/ws/"):
+        return f"{host}{path}"
+    first = path.lstrip("/").split("/", 1)[0]
+    return f"{host}/{first}" if first else host
+
+
+def _counting_pool(base, recorder: _StatsRecorder):
+    """Create a connection pool class that counts newly opened connections."""
+
+    class CountingPool(base):
+        def _new_conn(self):
+            recorder.record_connection(self.host)
+            return super()._new_conn()
+
+    return CountingPool
+
+
+class _TransportAdapter(HTTPAdapter):
+    """
+    HTTP adapter applying the transport policies to every request.
+
+    Records per-host request and connection counts, caps timeouts by the
+    active deadline, and applies the optional rate limiter, retry policy and
+    per-endpoint circuit breakers.
+    """
+
+    def __init__(self, recorder: _StatsRecorder, rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breakers: Optional[CircuitBreakers] = None, **kwargs):
+        self._recorder = recorder
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._circuit_breakers = circuit_breakers
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self._recorder),
+            "https": _counting_pool(HTTPSConnectionPool, self._recorder),
+        }
+
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        host = parsed.hostname or ""
+        endpoint = endpoint_key(host, parsed.path)
+        breaker = self._circuit_breakers.for_endpoint(endpoint) if self._circuit_breakers else None
+        policy = self._retry_policy
+        deadline = current_deadline()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            # Checked before the breaker so an expired deadline never takes a half-open trial slot
+            if deadline is not None:
+                deadline.check(f"request to {endpoint}")
+                kwargs["timeout"] = deadline.cap(kwargs.get("timeout"))
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(endpoint, breaker.retry_in())
+
+            try:
+                response = self._send_once(host, request, **kwargs)
+            except requests.exceptions.RequestException as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if deadline is not None and deadline.expired:
+                    raise DeadlineExceededError(f"Deadline of {deadline.budget:.1f}s exceeded "
+                                                f"during request to {endpoint}: {e}") from e
+                delay = None
+                if policy is not None and policy.should_retry_error(request.method, parsed.path, e):
+                    delay = policy.delay(attempt)
+                if not self._can_retry(delay, breaker, deadline):
+                    raise
+                self._recorder.record_retry()
+                time.sleep(delay)
+                continue
+            except BaseException:
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
+
+            unhealthy = response.status_code >= 500 or response.status_code == 429
+            if breaker is not None:
+                if unhealthy:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+            delay = None
+            if policy is not None and policy.should_retry_status(request.method, parsed.path, response.status_code):
+                delay = policy.delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+            if not self._can_retry(delay, breaker, deadline):
+                return response
+            response.close()
+            self._recorder.record_retry()
+            time.sleep(delay)
+
+    @staticmethod
+    def _can_retry(delay: Optional[float], breaker, deadline) -> bool:
+        """Whether to retry after ``delay``, given the breaker state and remaining deadline."""
+        if delay is None:
+            return False
+        if breaker is not None and breaker.state != breaker.CLOSED:
+            return False
+        return deadline is None or delay < deadline.remaining
+
+    def _send_once(self, host: str, request, **kwargs):
+        """Send one attempt, holding a rate limiter slot for its duration."""
+        self._recorder.record_request(host)
+        if self._rate_limiter is None:
+            return super().send(request, **kwargs)
+
+        limiter = self._rate_limiter.for_host(host)
+        limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            limiter.release(time.monotonic() - start)
+            raise
+        # Streamed bodies are still downloading here; the slot covers the time to headers
+        limiter.release(time.monotonic() - start, response.status_code,
+                        parse_retry_after(response.headers.get("Retry-After")))
+        return response
+
+
+class Transport:
+    """
+    HTTP transport shared by every ClickEdu component.
+
+    Owns a single ``requests.Session`` whose connection pools are reused by
+    AuthApi, ClickeduApi, QueryApi and FileHandler, so connections opened
+    during login stay warm for later queries and downloads. It also carries
+    the blob store deduplicating downloads, shared by every transport
+    configured with the same directory.
+    """
+
+    def __init__(
+        self,
+        config=None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        blob_store: Optional[BlobStore] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            config: Configuration object providing defaults for the options below
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum connections kept open per host
+            max_retries: Connection-level retries for failed connects and reads; ignored
+                when a retry policy is set, which then retries those failures itself
+            retry_backoff: Backoff factor between connection-level retries
+            keep_alive: Keep connections open between requests
+            rate_limiter: Per-host rate and concurrency limiter applied to every
+                request (built from the config when rate limiting is enabled there)
+            retry_policy: Policy retrying failed requests (built from the config
+                when retry attempts are configured)
+            circuit_breakers: Per-endpoint circuit breakers (built from the config
+                when a breaker threshold is configured)
+            blob_store: Store deduplicating downloaded files (the process-wide store of
+                the configured directory when a blob store directory is configured)
+        """
+        self.pool_connections = pool_connections if pool_connections is not None else getattr(config, "pool_connections", 10)
+        self.pool_maxsize = pool_maxsize if pool_maxsize is not None else getattr(config, "pool_maxsize", 10)
+        self.max_retries = max_retries if max_retries is not None else getattr(config, "max_retries", 0)
+        self.retry_backoff = retry_backoff if retry_backoff is not None else getattr(config, "retry_backoff", 0.5)
+        self.keep_alive = keep_alive if keep_alive is not None else getattr(config, "keep_alive", True)
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter.from_config(config)
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy.from_config(config)
+        self.circuit_breakers = (circuit_breakers if circuit_breakers is not None
+                                 else CircuitBreakers.from_config(config))
+        self.blob_store = blob_store if blob_store is not None else BlobStore.from_config(config)
+
+        self._recorder = _StatsRecorder()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": config.get_user_agent() if config is not None else "ClickEdu/Python"
+        })
+        if not self.keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        # A retry policy handles connection failures too, under the breaker, deadline
+        # and POST rules; urllib3 retrying underneath it would multiply the attempts
+        connection_retries = 0 if self.retry_policy is not None else self.max_retries
+        retry = Retry(
+            total=connection_retries,
+            connect=connection_retries,
+            read=connection_retries,
+            status=0,
+            backoff_factor=self.retry_backoff,
+            raise_on_status=False,
+        )
+        adapter = _TransportAdapter(
+            self._recorder,
+            self.rate_limiter,
+            self.retry_policy,
+            self.circuit_breakers,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def stats(self) -> TransportStats:
+        """Get a snapshot of connection reuse statistics."""
+        return self._recorder.snapshot()
+
+    @property
+    def rate_limits(self) -> Dict[str, HostLimitStats]:
+        """Get a snapshot of the per-host rate limiter state (empty if not rate limited)."""
+        if self.rate_limiter is None:
+            return {}
+        return self.rate_limiter.stats()
+
+    @property
+    def breaker_states(self) -> Dict[str, BreakerStats]:
+        """Get a snapshot of the per-endpoint circuit breakers (empty if disabled)."""
+        if self.circuit_breakers is None:
+            return {}
+        return self.circuit_breakers.stats()
+
+    def close(self) -> None:
+        """Close all pooled connections and compact the blob store index."""
+        self.session.close()
+        if self.blob_store is not None:
+            self.blob_store.close()
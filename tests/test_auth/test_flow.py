@@ -5,7 +5,7 @@ Tests for the main authentication flow (get_user function).
 import pytest
 import responses
 from unittest.mock import patch, Mock
-from clickedu import get_user, User
+from clickedu import get_user, User, LoginTimings
 from clickedu.exceptions import APIError, AuthenticationError
 
 
@@ -272,3 +272,88 @@ class TestGetUserFlow:
             
             with pytest.raises(AuthenticationError, match="Unexpected error in authentication flow"):
                 get_user(test_domain, test_credentials["username"], test_credentials["password"])
+
+
+def _add_login_responses(test_domain, token_status=200):
+    """Register mocked responses for every login step."""
+    responses.add(
+        responses.POST,
+        f"https://{test_domain}/ws/app_clickedu_init.php",
+        json={"token": "test_token", "secret": "test_secret"},
+        status=200,
+        headers={"set-cookie": "PHPSESSID=test_session_id; path=/"}
+    )
+    responses.add(
+        responses.GET,
+        f"https://{test_domain}/authorization.php",
+        json={"id_usuari": "test_user_id"},
+        status=200
+    )
+    responses.add(
+        responses.POST,
+        f"https://{test_domain}/ws/app_clickedu_permissions.php",
+        json={"user_id": "test_user_id", "type": 1},
+        status=200
+    )
+    responses.add(
+        responses.POST,
+        "https://api.clickedu.eu/login/v1/auth/token",
+        json={"access_token": "test_access_token"},
+        status=token_status
+    )
+    responses.add(
+        responses.GET,
+        "https://api.clickedu.eu/login/v1/auth/token/validate",
+        json={"id": "test_id", "user_id": 12345},
+        status=200
+    )
+    responses.add(
+        responses.GET,
+        f"https://{test_domain}/ws/app_clickedu_check_token.php",
+        json={"status": "valid"},
+        status=200
+    )
+
+
+class TestConcurrentGetUserFlow:
+    """Test the concurrent get_user authentication flow."""
+    
+    @responses.activate
+    def test_concurrent_get_user_success(self, test_domain, test_credentials):
+        """Test concurrent flow produces the same user as the serial flow."""
+        _add_login_responses(test_domain)
+        
+        timings = LoginTimings()
+        result = get_user(test_domain, test_credentials["username"], test_credentials["password"],
+                          concurrent=True, timings=timings)
+        timings.wait()
+        
+        assert result.id == "test_id"
+        assert result.child_id == "test_user_id"
+        assert result.access_token == "test_access_token"
+        assert result.cookie == "PHPSESSID=test_session_id"
+        assert set(timings.steps) == {
+            "app_clickedu_init", "authorization", "app_clickedu_permissions",
+            "token", "validate", "check_token",
+        }
+        assert timings.total > 0
+    
+    @responses.activate
+    def test_serial_get_user_records_timings(self, test_domain, test_credentials):
+        """Test serial flow records a per-step breakdown."""
+        _add_login_responses(test_domain)
+        
+        timings = LoginTimings()
+        get_user(test_domain, test_credentials["username"], test_credentials["password"], timings=timings)
+        
+        assert len(timings.steps) == 6
+        assert timings.serial_total >= timings.saved
+    
+    @responses.activate
+    def test_concurrent_get_user_token_failure(self, test_domain, test_credentials):
+        """Test concurrent flow surfaces token failures."""
+        _add_login_responses(test_domain, token_status=401)
+        
+        with pytest.raises(AuthenticationError, match="Failed to get access token"):
+            get_user(test_domain, test_credentials["username"], test_credentials["password"],
+                     concurrent=True)
@@ -0,0 +1,217 @@
+"""
+Tests for session stores and session reuse in ClickEduClient.
+"""
+
+import pytest
+import responses
+from clickedu import ClickEduClient, FileSessionStore, QueryApi, SessionStore
+from clickedu.exceptions import APIError
+
+
+class TestFileSessionStore:
+    """Test FileSessionStore class."""
+
+    def test_base_class_is_abstract(self):
+        """Test SessionStore cannot be used without implementing its methods."""
+        with pytest.raises(TypeError):
+            SessionStore()
+
+    def test_save_and_load(self, mock_user, tmp_path):
+        """Test a saved session can be loaded back."""
+        store = FileSessionStore(str(tmp_path))
+        store.save("test.clickedu.eu", "test_user", mock_user)
+
+        assert store.load("test.clickedu.eu", "test_user") == mock_user
+        assert store.load("test.clickedu.eu", "other_user") is None
+        assert store.load("other.clickedu.eu", "test_user") is None
+
+    def test_delete(self, mock_user, tmp_path):
+        """Test deleting a stored session."""
+        store = FileSessionStore(str(tmp_path))
+        store.save("test.clickedu.eu", "test_user", mock_user)
+        store.delete("test.clickedu.eu", "test_user")
+
+        assert store.load("test.clickedu.eu", "test_user") is None
+
+    def test_encryption_hooks(self, mock_user, tmp_path):
+        """Test encryption hooks are applied on save and load."""
+        def xor(data: bytes) -> bytes:
+            return bytes(b ^ 0x5A for b in data)
+
+        store = FileSessionStore(str(tmp_path), encrypt=xor, decrypt=xor)
+        store.save("test.clickedu.eu", "test_user", mock_user)
+
+        path = store._path_for("test.clickedu.eu", "test_user")
+        with open(path, "rb") as f:
+            assert b"test_auth_token" not in f.read()
+        assert store.load("test.clickedu.eu", "test_user") == mock_user
+
+    def test_unreadable_session_is_ignored(self, tmp_path):
+        """Test a corrupt session file is treated as missing."""
+        store = FileSessionStore(str(tmp_path))
+        path = store._path_for("test.clickedu.eu", "test_user")
+        with open(path, "w") as f:
+            f.write("not json")
+
+        assert store.load("test.clickedu.eu", "test_user") is None
+
+    def test_hooks_must_be_paired(self, tmp_path):
+        """Test providing only one encryption hook is rejected."""
+        with pytest.raises(ValueError):
+            FileSessionStore(str(tmp_path), encrypt=lambda data: data)
+
+
+class TestClientSessionReuse:
+    """Test ClickEduClient session reuse."""
+
+    @responses.activate
+    def test_valid_stored_session_skips_login(self, mock_user, tmp_path, test_credentials):
+        """Test a valid stored session is reused without the login flow."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"status": "success"},
+            status=200
+        )
+
+        store = FileSessionStore(str(tmp_path))
+        store.save("test.clickedu.eu", test_credentials["username"], mock_user)
+
+        client = ClickEduClient(session_store=store)
+        user = client.authenticate(test_credentials["username"], test_credentials["password"])
+
+        assert user == mock_user
+        assert client.is_authenticated
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_stored_cookie_is_sent(self, mock_user, tmp_path, test_domain, test_credentials):
+        """Test the stored PHPSESSID cookie is restored on the shared session."""
+        responses.add(
+            responses.GET,
+            f"https://{test_domain}/ws/app_clickedu_query.php",
+            json={"status": "success"},
+            status=200
+        )
+        mock_user.cookie = "PHPSESSID=stored_session_id"
+        store = FileSessionStore(str(tmp_path))
+        store.save(test_domain, test_credentials["username"], mock_user)
+
+        client = ClickEduClient(session_store=store, domain=test_domain)
+        client.authenticate(test_credentials["username"], test_credentials["password"])
+
+        assert responses.calls[0].request.headers["Cookie"] == "PHPSESSID=stored_session_id"
+
+    @responses.activate
+    def test_transient_error_keeps_stored_session(self, mock_user, tmp_path, test_domain, test_credentials):
+        """Test a server error while validating does not delete the stored session."""
+        responses.add(
+            responses.GET,
+            f"https://{test_domain}/ws/app_clickedu_query.php",
+            status=503
+        )
+        responses.add(
+            responses.POST,
+            f"https://{test_domain}/ws/app_clickedu_init.php",
+            status=503
+        )
+        store = FileSessionStore(str(tmp_path))
+        store.save(test_domain, test_credentials["username"], mock_user)
+
+        client = ClickEduClient(session_store=store, domain=test_domain)
+        with pytest.raises(APIError):
+            client.authenticate(test_credentials["username"], test_credentials["password"])
+
+        assert store.load(test_domain, test_credentials["username"]) == mock_user
+
+    @responses.activate
+    def test_validate_session_rejected_on_401(self, mock_user, test_config):
+        """Test a 401 on the validation query reports a rejected session."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"error": "invalid token"},
+            status=401
+        )
+
+        assert QueryApi(mock_user, test_config).validate_session() is False
+
+    @responses.activate
+    def test_rejected_session_is_deleted(self, mock_user, tmp_path, test_domain, test_credentials):
+        """Test a rejected stored session is deleted even if the following login fails."""
+        responses.add(
+            responses.GET,
+            f"https://{test_domain}/ws/app_clickedu_query.php",
+            json={"error": "invalid token"},
+            status=401
+        )
+        responses.add(
+            responses.POST,
+            f"https://{test_domain}/ws/app_clickedu_init.php",
+            status=503
+        )
+        store = FileSessionStore(str(tmp_path))
+        store.save(test_domain, test_credentials["username"], mock_user)
+
+        client = ClickEduClient(session_store=store, domain=test_domain)
+        with pytest.raises(APIError):
+            client.authenticate(test_credentials["username"], test_credentials["password"])
+
+        assert store.load(test_domain, test_credentials["username"]) is None
+
+    @responses.activate
+    def test_rejected_session_falls_back_to_login(self, mock_user, tmp_path, test_domain, test_credentials):
+        """Test a rejected stored session triggers the full login flow."""
+        responses.add(
+            responses.GET,
+            f"https://{test_domain}/ws/app_clickedu_query.php",
+            json={"error": "invalid token"},
+            status=401
+        )
+        responses.add(
+            responses.POST,
+            f"https://{test_domain}/ws/app_clickedu_init.php",
+            json={"token": "new_token", "secret": "new_secret"},
+            status=200,
+            headers={"set-cookie": "PHPSESSID=new_session_id; path=/"}
+        )
+        responses.add(
+            responses.GET,
+            f"https://{test_domain}/authorization.php",
+            json={"id_usuari": "test_user_id"},
+            status=200
+        )
+        responses.add(
+            responses.POST,
+            f"https://{test_domain}/ws/app_clickedu_permissions.php",
+            json={"user_id": "test_user_id", "type": 1},
+            status=200
+        )
+        responses.add(
+            responses.POST,
+            "https://api.clickedu.eu/login/v1/auth/token",
+            json={"access_token": "new_access_token"},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "https://api.clickedu.eu/login/v1/auth/token/validate",
+            json={"id": "test_id", "user_id": 12345},
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            f"https://{test_domain}/ws/app_clickedu_check_token.php",
+            json={"status": "valid"},
+            status=200
+        )
+
+        store = FileSessionStore(str(tmp_path))
+        store.save(test_domain, test_credentials["username"], mock_user)
+
+        client = ClickEduClient(session_store=store)
+        user = client.authenticate(test_credentials["username"], test_credentials["password"])
+
+        assert user.auth_token == "new_token"
+        assert user.cookie == "PHPSESSID=new_session_id"
+        assert store.load(test_domain, test_credentials["username"]) == user
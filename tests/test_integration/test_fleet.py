@@ -0,0 +1,129 @@
+"""
+Tests for the multi-account fleet manager.
+"""
+
+import threading
+import time
+
+import pytest
+import responses
+from clickedu import ClickEduFleet, FleetAccount, NewsResponse
+from clickedu.exceptions import AuthenticationError
+from tests.test_auth.test_flow import _add_login_responses
+
+
+class _FakeClient:
+    """Client stand-in recording logins and concurrency per domain."""
+
+    active = {}
+    peak = {}
+    lock = threading.Lock()
+
+    def __init__(self, domain):
+        self.domain = domain
+        self.user = None
+        self.closed = False
+
+    def authenticate(self, username, password, concurrent=False):
+        with self.lock:
+            self.active[self.domain] = self.active.get(self.domain, 0) + 1
+            self.peak[self.domain] = max(self.peak.get(self.domain, 0), self.active[self.domain])
+        time.sleep(0.02)
+        with self.lock:
+            self.active[self.domain] -= 1
+        if password == "wrong":
+            raise AuthenticationError("Authentication failed")
+        self.user = f"{username}@{self.domain}"
+        return self.user
+
+    def get_news(self, start_limit=0, end_limit=10):
+        return NewsResponse(total=1, news=[])
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_factory():
+    _FakeClient.active.clear()
+    _FakeClient.peak.clear()
+    created = []
+
+    def factory(domain):
+        client = _FakeClient(domain)
+        created.append(client)
+        return client
+
+    factory.created = created
+    return factory
+
+
+class TestClickEduFleet:
+    """Test ClickEduFleet class."""
+
+    def test_authenticate_all_bounded_per_domain(self, fake_factory):
+        """Test bulk login respects the per-domain limit and reports failures."""
+        accounts = [("a.clickedu.eu", f"user{i}", "pw") for i in range(6)]
+        accounts += [("b.clickedu.eu", "user0", "pw"), ("b.clickedu.eu", "bad", "wrong")]
+        fleet = ClickEduFleet(accounts, max_parallel=8, per_domain_limit=2, client_factory=fake_factory)
+
+        batch = fleet.authenticate_all()
+
+        assert len(batch.results) == 7
+        assert isinstance(batch.errors[("b.clickedu.eu", "bad")], AuthenticationError)
+        assert _FakeClient.peak["a.clickedu.eu"] <= 2
+        assert fleet.live_clients == 7
+
+    def test_clients_reused(self, fake_factory):
+        """Test a live client is reused instead of logging in again."""
+        fleet = ClickEduFleet([("a.clickedu.eu", "u", "pw")], client_factory=fake_factory)
+
+        first = fleet.client("a.clickedu.eu", "u")
+        assert fleet.client("a.clickedu.eu", "u") is first
+        assert len(fake_factory.created) == 1
+
+    def test_lru_eviction(self, fake_factory):
+        """Test the least recently used client is closed beyond max_clients."""
+        fleet = ClickEduFleet([("a", "u1", "pw"), ("a", "u2", "pw"), ("a", "u3", "pw")],
+                              max_clients=2, client_factory=fake_factory)
+        first = fleet.client("a", "u1")
+        fleet.client("a", "u2")
+        fleet.client("a", "u1")
+        fleet.client("a", "u3")
+
+        assert fleet.live_clients == 2
+        assert fake_factory.created[1].closed
+        assert not first.closed
+
+    def test_idle_eviction(self, fake_factory):
+        """Test idle clients are closed and re-authenticated on next use."""
+        fleet = ClickEduFleet([FleetAccount("a", "u", "pw")], idle_timeout=0, client_factory=fake_factory)
+        first = fleet.client("a", "u")
+
+        assert fleet.evict_idle() == 1
+        assert first.closed
+        assert fleet.client("a", "u") is not first
+
+    def test_run_aggregates(self, fake_factory):
+        """Test a batch operation returns results keyed by account."""
+        with ClickEduFleet([("a", "u1", "pw"), ("b", "u2", "pw")], client_factory=fake_factory) as fleet:
+            batch = fleet.get_news()
+
+            assert batch.ok
+            assert list(batch.results) == [("a", "u1"), ("b", "u2")]
+        assert all(client.closed for client in fake_factory.created)
+
+    @responses.activate
+    def test_real_clients(self, test_credentials):
+        """Test the default factory authenticates real clients per domain."""
+        for domain in ("one.clickedu.eu", "two.clickedu.eu"):
+            _add_login_responses(domain)
+        fleet = ClickEduFleet([
+            ("one.clickedu.eu", test_credentials["username"], test_credentials["password"]),
+            ("two.clickedu.eu", test_credentials["username"], test_credentials["password"]),
+        ])
+
+        batch = fleet.authenticate_all()
+
+        assert batch.ok
+        assert batch.results[("two.clickedu.eu", test_credentials["username"])].base_url == "two.clickedu.eu"
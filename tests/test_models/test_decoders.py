@@ -0,0 +1,51 @@
+"""
+Tests for compiled model decoders.
+"""
+
+import pytest
+from clickedu import NewsItem, PhotoAlbum, Photo, QueryApi
+from clickedu.models import get_decoder, ModelDecoder
+
+
+class TestModelDecoder:
+    """Test ModelDecoder class."""
+
+    def test_defaults_match_manual_parsing(self):
+        """Test missing keys use "" for required fields and the field default otherwise."""
+        decoder = get_decoder(NewsItem)
+
+        assert decoder({}) == NewsItem(title="")
+        assert decoder({"title": "T", "body": "<p>B</p>"}) == NewsItem(title="T", body="<p>B</p>")
+
+    def test_url_fields_are_rewritten(self):
+        """Test image paths become full URLs while decoding."""
+        decoder = get_decoder(Photo, ("pathLarge", "pathSmall"))
+        photos = decoder.many(
+            [{"id": "1", "pathLarge": "../private/large.jpg", "pathSmall": None}],
+            "https://test.clickedu.eu/private/app-key/"
+        )
+
+        assert photos == [Photo(id="1", pathLarge="https://test.clickedu.eu/private/app-key/large.jpg")]
+
+    def test_matches_fix_images_urls(self, mock_user, test_config):
+        """Test compiled decoding gives the same result as the reflective URL fixer."""
+        query_api = QueryApi(mock_user, test_config)
+        base_url = query_api._get_photo_base_url()
+        data = [
+            {"id": "a1", "name": "Album", "coverImageLarge": "../private/l.jpg", "coverImageSmall": ""},
+            {"id": "a2", "name": "Album 2"},
+        ]
+        manual = [PhotoAlbum(**item) for item in data]
+        expected = query_api._fix_images_urls(manual, ["coverImageLarge", "coverImageSmall"])
+
+        decoder = get_decoder(PhotoAlbum, ("coverImageLarge", "coverImageSmall"))
+        assert decoder.many(data, base_url) == expected
+
+    def test_decoders_are_compiled_once(self):
+        """Test the decoder for a model is cached."""
+        assert get_decoder(Photo, ("pathLarge",)) is get_decoder(Photo, ("pathLarge",))
+
+    def test_unknown_url_field_rejected(self):
+        """Test URL fields must exist on the model."""
+        with pytest.raises(ValueError):
+            ModelDecoder(Photo, ("coverImageLarge",))
@@ -0,0 +1,109 @@
+"""
+Tests for lazily loaded news bodies.
+"""
+
+import json
+
+import pytest
+import responses
+from clickedu import BodySpool, LazyNewsItem, NewsItem, QueryApi
+
+
+class TestLazyNewsItem:
+    """Test LazyNewsItem class."""
+
+    @pytest.mark.parametrize("use_spool", [False, True])
+    def test_body_round_trip(self, use_spool):
+        """Test the body is restored on access, compressed or spooled."""
+        body = "<p>Sortida a la platja — àèò</p>" * 100
+        spool = BodySpool() if use_spool else None
+        item = LazyNewsItem("Title", body=body, spool=spool)
+
+        assert not item.body_loaded
+        assert item.body == body
+        assert item.body_loaded
+
+    def test_release_body(self):
+        """Test a released body is decoded again on next access."""
+        item = LazyNewsItem("Title", body="<p>text</p>")
+        first = item.body
+        item.release_body()
+
+        assert not item.body_loaded
+        assert item.body == first
+
+    def test_read_body_does_not_cache(self):
+        """Test read_body leaves the body unloaded."""
+        item = LazyNewsItem("Title", body="<p>text</p>")
+
+        assert item.read_body() == "<p>text</p>"
+        assert not item.body_loaded
+
+    def test_missing_body(self):
+        """Test an item without body returns None."""
+        assert LazyNewsItem("Title").body is None
+
+    def test_equals_news_item(self):
+        """Test a lazy item compares equal to the eager NewsItem."""
+        data = {"title": "T", "subtitle": "S", "body": "<p>b</p>", "filePath": "../private/f.pdf"}
+        item = LazyNewsItem.from_json(data)
+
+        assert item == NewsItem(**data)
+        assert item.to_news_item() == NewsItem(**data)
+
+    def test_spool_shared_by_items(self):
+        """Test several items share one spool by offset."""
+        with BodySpool() as spool:
+            items = [LazyNewsItem(f"T{i}", body=f"body {i}", spool=spool) for i in range(10)]
+
+            assert spool.size == sum(len(f"body {i}") for i in range(10))
+            assert [item.body for item in reversed(items)] == [f"body {i}" for i in reversed(range(10))]
+        assert spool.closed
+
+
+class TestLazyNewsQueries:
+    """Test the lazy_bodies option of the news queries."""
+
+    @pytest.mark.parametrize("mode", ["memory", "disk"])
+    @responses.activate
+    def test_get_news_lazy(self, mock_user, test_config, mode):
+        """Test get_news returns lazy items with the same content."""
+        news = [{"title": f"News {i}", "body": f"<p>{i}</p>"} for i in range(3)]
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"total": 3, "news": news},
+            status=200
+        )
+
+        result = QueryApi(mock_user, test_config).get_news(0, 3, lazy_bodies=mode)
+
+        assert all(isinstance(item, LazyNewsItem) for item in result.news)
+        assert [item.body for item in result.news] == ["<p>0</p>", "<p>1</p>", "<p>2</p>"]
+
+    @responses.activate
+    def test_iter_news_disk_shares_spool(self, mock_user, test_config):
+        """Test iter_news spools bodies of every page to one file."""
+        def callback(request):
+            from urllib.parse import urlparse, parse_qs
+            query = parse_qs(urlparse(request.url).query)
+            start = int(query["startLimit"][0])
+            end = min(int(query["endLimit"][0]), 12)
+            news = [{"title": f"News {i}", "body": f"<p>{i}</p>"} for i in range(start, end)]
+            return 200, {}, json.dumps({"total": 12, "news": news})
+
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=callback
+        )
+
+        items = list(QueryApi(mock_user, test_config).iter_news(page_size=5, lazy_bodies="disk"))
+
+        assert [item.body for item in items] == [f"<p>{i}</p>" for i in range(12)]
+        assert len({id(item._spool) for item in items}) == 1
+
+    def test_unknown_mode(self, mock_user, test_config):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            next(QueryApi(mock_user, test_config).iter_news(lazy_bodies="cloud"))
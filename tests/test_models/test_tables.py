@@ -0,0 +1,102 @@
+"""
+Tests for compact models and columnar tables.
+"""
+
+import pytest
+import responses
+from clickedu import (
+    Photo, PhotoAlbum, CompactPhoto, CompactPhotoAlbum, CompactNewsItem,
+    PhotoTable, AlbumTable, QueryApi,
+)
+from clickedu.models import StringColumn
+
+
+class TestCompactModels:
+    """Test slotted model variants."""
+
+    @pytest.mark.parametrize("model", [CompactPhoto, CompactPhotoAlbum, CompactNewsItem])
+    def test_no_instance_dict(self, model):
+        """Test compact models carry no per-instance __dict__."""
+        instance = model("x", "y") if model is CompactPhotoAlbum else model("x")
+
+        assert not hasattr(instance, "__dict__")
+
+
+class TestStringColumn:
+    """Test StringColumn class."""
+
+    def test_round_trip(self):
+        """Test values, including None, empty and non-ASCII strings, round-trip."""
+        values = ["a", None, "", "fotos/àlbum.jpg", "z"]
+        column = StringColumn(values)
+
+        assert len(column) == 5
+        assert list(column) == values
+        assert column[-1] == "z"
+
+
+class TestPhotoTable:
+    """Test PhotoTable class."""
+
+    def test_lazy_urls_match_photo_urls(self):
+        """Test full URLs are built on access from the shared base URL."""
+        table = PhotoTable.from_json(
+            [{"id": "1", "pathLarge": "../private/l.jpg", "pathSmall": "../private/s.jpg"}, {"id": "2"}],
+            "https://test.clickedu.eu/private/app-x/"
+        )
+
+        assert len(table) == 2
+        assert table.large_url(0) == "https://test.clickedu.eu/private/app-x/l.jpg"
+        assert table[1] == CompactPhoto(id="2")
+        assert table.to_photos()[0] == Photo(
+            id="1",
+            pathLarge="https://test.clickedu.eu/private/app-x/l.jpg",
+            pathSmall="https://test.clickedu.eu/private/app-x/s.jpg",
+        )
+
+    def test_smaller_than_photo_list(self):
+        """Test the packed columns are far smaller than the full URLs they represent."""
+        base_url = "https://test.clickedu.eu/private/app-" + "k" * 80 + "/"
+        table = PhotoTable(base_url)
+        for i in range(1000):
+            table.append(str(i), f"../private/large/{i}.jpg", f"../private/small/{i}.jpg")
+
+        full_url_bytes = sum(len(table.large_url(i)) + len(table.small_url(i)) for i in range(1000))
+        assert table.nbytes() < full_url_bytes / 2
+
+
+class TestTableQueries:
+    """Test table-returning queries in QueryApi."""
+
+    @responses.activate
+    def test_get_album_photo_table(self, mock_user, test_config):
+        """Test album photos can be fetched as a PhotoTable."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"photos": [{"id": "photo_1", "pathLarge": "../private/l.jpg"}]},
+            status=200
+        )
+
+        query_api = QueryApi(mock_user, test_config)
+        table = query_api.get_album_photo_table("album_1")
+
+        assert table.ids[0] == "photo_1"
+        assert table.large_url(0) == query_api._get_photo_base_url() + "l.jpg"
+
+    @responses.activate
+    def test_get_photo_album_table(self, mock_user, test_config):
+        """Test albums can be fetched as an AlbumTable equal to the regular response."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"albums": [{"id": "album_1", "name": "Album", "coverImageLarge": "../private/c.jpg"}]},
+            status=200
+        )
+
+        query_api = QueryApi(mock_user, test_config)
+        table = query_api.get_photo_album_table()
+
+        assert isinstance(table, AlbumTable)
+        assert table.to_albums() == query_api.get_photo_albums().albums
+        assert isinstance(table.to_albums()[0], PhotoAlbum)
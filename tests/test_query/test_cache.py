@@ -0,0 +1,123 @@
+"""
+Tests for the query response cache.
+"""
+
+import time
+import responses
+from clickedu import QueryApi, QueryCache
+
+
+class TestQueryCache:
+    """Test QueryCache class."""
+
+    def test_get_and_set(self):
+        """Test a stored value is returned until it expires."""
+        cache = QueryCache(default_ttl=0.05)
+        cache.set("key", "/news", {"total": 1})
+
+        assert cache.get("key") == {"total": 1}
+        time.sleep(0.06)
+        assert cache.get("key") is None
+
+        stats = cache.stats
+        assert stats.hits == 1
+        assert stats.misses == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = QueryCache(max_size=2)
+        cache.set("a", "/news", 1)
+        cache.set("b", "/news", 2)
+        cache.get("a")
+        cache.set("c", "/news", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_per_query_ttl(self):
+        """Test a zero TTL disables caching for that query."""
+        cache = QueryCache(ttls={"/news": 0})
+        cache.set("a", "/news", 1)
+        cache.set("b", "/photo_albums", 2)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_invalidate(self):
+        """Test invalidating by query and entirely."""
+        cache = QueryCache()
+        cache.set("a", "/news", 1)
+        cache.set("b", "/photo_albums", 2)
+
+        assert cache.invalidate("/news") == 1
+        assert cache.get("a") is None
+        assert cache.invalidate() == 1
+        assert cache.stats.size == 0
+
+
+class TestQueryApiCaching:
+    """Test caching in QueryApi._default_query."""
+
+    @responses.activate
+    def test_repeated_query_served_from_cache(self, mock_user, test_config):
+        """Test identical queries hit the network once."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"total": 1, "news": [{"title": "Cached"}]},
+            status=200
+        )
+
+        query_api = QueryApi(mock_user, test_config, cache=QueryCache())
+        first = query_api.get_news(0, 10)
+        second = query_api.get_news(0, 10)
+
+        assert first == second
+        assert len(responses.calls) == 1
+        assert query_api.cache.stats.hits == 1
+
+    @responses.activate
+    def test_different_params_not_shared(self, mock_user, test_config):
+        """Test different windows and children get separate entries."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"total": 1, "news": []},
+            status=200
+        )
+
+        query_api = QueryApi(mock_user, test_config, cache=QueryCache())
+        query_api.get_news(0, 10)
+        query_api.get_news(10, 20)
+        mock_user.child_id = "other_child"
+        query_api.get_news(0, 10)
+
+        assert len(responses.calls) == 3
+
+    def test_cache_key_excludes_secrets(self, mock_user, test_config):
+        """Test credentials never end up in cache keys."""
+        query_api = QueryApi(mock_user, test_config, cache=QueryCache())
+        _, params = query_api._get_url_and_default_params()
+        key = query_api._cache_key("/news", {**params, "startLimit": 0})
+
+        assert mock_user.auth_token not in repr(key)
+        assert mock_user.secret_token not in repr(key)
+
+    @responses.activate
+    def test_invalidate_cache(self, mock_user, test_config):
+        """Test invalidation forces a new round trip."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"albums": []},
+            status=200
+        )
+
+        query_api = QueryApi(mock_user, test_config, cache=QueryCache())
+        query_api.get_photo_albums()
+        assert query_api.invalidate_cache("/photo_albums") == 1
+        query_api.get_photo_albums()
+
+        assert len(responses.calls) == 2
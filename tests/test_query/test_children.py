@@ -0,0 +1,103 @@
+"""
+Tests for multi-child queries.
+"""
+
+import json
+from urllib.parse import parse_qs, urlparse
+
+import responses
+from clickedu import NewsItem, NewsResponse, PhotoAlbum, PhotoAlbumsResponse, QueryApi, merge_albums, merge_news
+from clickedu.exceptions import APIError
+
+
+def _children_callback(failing=()):
+    """Serve /news, /photo_albums and /pictures per child; shared items are returned to every child."""
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        child = query["id_fill"][0]
+        if child in failing:
+            return 500, {}, json.dumps({"error": "Server error"})
+        path = query["query"][0]
+        if path == "/news":
+            body = {"total": 2, "news": [{"title": f"{child} news"}, {"title": "School news"}]}
+        elif path == "/photo_albums":
+            body = {"albums": [{"id": f"{child}_album", "name": child}, {"id": "school", "name": "School"}]}
+        else:
+            body = {"photos": [{"id": f"{child}_{query['albumId'][0]}"}]}
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+class TestChildQueries:
+    """Test queries fanned out across children."""
+
+    @responses.activate
+    def test_child_id_overrides_id_fill(self, mock_user, test_config):
+        """Test a child id replaces the default id_fill."""
+        responses.add_callback(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                               callback=_children_callback())
+
+        query_api = QueryApi(mock_user, test_config)
+        query_api.get_news(child_id="child_2")
+        query_api.get_news()
+
+        assert "id_fill=child_2" in responses.calls[0].request.url
+        assert f"id_fill={mock_user.child_id}" in responses.calls[1].request.url
+
+    @responses.activate
+    def test_news_for_children(self, mock_user, test_config):
+        """Test news is fetched per child, with failures reported per child."""
+        responses.add_callback(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                               callback=_children_callback(failing={"c3"}))
+
+        batch = QueryApi(mock_user, test_config).get_news_for_children(["c1", "c2", "c3"])
+
+        assert list(batch.results) == ["c1", "c2"]
+        assert batch.results["c2"].news[0].title == "c2 news"
+        assert isinstance(batch.errors["c3"], APIError)
+
+    @responses.activate
+    def test_merge_news_dedupes_siblings(self, mock_user, test_config):
+        """Test news shared by siblings appears once in the merged result."""
+        responses.add_callback(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                               callback=_children_callback())
+
+        merged = merge_news(QueryApi(mock_user, test_config).get_news_for_children(["c1", "c2"]))
+
+        assert [item.title for item in merged.news] == ["c1 news", "c2 news", "School news"]
+        assert merged.total == 3
+
+    @responses.activate
+    def test_albums_for_children(self, mock_user, test_config):
+        """Test albums and album photos are fetched per child."""
+        responses.add_callback(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                               callback=_children_callback())
+        query_api = QueryApi(mock_user, test_config)
+
+        albums = merge_albums(query_api.get_photo_albums_for_children(["c1", "c2"]))
+        photos = query_api.get_albums_for_children([("c1", "a"), ("c2", "b")])
+
+        assert [album.id for album in albums.albums] == ["c1_album", "school", "c2_album"]
+        assert photos.results[("c2", "b")].photos[0].id == "c2_b"
+
+
+class TestMerge:
+    """Test merging helpers."""
+
+    def test_merge_news_keeps_unique_items(self):
+        """Test merging plain dicts of responses."""
+        merged = merge_news({
+            "a": NewsResponse(total=2, news=[NewsItem("1"), NewsItem("2")]),
+            "b": None,
+            "c": NewsResponse(total=1, news=[NewsItem("2", subtitle="other")]),
+        })
+
+        assert [(item.title, item.subtitle) for item in merged.news] == [("1", None), ("2", "other"), ("2", None)]
+
+    def test_merge_albums_by_id(self):
+        """Test albums are kept once per id."""
+        merged = merge_albums({"a": PhotoAlbumsResponse([PhotoAlbum("1", "x")]),
+                               "b": PhotoAlbumsResponse([PhotoAlbum("1", "x"), PhotoAlbum("2", "y")])})
+
+        assert [album.id for album in merged.albums] == ["1", "2"]
@@ -0,0 +1,154 @@
+"""
+Tests for incremental album mirroring.
+"""
+
+import json
+import os
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+from clickedu import AlbumMirror, QueryApi
+
+
+def _server(albums):
+    """Serve /photo_albums and /pictures from a dict of album id -> photo ids."""
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        if query["query"][0] == "/photo_albums":
+            start, end = int(query["startLimit"][0]), int(query["endLimit"][0])
+            body = {"albums": [{"id": album_id, "name": album_id.upper()} for album_id in albums][start:end]}
+        else:
+            photos = albums[query["albumId"][0]]
+            body = {"photos": [{"id": photo_id, "pathLarge": f"../private/{photo_id}.jpg",
+                                "pathSmall": f"../private/{photo_id}_s.jpg"} for photo_id in photos]}
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+def _setup(mock_user, albums):
+    responses.add_callback(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                           callback=_server(albums))
+    responses.add(responses.GET, re.compile(rf"https://{re.escape(mock_user.base_url)}/private/.*"),
+                  body=b"jpeg", status=200)
+
+
+def _downloads():
+    return [call for call in responses.calls if "/private/" in call.request.url]
+
+
+class TestAlbumMirror:
+    """Test AlbumMirror class."""
+
+    @responses.activate
+    def test_first_sync_downloads_everything(self, mock_user, test_config, tmp_path):
+        """Test the first run downloads every photo and writes the manifest."""
+        _setup(mock_user, {"a1": ["p1", "p2"], "a2": ["p3"]})
+        query_api = QueryApi(mock_user, test_config)
+
+        result = query_api.mirror_albums(str(tmp_path), variants=("large", "small"))
+
+        assert result.ok
+        assert result.new_albums == ["a1", "a2"]
+        assert len(result.downloaded) == 6
+        assert os.path.exists(tmp_path / "a1" / "large" / "p1-p1.jpg")
+        assert os.path.exists(tmp_path / "a2" / "small" / "p3-p3_s.jpg")
+        manifest = json.loads((tmp_path / ".clickedu-mirror.json").read_text())
+        assert set(manifest["albums"]["a1"]["photos"]) == {"p1", "p2"}
+
+    @responses.activate
+    def test_second_sync_downloads_only_new_photos(self, mock_user, test_config, tmp_path):
+        """Test a later run downloads only photos missing from the manifest."""
+        albums = {"a1": ["p1"]}
+        _setup(mock_user, albums)
+        query_api = QueryApi(mock_user, test_config)
+        query_api.mirror_albums(str(tmp_path))
+        albums["a1"].append("p2")
+        albums["a2"] = ["p3"]
+        responses.calls.reset()
+
+        result = AlbumMirror(query_api, str(tmp_path)).sync()
+
+        assert result.new_albums == ["a2"]
+        assert sorted(os.path.basename(path) for path in result.downloaded) == ["p2-p2.jpg", "p3-p3.jpg"]
+        assert len(_downloads()) == 2
+
+    @responses.activate
+    def test_steady_state_lists_albums_only(self, mock_user, test_config, tmp_path):
+        """Test rescan_known=False only lists albums once everything is mirrored."""
+        _setup(mock_user, {"a1": ["p1"]})
+        query_api = QueryApi(mock_user, test_config)
+        query_api.mirror_albums(str(tmp_path))
+        responses.calls.reset()
+
+        result = AlbumMirror(query_api, str(tmp_path), rescan_known=False).sync()
+
+        assert result.downloaded == []
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_prune_removes_deleted_albums_and_photos(self, mock_user, test_config, tmp_path):
+        """Test pruning deletes what the server no longer has."""
+        albums = {"a1": ["p1", "p2"], "a2": ["p3"]}
+        _setup(mock_user, albums)
+        query_api = QueryApi(mock_user, test_config)
+        query_api.mirror_albums(str(tmp_path))
+        del albums["a2"]
+        albums["a1"].remove("p2")
+
+        result = query_api.mirror_albums(str(tmp_path), prune=True)
+
+        assert result.removed_albums == ["a2"]
+        assert result.removed_photos == 1
+        assert not os.path.exists(tmp_path / "a2")
+        assert not os.path.exists(tmp_path / "a1" / "large" / "p2-p2.jpg")
+        assert os.path.exists(tmp_path / "a1" / "large" / "p1-p1.jpg")
+
+    @responses.activate
+    def test_photos_sharing_a_file_name(self, mock_user, test_config, tmp_path):
+        """Test photos whose paths share a base name are saved to distinct files."""
+        def callback(request):
+            query = parse_qs(urlparse(request.url).query)
+            if query["query"][0] == "/photo_albums":
+                body = {"albums": [{"id": "a1", "name": "A1"}]}
+            else:
+                body = {"photos": [{"id": "1", "pathLarge": "../private/cam1/IMG_0001.jpg"},
+                                   {"id": "2", "pathLarge": "../private/cam2/IMG_0001.jpg"}]}
+            return 200, {}, json.dumps(body)
+
+        responses.add_callback(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                               callback=callback)
+        responses.add(responses.GET, re.compile(r".*/cam1/IMG_0001\.jpg"), body=b"one", status=200)
+        responses.add(responses.GET, re.compile(r".*/cam2/IMG_0001\.jpg"), body=b"two", status=200)
+        query_api = QueryApi(mock_user, test_config)
+
+        query_api.mirror_albums(str(tmp_path))
+
+        assert (tmp_path / "a1" / "large" / "1-IMG_0001.jpg").read_bytes() == b"one"
+        assert (tmp_path / "a1" / "large" / "2-IMG_0001.jpg").read_bytes() == b"two"
+
+    @responses.activate
+    def test_unsafe_album_ids(self, mock_user, test_config, tmp_path):
+        """Test album ids that would name the mirror itself or escape it are never used as paths."""
+        albums = {"a1": ["p1"]}
+        _setup(mock_user, albums)
+        query_api = QueryApi(mock_user, test_config)
+        query_api.mirror_albums(str(tmp_path / "mirror"))
+        (tmp_path / "outside").mkdir()
+        albums.clear()
+        albums.update({"": ["p2"], "..": ["p3"], "../outside": ["p4"]})
+
+        result = query_api.mirror_albums(str(tmp_path / "mirror"), prune=True)
+
+        assert set(result.errors) == {"", ".."}
+        assert result.removed_albums == ["a1"]
+        assert (tmp_path / "mirror" / ".clickedu-mirror.json").exists()
+        assert (tmp_path / "mirror" / "..%2Foutside" / "large" / "p4-p4.jpg").exists()
+        assert list((tmp_path / "outside").iterdir()) == []
+
+    def test_unknown_variant(self, mock_user, test_config, tmp_path):
+        """Test unknown variants are rejected."""
+        with pytest.raises(ValueError):
+            AlbumMirror(QueryApi(mock_user, test_config), str(tmp_path), variants=("huge",))
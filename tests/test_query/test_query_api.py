@@ -5,7 +5,7 @@ Tests for QueryApi class.
 import pytest
 import responses
 from unittest.mock import patch, Mock
-from clickedu import QueryApi, InitQueryResponse, NewsResponse, PhotoAlbumsResponse, GetAlbumByIdResponse
+from clickedu import QueryApi, QueryCache, InitQueryResponse, NewsResponse, PhotoAlbumsResponse, GetAlbumByIdResponse
 from clickedu.exceptions import APIError
 
 
@@ -295,3 +295,311 @@ class TestQueryApi:
         result = query_api.download_file("invalid_path")
         
         assert result is None
+
+
+def _paged_news_callback(total, requested_starts=None):
+    """Build a responses callback serving a news archive of ``total`` items."""
+    from urllib.parse import urlparse, parse_qs
+    import json
+    
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        start = int(query["startLimit"][0])
+        end = min(int(query["endLimit"][0]), total)
+        if requested_starts is not None:
+            requested_starts.append(start)
+        news = [{"title": f"News {i}"} for i in range(start, end)]
+        return 200, {}, json.dumps({"total": total, "news": news})
+    
+    return callback
+
+
+class TestIterNews:
+    """Test QueryApi.iter_news pagination."""
+    
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    @responses.activate
+    def test_iter_news_yields_all_pages(self, mock_user, test_config, prefetch):
+        """Test all news items are yielded in order across pages."""
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=_paged_news_callback(23)
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        titles = [item.title for item in query_api.iter_news(page_size=5, prefetch=prefetch)]
+        
+        assert titles == [f"News {i}" for i in range(23)]
+    
+    @responses.activate
+    def test_iter_news_is_lazy(self, mock_user, test_config):
+        """Test stopping early does not fetch the whole archive."""
+        starts = []
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=_paged_news_callback(1000, starts)
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        iterator = query_api.iter_news(page_size=10, prefetch=2)
+        first = [next(iterator) for _ in range(3)]
+        iterator.close()
+        
+        assert [item.title for item in first] == ["News 0", "News 1", "News 2"]
+        assert len(starts) <= 3
+    
+    @responses.activate
+    def test_iter_news_stops_on_empty_page(self, mock_user, test_config):
+        """Test iteration ends when the server returns fewer items than announced."""
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=lambda request: (200, {}, '{"total": 50, "news": []}')
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        assert list(query_api.iter_news(page_size=10)) == []
+    
+    def test_iter_news_rejects_invalid_page_size(self, mock_user, test_config):
+        """Test page_size must be positive."""
+        query_api = QueryApi(mock_user, test_config)
+        with pytest.raises(ValueError):
+            list(query_api.iter_news(page_size=0))
+
+
+class TestFetchAllNews:
+    """Test QueryApi.fetch_all_news parallel fetching."""
+    
+    @responses.activate
+    def test_fetch_all_news_in_order(self, mock_user, test_config):
+        """Test all windows are fetched and reassembled in order."""
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=_paged_news_callback(47)
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        result = query_api.fetch_all_news(concurrency=4, page_size=10)
+        
+        assert result.total == 47
+        assert [item.title for item in result.news] == [f"News {i}" for i in range(47)]
+    
+    @responses.activate
+    def test_fetch_all_news_retries_failed_window(self, mock_user, test_config):
+        """Test a window that fails once is retried."""
+        serve = _paged_news_callback(20)
+        failures = {"count": 0}
+        
+        def callback(request):
+            if "startLimit=10" in request.url and failures["count"] == 0:
+                failures["count"] += 1
+                return 503, {}, "{}"
+            return serve(request)
+        
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=callback
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        result = query_api.fetch_all_news(page_size=10, retry_delay=0)
+        
+        assert failures["count"] == 1
+        assert len(result.news) == 20
+    
+    @responses.activate
+    def test_fetch_all_news_retry_bypasses_cache(self, mock_user, test_config):
+        """Test a short window is fetched again instead of being served from the cache."""
+        import json
+        serve = _paged_news_callback(20)
+        short = {"count": 0}
+        
+        def callback(request):
+            if "startLimit=10" in request.url and short["count"] == 0:
+                short["count"] += 1
+                return 200, {}, json.dumps({"total": 20, "news": [{"title": "News 10"}]})
+            return serve(request)
+        
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=callback
+        )
+        
+        query_api = QueryApi(mock_user, test_config, cache=QueryCache())
+        result = query_api.fetch_all_news(page_size=10, retry_delay=0)
+        
+        assert [item.title for item in result.news] == [f"News {i}" for i in range(20)]
+        assert len(responses.calls) == 3
+    
+    @responses.activate
+    def test_fetch_all_news_raises_after_retries(self, mock_user, test_config):
+        """Test a window that keeps failing raises APIError."""
+        serve = _paged_news_callback(20)
+        
+        def callback(request):
+            if "startLimit=10" in request.url:
+                return 503, {}, "{}"
+            return serve(request)
+        
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=callback
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        with pytest.raises(APIError):
+            query_api.fetch_all_news(page_size=10, retries=1, retry_delay=0)
+
+
+def _albums_callback(failing=()):
+    """Build a responses callback serving one photo per album id."""
+    from urllib.parse import urlparse, parse_qs
+    import json
+    
+    def callback(request):
+        album_id = parse_qs(urlparse(request.url).query)["albumId"][0]
+        if album_id in failing:
+            return 500, {}, "{}"
+        return 200, {}, json.dumps({"photos": [{"id": f"{album_id}_photo"}]})
+    
+    return callback
+
+
+class TestBulkAlbums:
+    """Test concurrent fetching of several albums."""
+    
+    @responses.activate
+    def test_get_albums_by_ids_ordered(self, mock_user, test_config):
+        """Test results are keyed by album id in input order."""
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=_albums_callback()
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        album_ids = [f"album_{i}" for i in range(8)]
+        batch = query_api.get_albums_by_ids(album_ids, max_workers=3)
+        
+        assert batch.ok
+        assert list(batch.results) == album_ids
+        assert batch.results["album_5"].photos[0].id == "album_5_photo"
+    
+    @responses.activate
+    def test_get_albums_by_ids_reports_errors(self, mock_user, test_config):
+        """Test a failing album does not abort the batch."""
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=_albums_callback(failing={"album_1"})
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        batch = query_api.get_albums_by_ids(["album_0", "album_1", "album_2"])
+        
+        assert not batch.ok
+        assert list(batch.results) == ["album_0", "album_2"]
+        assert isinstance(batch.errors["album_1"], APIError)
+    
+    @responses.activate
+    def test_albums_as_completed(self, mock_user, test_config):
+        """Test streaming mode yields every successful album and reports failures."""
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=_albums_callback(failing={"album_2"})
+        )
+        
+        errors = []
+        query_api = QueryApi(mock_user, test_config)
+        results = dict(query_api.albums_by_ids_as_completed(
+            ["album_0", "album_1", "album_2"], on_error=lambda album_id, e: errors.append(album_id)
+        ))
+        
+        assert set(results) == {"album_0", "album_1"}
+        assert errors == ["album_2"]
+    
+    def test_batch_workers_capped_by_config(self, mock_user, test_config):
+        """Test the per-domain cap in the config bounds concurrency."""
+        test_config.max_workers = 2
+        query_api = QueryApi(mock_user, test_config)
+        
+        assert query_api._batch_workers(10, 100) == 2
+        assert query_api._batch_workers(None, 1) == 1
+
+
+class TestStreamingQueries:
+    """Test queries parsed incrementally from streamed responses."""
+    
+    @responses.activate
+    def test_iter_album_photos(self, mock_user, test_config):
+        """Test photos are decoded with full URLs from a streamed body."""
+        photos = [{"id": str(i), "pathLarge": f"../private/large_{i}.jpg", "pathSmall": None} for i in range(100)]
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"photos": photos},
+            status=200
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        result = list(query_api.iter_album_photos("album_1"))
+        
+        assert [photo.id for photo in result] == [str(i) for i in range(100)]
+        assert result[7].pathLarge == query_api._get_photo_base_url() + "large_7.jpg"
+        assert result[7].pathSmall is None
+        assert "albumId=album_1" in responses.calls[0].request.url
+    
+    @responses.activate
+    def test_stream_news(self, mock_user, test_config):
+        """Test news items are decoded from a streamed body."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"total": 2, "news": [{"title": "A"}, {"title": "B", "body": "text"}]},
+            status=200
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        news = list(query_api.stream_news(0, 2))
+        
+        assert [item.title for item in news] == ["A", "B"]
+        assert news[1].body == "text"
+    
+    @responses.activate
+    def test_streaming_http_error(self, mock_user, test_config):
+        """Test an HTTP error is raised as APIError."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            json={"error": "Server error"},
+            status=500
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        with pytest.raises(APIError) as exc_info:
+            list(query_api.iter_album_photos("album_1"))
+        assert exc_info.value.status_code == 500
+    
+    @responses.activate
+    def test_streaming_invalid_json(self, mock_user, test_config):
+        """Test a malformed body is raised as APIError."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            body='{"photos": [{"id": "1"}, {"id":',
+            status=200
+        )
+        
+        query_api = QueryApi(mock_user, test_config)
+        photos = query_api.iter_album_photos("album_1")
+        
+        assert next(photos).id == "1"
+        with pytest.raises(APIError):
+            next(photos)
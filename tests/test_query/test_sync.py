@@ -0,0 +1,117 @@
+"""
+Tests for incremental news synchronisation.
+"""
+
+import json
+from urllib.parse import urlparse, parse_qs
+
+import responses
+from clickedu import QueryApi, QueryCache, NewsItem, NewsSyncer, news_fingerprint
+
+
+class _NewsArchive:
+    """Serve a mutable, newest-first news archive through responses."""
+
+    def __init__(self, titles):
+        self.titles = list(titles)
+        self.requests = 0
+
+    def publish(self, title):
+        self.titles.insert(0, title)
+
+    def __call__(self, request):
+        self.requests += 1
+        query = parse_qs(urlparse(request.url).query)
+        start, end = int(query["startLimit"][0]), int(query["endLimit"][0])
+        news = [{"title": title} for title in self.titles[start:end]]
+        return 200, {}, json.dumps({"total": len(self.titles), "news": news})
+
+
+class TestNewsFingerprint:
+    """Test news_fingerprint function."""
+
+    def test_fingerprint_is_stable(self):
+        """Test equal items share a fingerprint and different items do not."""
+        item = NewsItem(title="A", subtitle="B", filePath="../private/a.pdf")
+
+        assert news_fingerprint(item) == news_fingerprint(NewsItem(title="A", subtitle="B", filePath="../private/a.pdf"))
+        assert news_fingerprint(item) != news_fingerprint(NewsItem(title="A", subtitle="B"))
+
+
+class TestNewsSyncer:
+    """Test NewsSyncer class."""
+
+    @responses.activate
+    def test_sync_returns_only_new_items(self, mock_user, test_config, tmp_path):
+        """Test a second sync returns just the delta and stops early."""
+        archive = _NewsArchive([f"News {i}" for i in range(30)])
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=archive
+        )
+        query_api = QueryApi(mock_user, test_config)
+        state_path = str(tmp_path / "news_state.json")
+
+        first = NewsSyncer(query_api, state_path, page_size=10).sync()
+        assert len(first) == 30
+
+        archive.publish("Breaking")
+        archive.publish("Breaking 2")
+        archive.requests = 0
+        delta = NewsSyncer(query_api, state_path, page_size=10).sync()
+
+        assert [item.title for item in delta] == ["Breaking 2", "Breaking"]
+        assert archive.requests == 1
+
+    @responses.activate
+    def test_sync_without_new_items(self, mock_user, test_config):
+        """Test syncing twice without new content returns nothing."""
+        archive = _NewsArchive(["News 0", "News 1"])
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=archive
+        )
+        syncer = NewsSyncer(QueryApi(mock_user, test_config))
+
+        assert len(syncer.sync()) == 2
+        assert syncer.sync() == []
+
+    @responses.activate
+    def test_sync_bypasses_query_cache(self, mock_user, test_config):
+        """Test a poll within the cache TTL still sees newly published items."""
+        archive = _NewsArchive(["News 0", "News 1"])
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=archive
+        )
+        syncer = NewsSyncer(QueryApi(mock_user, test_config, cache=QueryCache()))
+        syncer.sync()
+
+        archive.publish("Breaking")
+
+        assert [item.title for item in syncer.sync()] == ["Breaking"]
+
+    @responses.activate
+    def test_max_pages_limits_first_sync(self, mock_user, test_config):
+        """Test max_pages bounds how far back a sync reads."""
+        archive = _NewsArchive([f"News {i}" for i in range(100)])
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=archive
+        )
+        syncer = NewsSyncer(QueryApi(mock_user, test_config), page_size=10, max_pages=2)
+
+        assert len(syncer.sync()) == 20
+        assert archive.requests == 2
+
+    def test_unreadable_state_is_ignored(self, mock_user, test_config, tmp_path):
+        """Test a corrupt state file starts from scratch."""
+        state_path = tmp_path / "news_state.json"
+        state_path.write_text("not json")
+
+        syncer = NewsSyncer(QueryApi(mock_user, test_config), str(state_path))
+        assert syncer.known == []
@@ -0,0 +1,169 @@
+"""
+Tests for the content-addressed blob store.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import responses
+from clickedu import Transport
+from clickedu.utils import BlobStore, FileHandler
+
+
+BASE = "https://test.clickedu.eu"
+
+
+class TestBlobStore:
+    """Test BlobStore class."""
+
+    def test_add_deduplicates(self, tmp_path):
+        """Test identical content is stored once."""
+        store = BlobStore(str(tmp_path / "store"))
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.write_bytes(b"same")
+        second.write_bytes(b"same")
+
+        path_a = store.add(str(first), "ab" * 32, "https://x/a")
+        path_b = store.add(str(second), "ab" * 32, "https://x/b")
+
+        assert path_a == path_b == store.path_for("ab" * 32)
+        assert not first.exists() and not second.exists()
+        stats = store.stats
+        assert stats.blobs == 1
+        assert stats.duplicates == 1
+        assert stats.bytes_saved == 4
+
+    def test_index_persists(self, tmp_path):
+        """Test the URL index survives a new store instance."""
+        source = tmp_path / "a"
+        source.write_bytes(b"data")
+        BlobStore(str(tmp_path / "store")).add(str(source), "cd" * 32, "https://x/a")
+
+        store = BlobStore(str(tmp_path / "store"))
+
+        assert store.lookup("https://x/a") == "cd" * 32
+        assert store.forget("https://x/a")
+        assert store.lookup("https://x/a") is None
+
+    def test_concurrent_instances_share_directory(self, tmp_path):
+        """Test several stores over one directory lose neither downloads nor index entries."""
+        root = str(tmp_path / "store")
+        stores = [BlobStore(root, compact_every=50) for _ in range(4)]
+        (tmp_path / "in").mkdir()
+
+        def add_many(n):
+            for i in range(200):
+                source = tmp_path / "in" / f"{n}-{i}"
+                source.write_bytes(f"{n}-{i}".encode())
+                stores[n].add(str(source), f"{n:02x}{i:062x}", f"https://x/{n}/{i}.jpg")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(add_many, range(4)))
+        for store in stores:
+            store.close()
+
+        fresh = BlobStore(root)
+        assert all(fresh.lookup(f"https://x/{n}/{i}.jpg") == f"{n:02x}{i:062x}"
+                   for n in range(4) for i in range(200))
+        assert len(json.loads((tmp_path / "store" / "index.json").read_text())) == 800
+        assert (tmp_path / "store" / "index.journal").read_bytes() == b""
+
+    def test_lookup_sees_other_instance(self, tmp_path):
+        """Test a store finds content added by another store on the same directory."""
+        first, second = BlobStore(str(tmp_path / "store")), BlobStore(str(tmp_path / "store"))
+        source = tmp_path / "a"
+        source.write_bytes(b"data")
+
+        first.add(str(source), "12" * 32, "https://x/a")
+
+        assert second.lookup("https://x/a") == "12" * 32
+        first.close()
+        assert second.forget("https://x/a")
+        assert BlobStore(str(tmp_path / "store")).lookup("https://x/a") is None
+
+    def test_unfinished_journal_line_is_skipped(self, tmp_path):
+        """Test a line cut short by a crash does not corrupt later entries."""
+        store = BlobStore(str(tmp_path / "store"))
+        with open(store.journal_path, "ab") as f:
+            f.write(b'{"key": "x/crashed", "rec')
+        source = tmp_path / "a"
+        source.write_bytes(b"data")
+        store.add(str(source), "34" * 32, "https://x/a")
+
+        assert BlobStore(str(tmp_path / "store")).lookup("https://x/a") == "34" * 32
+
+    def test_shared_store_per_directory(self, tmp_path, test_config):
+        """Test transports configured with one directory share one store."""
+        test_config.blob_store_dir = str(tmp_path / "store")
+
+        first, second = Transport(test_config), Transport(test_config)
+
+        assert first.blob_store is second.blob_store
+        assert first.blob_store is BlobStore.shared(str(tmp_path / "store"))
+
+    def test_link_replaces_destination(self, tmp_path):
+        """Test linking a blob over an existing file."""
+        store = BlobStore(str(tmp_path / "store"))
+        source = tmp_path / "a"
+        source.write_bytes(b"data")
+        store.add(str(source), "ef" * 32)
+        dest = tmp_path / "out.jpg"
+        dest.write_bytes(b"old")
+
+        store.link("ef" * 32, str(dest))
+
+        assert dest.read_bytes() == b"data"
+
+
+class TestFileHandlerBlobStore:
+    """Test FileHandler downloads through a blob store."""
+
+    @responses.activate
+    def test_same_content_stored_once(self, tmp_path):
+        """Test two URLs with the same bytes share one blob."""
+        responses.add(responses.GET, f"{BASE}/private/a.jpg", body=b"photo", status=200)
+        responses.add(responses.GET, f"{BASE}/private/b.jpg", body=b"photo", status=200)
+        store = BlobStore(str(tmp_path / "store"))
+        handler = FileHandler(requests.Session(), BASE, blob_store=store)
+
+        path_a = handler.download_file("../private/a.jpg", str(tmp_path / "news1"))
+        path_b = handler.download_file("../private/b.jpg", str(tmp_path / "news2"))
+
+        assert open(path_a, "rb").read() == open(path_b, "rb").read() == b"photo"
+        assert os.path.samefile(path_a, path_b)
+        assert store.stats.blobs == 1
+
+    @responses.activate
+    def test_repeat_download_is_skipped(self, tmp_path):
+        """Test a URL already in the store is linked without a request."""
+        responses.add(responses.GET, f"{BASE}/private/a.pdf", body=b"pdf", status=200)
+        store = BlobStore(str(tmp_path / "store"))
+        handler = FileHandler(requests.Session(), BASE, blob_store=store)
+        handler.download_file("../private/a.pdf", str(tmp_path / "first"))
+
+        path = handler.download_file("../private/a.pdf", str(tmp_path / "second"))
+
+        assert open(path, "rb").read() == b"pdf"
+        assert len(responses.calls) == 1
+        assert store.stats.skipped_downloads == 1
+
+    @responses.activate
+    def test_index_survives_relogin(self, tmp_path):
+        """Test photo URLs are indexed without their session credentials."""
+        old = f"{BASE}/private/app-KEY-SECRET-TOKEN1-STOKEN1/fotos/1/a.jpg"
+        new = f"{BASE}/private/app-KEY-SECRET-TOKEN2-STOKEN2/fotos/1/a.jpg"
+        responses.add(responses.GET, old, body=b"photo", status=200)
+        store = BlobStore(str(tmp_path / "store"))
+        FileHandler(requests.Session(), BASE, blob_store=store).download_file(old, str(tmp_path / "first"))
+
+        handler = FileHandler(requests.Session(), BASE, blob_store=BlobStore(str(tmp_path / "store")))
+        path = handler.download_file(new, str(tmp_path / "second"))
+
+        assert open(path, "rb").read() == b"photo"
+        assert len(responses.calls) == 1
+        index = (tmp_path / "store" / "index.json").read_text() + \
+            (tmp_path / "store" / "index.journal").read_text()
+        assert "SECRET" not in index and "TOKEN" not in index
+        assert "test.clickedu.eu/fotos/1/a.jpg" in index
@@ -0,0 +1,89 @@
+"""
+Tests for HTTP conditional requests.
+"""
+
+import os
+import responses
+from clickedu import QueryApi, ValidatorStore
+
+
+class TestConditionalQueries:
+    """Test conditional requests in QueryApi."""
+
+    @responses.activate
+    def test_not_modified_reuses_previous_result(self, mock_user, test_config):
+        """Test a 304 response returns the previously parsed result."""
+        url = f"https://{mock_user.base_url}/ws/app_clickedu_query.php"
+        responses.add(
+            responses.GET, url,
+            json={"total": 1, "news": [{"title": "Fresh"}]},
+            status=200,
+            headers={"ETag": '"v1"'}
+        )
+        responses.add(responses.GET, url, status=304)
+
+        query_api = QueryApi(mock_user, test_config, validators=ValidatorStore())
+        first = query_api.get_news()
+        second = query_api.get_news()
+
+        assert second == first
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        stats = query_api.validators.stats
+        assert stats.not_modified == 1
+        assert stats.bytes_saved > 0
+
+    @responses.activate
+    def test_content_hash_fallback(self, mock_user, test_config):
+        """Test unchanged bodies without validators are detected by hash."""
+        url = f"https://{mock_user.base_url}/ws/app_clickedu_query.php"
+        responses.add(responses.GET, url, json={"albums": []}, status=200)
+
+        query_api = QueryApi(mock_user, test_config, validators=ValidatorStore())
+        first = query_api._default_query("/photo_albums")
+        second = query_api._default_query("/photo_albums")
+
+        assert second is first
+        assert "If-None-Match" not in responses.calls[1].request.headers
+        assert query_api.validators.stats.hash_matches == 1
+
+
+class TestConditionalDownloads:
+    """Test conditional requests in FileHandler."""
+
+    @responses.activate
+    def test_not_modified_keeps_local_file(self, mock_user, test_config, tmp_path):
+        """Test a 304 response keeps the previously downloaded file."""
+        url = f"https://{mock_user.base_url}/private/test_file.pdf"
+        responses.add(
+            responses.GET, url,
+            body=b"PDF content",
+            status=200,
+            headers={"Last-Modified": "Wed, 01 Oct 2025 10:00:00 GMT"}
+        )
+        responses.add(responses.GET, url, status=304)
+
+        query_api = QueryApi(mock_user, test_config, validators=ValidatorStore())
+        download_dir = str(tmp_path / "files")
+        first = query_api.download_file("../private/test_file.pdf", download_dir)
+        second = query_api.download_file("../private/test_file.pdf", download_dir)
+
+        assert second == first
+        assert responses.calls[1].request.headers["If-Modified-Since"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+        with open(second, "rb") as f:
+            assert f.read() == b"PDF content"
+        assert query_api.validators.stats.bytes_saved == len(b"PDF content")
+
+    @responses.activate
+    def test_missing_local_file_is_refetched(self, mock_user, test_config, tmp_path):
+        """Test no conditional headers are sent when the local copy is gone."""
+        url = f"https://{mock_user.base_url}/private/test_file.pdf"
+        responses.add(responses.GET, url, body=b"PDF content", status=200, headers={"ETag": '"v1"'})
+
+        query_api = QueryApi(mock_user, test_config, validators=ValidatorStore())
+        download_dir = str(tmp_path / "files")
+        path = query_api.download_file("../private/test_file.pdf", download_dir)
+        os.remove(path)
+        query_api.download_file("../private/test_file.pdf", download_dir)
+
+        assert "If-None-Match" not in responses.calls[1].request.headers
+        assert os.path.exists(path)
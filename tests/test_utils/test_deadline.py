@@ -0,0 +1,118 @@
+"""
+Tests for timeouts and deadline propagation.
+"""
+
+import time
+
+import pytest
+import responses
+from clickedu import Deadline, DeadlineExceededError, QueryApi, RetryPolicy, Transport, get_user
+from clickedu.exceptions import FileDownloadError
+from clickedu.utils import FileHandler, current_deadline, deadline_scope
+
+
+class TestDeadline:
+    """Test Deadline class and scopes."""
+
+    def test_cap_timeout(self):
+        """Test timeouts are capped by the remaining budget."""
+        deadline = Deadline(2.0)
+
+        connect, read = deadline.cap((1.0, 30.0))
+        assert connect == 1.0
+        assert 1.9 < read <= 2.0
+        assert deadline.cap(None)[0] <= 2.0
+
+    def test_expired(self):
+        """Test an expired deadline raises on check."""
+        deadline = Deadline(0)
+
+        assert deadline.expired
+        with pytest.raises(DeadlineExceededError):
+            deadline.check()
+
+    def test_scope_keeps_earlier_deadline(self):
+        """Test nested scopes never extend the enclosing deadline."""
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(60.0) as inner:
+                assert inner is outer
+            with deadline_scope(None) as same:
+                assert same is outer
+        assert current_deadline() is None
+
+
+class TestTimeouts:
+    """Test timeouts passed by every component."""
+
+    def test_timeouts_per_endpoint_class(self, test_config):
+        """Test the config provides a (connect, read) timeout per endpoint class."""
+        test_config.connect_timeout = 3
+        test_config.query_timeout = 12
+
+        assert test_config.timeout_for("query") == (3, 12)
+        with pytest.raises(ValueError):
+            test_config.timeout_for("unknown")
+
+    @responses.activate
+    def test_query_uses_query_timeout(self, mock_user, test_config):
+        """Test queries send the configured timeout."""
+        responses.add(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                      json={"total": 0, "news": []}, status=200)
+
+        QueryApi(mock_user, test_config).get_news()
+
+        assert responses.calls[0].request.req_kwargs["timeout"] == test_config.timeout_for("query")
+
+    @responses.activate
+    def test_deadline_caps_query_timeout(self, mock_user, test_config):
+        """Test a deadline passed to get_news caps the request timeout."""
+        responses.add(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                      json={"total": 0, "news": []}, status=200)
+
+        QueryApi(mock_user, test_config).get_news(deadline=0.5)
+
+        connect, read = responses.calls[0].request.req_kwargs["timeout"]
+        assert connect <= 0.5 and read <= 0.5
+
+    @responses.activate
+    def test_expired_deadline_sends_nothing(self, mock_user, test_config):
+        """Test an expired deadline fails before sending the request."""
+        with pytest.raises(DeadlineExceededError):
+            QueryApi(mock_user, test_config).get_news(deadline=Deadline(0))
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_retries_stop_at_deadline(self, mock_user, test_config):
+        """Test retries that would overrun the deadline are skipped."""
+        responses.add(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+                      status=503, headers={"Retry-After": "5"})
+
+        transport = Transport(test_config, retry_policy=RetryPolicy(max_attempts=5))
+        started = time.monotonic()
+        with pytest.raises(Exception):
+            QueryApi(mock_user, test_config, transport).get_news(deadline=1.0)
+
+        assert time.monotonic() - started < 1.0
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_concurrent_login_propagates_deadline(self, test_domain, test_credentials):
+        """Test login steps running in worker threads share the caller's deadline."""
+        from tests.test_auth.test_flow import _add_login_responses
+        _add_login_responses(test_domain)
+
+        get_user(test_domain, test_credentials["username"], test_credentials["password"],
+                 concurrent=True, deadline=5.0)
+
+        token_call = next(call for call in responses.calls if call.request.url.endswith("/auth/token"))
+        assert token_call.request.req_kwargs["timeout"][1] <= 5.0
+
+    @responses.activate
+    def test_stalled_download(self, tmp_path):
+        """Test a download slower than the minimum speed is aborted."""
+        responses.add(responses.GET, "https://test.clickedu.eu/private/file.pdf", body=b"x" * 100, status=200)
+
+        handler = FileHandler(Transport().session, "https://test.clickedu.eu",
+                              min_speed=10 ** 9, stall_window=0)
+        with pytest.raises(FileDownloadError, match="stalled"):
+            handler.download_file("../private/file.pdf", str(tmp_path))
@@ -0,0 +1,133 @@
+"""
+Tests for concurrent file downloads.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+import responses
+from clickedu import Photo, QueryApi
+from clickedu.exceptions import DeadlineExceededError, FileDownloadError
+from clickedu.utils import ByteBudget, DownloadManager, FileHandler, deadline_scope
+
+
+BASE = "https://test.clickedu.eu"
+
+
+def _handler() -> FileHandler:
+    return FileHandler(requests.Session(), BASE)
+
+
+class TestByteBudget:
+    """Test ByteBudget class."""
+
+    def test_reserve_waits_for_release(self):
+        """Test a reservation blocks until enough bytes are released."""
+        budget = ByteBudget(100)
+        entered = threading.Event()
+
+        def second():
+            with budget.reserve(60):
+                entered.set()
+
+        with budget.reserve(60):
+            thread = threading.Thread(target=second)
+            thread.start()
+            assert not entered.wait(0.05)
+            assert budget.reserved == 60
+        thread.join(1)
+        assert entered.is_set()
+        assert budget.reserved == 0
+
+    def test_reserve_honours_deadline(self):
+        """Test a reservation waiting for bytes gives up when the deadline passes."""
+        budget = ByteBudget(100)
+
+        with budget.reserve(60):
+            with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+                with budget.reserve(60):
+                    pass
+
+        assert budget.reserved == 0
+
+    def test_oversized_reservation_is_capped(self):
+        """Test a file larger than the budget still runs alone."""
+        budget = ByteBudget(100)
+
+        with budget.reserve(1000) as reserved:
+            assert reserved == 100
+        with budget.reserve(None) as reserved:
+            assert reserved == 0
+
+
+class TestDownloadManager:
+    """Test DownloadManager class."""
+
+    @responses.activate
+    def test_download_collects_results_and_errors(self, tmp_path):
+        """Test results are returned in input order and failures are aggregated."""
+        responses.add(responses.GET, f"{BASE}/private/a.jpg", body=b"aaaa", status=200)
+        responses.add(responses.GET, f"{BASE}/private/b.jpg", status=404)
+        responses.add(responses.GET, f"{BASE}/private/c.jpg", body=b"cc", status=200)
+        manager = DownloadManager(_handler(), max_workers=3)
+
+        batch = manager.download(["../private/a.jpg", "../private/b.jpg", "../private/c.jpg"], str(tmp_path))
+
+        assert list(batch.results) == ["../private/a.jpg", "../private/c.jpg"]
+        assert open(batch.results["../private/a.jpg"], "rb").read() == b"aaaa"
+        assert isinstance(batch.errors["../private/b.jpg"], FileDownloadError)
+        assert not batch.ok
+
+    @responses.activate
+    def test_download_photos_and_progress(self, tmp_path):
+        """Test Photo objects are downloaded in the requested variant with progress reports."""
+        responses.add(responses.GET, f"{BASE}/private/small.jpg", body=b"x" * 10, status=200,
+                      headers={"Content-Length": "10"})
+        photos = [Photo(id="1", pathLarge=f"{BASE}/private/large.jpg", pathSmall=f"{BASE}/private/small.jpg"),
+                  Photo(id="2")]
+        reports = []
+        manager = DownloadManager(_handler(), progress=reports.append)
+
+        batch = manager.download(photos, str(tmp_path), variant="small")
+
+        assert list(batch.results) == [f"{BASE}/private/small.jpg"]
+        assert reports[-1].downloaded == 10
+        assert reports[-1].total == 10
+        with pytest.raises(ValueError):
+            manager.download(photos, str(tmp_path), variant="huge")
+
+    def test_per_host_limit(self, tmp_path):
+        """Test no more than ``per_host`` downloads run against one host."""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        class SlowHandler(FileHandler):
+            def download_file(self, file_path, download_dir="files", progress=None, budget=None, filename=None):
+                with lock:
+                    active.append(file_path)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.remove(file_path)
+                return file_path
+
+        manager = DownloadManager(SlowHandler(None, BASE), max_workers=6, per_host=2)
+
+        batch = manager.download([f"../private/{i}.jpg" for i in range(6)], str(tmp_path))
+
+        assert batch.ok
+        assert max(peak) <= 2
+
+    @responses.activate
+    def test_query_api_download_files(self, mock_user, test_config, tmp_path):
+        """Test QueryApi exposes batch downloads."""
+        responses.add(responses.GET, f"https://{mock_user.base_url}/private/a.pdf", body=b"pdf", status=200)
+        query_api = QueryApi(mock_user, test_config)
+
+        batch = query_api.download_files(["../private/a.pdf", "../private/a.pdf"], str(tmp_path))
+
+        assert list(batch.results) == ["../private/a.pdf"]
+        assert len(responses.calls) == 1
@@ -0,0 +1,224 @@
+"""
+Tests for resumable file downloads.
+"""
+
+import gzip
+import io
+import json
+import time
+
+import pytest
+import requests
+import responses
+from clickedu.exceptions import FileDownloadError
+from clickedu.utils import FileHandler
+
+
+BASE = "https://test.clickedu.eu"
+URL = f"{BASE}/private/big.jpg"
+DATA = bytes(range(256)) * 4
+
+
+class _Interrupted(io.RawIOBase):
+    """Response body that fails after ``limit`` bytes, like a dropped connection."""
+
+    def __init__(self, data: bytes, limit: int):
+        self.data = data[:limit]
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self.data:
+            raise requests.exceptions.ConnectionError("connection reset")
+        n = min(len(buffer), len(self.data))
+        buffer[:n] = self.data[:n]
+        self.data = self.data[n:]
+        return n
+
+
+def _write_checkpoint(tmp_path, offset, etag='"v1"'):
+    part = tmp_path / "big.jpg.part"
+    part.write_bytes(DATA[:offset])
+    (tmp_path / "big.jpg.part.json").write_text(
+        json.dumps({"url": URL, "length": len(DATA), "etag": etag, "last_modified": None}))
+    return part
+
+
+class TestResumableDownloads:
+    """Test FileHandler part files and Range requests."""
+
+    @responses.activate
+    def test_interrupted_download_keeps_checkpoint(self, tmp_path):
+        """Test an interrupted download leaves a part file and its sidecar, not a truncated file."""
+        responses.add(responses.GET, URL, body=io.BufferedReader(_Interrupted(DATA, 100)), status=200,
+                      headers={"ETag": '"v1"', "Content-Length": str(len(DATA))},
+                      auto_calculate_content_length=False)
+        handler = FileHandler(requests.Session(), BASE, chunk_size=50)
+
+        with pytest.raises(FileDownloadError):
+            handler.download_file(URL, str(tmp_path))
+
+        assert not (tmp_path / "big.jpg").exists()
+        assert (tmp_path / "big.jpg.part").read_bytes() == DATA[:100]
+        checkpoint = json.loads((tmp_path / "big.jpg.part.json").read_text())
+        assert checkpoint["length"] == len(DATA)
+        assert checkpoint["etag"] == '"v1"'
+
+    @responses.activate
+    def test_resume_with_range(self, tmp_path):
+        """Test a checkpointed download continues from the part file."""
+        _write_checkpoint(tmp_path, 100)
+        responses.add(responses.GET, URL, body=DATA[100:], status=206, headers={
+            "ETag": '"v1"', "Content-Range": f"bytes 100-{len(DATA) - 1}/{len(DATA)}"})
+        handler = FileHandler(requests.Session(), BASE)
+
+        path = handler.download_file(URL, str(tmp_path))
+
+        request = responses.calls[0].request
+        assert request.headers["Range"] == "bytes=100-"
+        assert request.headers["If-Range"] == '"v1"'
+        assert open(path, "rb").read() == DATA
+        assert not (tmp_path / "big.jpg.part").exists()
+        assert not (tmp_path / "big.jpg.part.json").exists()
+
+    @responses.activate
+    def test_changed_file_falls_back_to_full_fetch(self, tmp_path):
+        """Test a 200 answer to If-Range replaces the stale part file."""
+        _write_checkpoint(tmp_path, 100)
+        responses.add(responses.GET, URL, body=b"new version", status=200, headers={"ETag": '"v2"'})
+        handler = FileHandler(requests.Session(), BASE)
+
+        path = handler.download_file(URL, str(tmp_path))
+
+        assert open(path, "rb").read() == b"new version"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_wrong_range_refetches(self, tmp_path):
+        """Test a 206 for another offset is discarded and the whole file fetched."""
+        _write_checkpoint(tmp_path, 100)
+        responses.add(responses.GET, URL, body=DATA[50:], status=206, headers={
+            "ETag": '"v1"', "Content-Range": f"bytes 50-{len(DATA) - 1}/{len(DATA)}"})
+        responses.add(responses.GET, URL, body=DATA, status=200, headers={"ETag": '"v1"'})
+        handler = FileHandler(requests.Session(), BASE)
+
+        path = handler.download_file(URL, str(tmp_path))
+
+        assert open(path, "rb").read() == DATA
+        assert "Range" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_no_validators_no_checkpoint(self, tmp_path):
+        """Test downloads without validators are not resumed."""
+        _write_checkpoint(tmp_path, 100, etag=None)
+        responses.add(responses.GET, URL, body=DATA, status=200)
+        handler = FileHandler(requests.Session(), BASE)
+
+        handler.download_file(URL, str(tmp_path))
+
+        assert "Range" not in responses.calls[0].request.headers
+        assert not (tmp_path / "big.jpg.part.json").exists()
+
+
+class TestStreamingDownloads:
+    """Test downloads that bypass the filesystem."""
+
+    @responses.activate
+    def test_iter_file(self, tmp_path):
+        """Test iter_file yields the body in chunks."""
+        responses.add(responses.GET, URL, body=DATA, status=200)
+        handler = FileHandler(requests.Session(), BASE)
+
+        chunks = list(handler.iter_file(URL, chunk_size=100))
+
+        assert b"".join(chunks) == DATA
+        assert max(len(chunk) for chunk in chunks) == 100
+        assert not list(tmp_path.iterdir())
+
+    @responses.activate
+    def test_iter_file_error(self):
+        """Test HTTP errors are raised when the download is started."""
+        responses.add(responses.GET, URL, status=404)
+        handler = FileHandler(requests.Session(), BASE)
+
+        with pytest.raises(FileDownloadError):
+            handler.iter_file(URL)
+
+    @responses.activate
+    def test_open_file_readinto(self):
+        """Test open_file reads into a caller-supplied buffer."""
+        responses.add(responses.GET, URL, body=DATA, status=200,
+                      headers={"Content-Length": str(len(DATA))})
+        handler = FileHandler(requests.Session(), BASE)
+        buffer = bytearray(300)
+        received = bytearray()
+
+        with handler.open_file(URL) as f:
+            assert f.raw.length == len(DATA)
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                received += buffer[:n]
+
+        assert bytes(received) == DATA
+        assert f.closed
+
+    @responses.activate
+    def test_slow_consumer_is_not_a_stall(self):
+        """Test time spent by the caller between reads does not count as slow download speed."""
+        responses.add(responses.GET, URL, body=DATA, status=200)
+        handler = FileHandler(requests.Session(), BASE, min_speed=1_000_000, stall_window=0.05)
+        received = b""
+
+        for chunk in handler.iter_file(URL, chunk_size=128):
+            time.sleep(0.02)
+            received += chunk
+
+        assert received == DATA
+
+    @responses.activate
+    def test_open_file_read(self):
+        """Test open_file behaves like a binary file."""
+        responses.add(responses.GET, URL, body=DATA, status=200)
+        handler = FileHandler(requests.Session(), BASE, chunk_size=64)
+
+        with handler.open_file(URL) as f:
+            head = f.read(10)
+            rest = f.read()
+
+        assert head + rest == DATA
+
+
+class TestEncodedDownloads:
+    """Test downloads of bodies sent with a Content-Encoding."""
+
+    @responses.activate
+    def test_gzip_body_is_not_checked_or_checkpointed(self, tmp_path):
+        """Test a gzip-encoded body is saved decoded, without length check or checkpoint."""
+        encoded = gzip.compress(DATA * 10)
+        responses.add(responses.GET, URL, body=encoded, status=200, headers={
+            "Content-Encoding": "gzip", "Content-Length": str(len(encoded)), "ETag": '"v1"'})
+        handler = FileHandler(requests.Session(), BASE)
+
+        path = handler.download_file(URL, str(tmp_path))
+
+        assert open(path, "rb").read() == DATA * 10
+        assert responses.calls[0].request.headers["Accept-Encoding"] == "identity"
+        assert not (tmp_path / "big.jpg.part.json").exists()
+
+    @responses.activate
+    def test_encoded_range_response_refetches(self, tmp_path):
+        """Test an encoded 206 is not appended to the decoded part file."""
+        _write_checkpoint(tmp_path, 100)
+        responses.add(responses.GET, URL, body=gzip.compress(DATA[100:]), status=206, headers={
+            "ETag": '"v1"', "Content-Encoding": "gzip",
+            "Content-Range": f"bytes 100-{len(DATA) - 1}/{len(DATA)}"})
+        responses.add(responses.GET, URL, body=DATA, status=200, headers={"ETag": '"v1"'})
+        handler = FileHandler(requests.Session(), BASE)
+
+        path = handler.download_file(URL, str(tmp_path))
+
+        assert open(path, "rb").read() == DATA
+        assert len(responses.calls) == 2
@@ -0,0 +1,86 @@
+"""
+Tests for pluggable JSON decoding.
+"""
+
+import json
+
+import pytest
+import responses
+from clickedu import ClickEduClient, QueryApi
+from clickedu.exceptions import APIError, ConfigurationError
+from clickedu.utils import get_json_loads
+
+
+class TestJsonBackend:
+    """Test JSON backend selection."""
+
+    def test_stdlib_backend(self):
+        """Test the standard library backend decodes bytes."""
+        loads = get_json_loads("json")
+
+        assert loads is json.loads
+        assert loads(b'{"a": 1}') == {"a": 1}
+
+    def test_auto_backend_always_available(self):
+        """Test "auto" falls back to an installed decoder."""
+        assert get_json_loads("auto")('{"title": "Notícia"}'.encode("utf-8")) == {"title": "Notícia"}
+
+    def test_callable_backend(self):
+        """Test a callable is used as-is."""
+        def loads(data):
+            return {"custom": True}
+
+        assert get_json_loads(loads) is loads
+
+    def test_unknown_backend(self):
+        """Test an unknown backend name is rejected."""
+        with pytest.raises(ValueError):
+            get_json_loads("yaml")
+
+
+class TestJsonDecodingInQueries:
+    """Test the configured decoder is used for API responses."""
+
+    @responses.activate
+    def test_configured_decoder_is_used(self, mock_user, test_config):
+        """Test QueryApi decodes responses with the configured backend."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            body=b'{"total": 0, "news": []}',
+            status=200
+        )
+        seen = []
+
+        def loads(data):
+            seen.append(data)
+            return json.loads(data)
+
+        test_config.json_backend = loads
+        QueryApi(mock_user, test_config).get_news()
+
+        assert seen == [b'{"total": 0, "news": []}']
+
+    @responses.activate
+    def test_invalid_json_raises_api_error(self, mock_user, test_config):
+        """Test malformed bodies still surface as APIError."""
+        responses.add(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            body=b"<html>not json</html>",
+            status=200
+        )
+
+        with pytest.raises(APIError, match="Failed to execute query"):
+            QueryApi(mock_user, test_config).get_news()
+
+    def test_invalid_backend_rejected_on_construction(self):
+        """Test an unknown backend name fails when the client is built, not on the first query."""
+        with pytest.raises(ConfigurationError, match="orjsn"):
+            ClickEduClient(json_backend="orjsn")
+
+    def test_client_json_backend_option(self):
+        """Test the client option overrides the configured backend."""
+        client = ClickEduClient(json_backend="json")
+
+        assert client.config.json_loads is json.loads
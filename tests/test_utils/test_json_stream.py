@@ -0,0 +1,60 @@
+"""
+Tests for incremental JSON parsing.
+"""
+
+import json
+
+import pytest
+from clickedu.utils import iter_json_array
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    """Test streaming the items of a top-level array."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 100000])
+    def test_items_match_full_parse(self, chunk_size):
+        """Test items are identical to a full parse for any chunk boundaries."""
+        document = {
+            "total": 3,
+            "meta": {"photos": [0], "note": 'tricky "photos": ['},
+            "photos": [{"id": str(i), "pathLarge": "../private/àlbum/" + "é" * i} for i in range(50)]
+            + [12345, -2.5e-7, 1.5e3, "s", None, True, [1, [2]]],
+            "after": 1,
+        }
+        data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+        assert list(iter_json_array(_chunks(data, chunk_size), "photos")) == document["photos"]
+
+    def test_empty_array(self):
+        """Test an empty array yields nothing."""
+        assert list(iter_json_array([b'{"news": [ ]}'], "news")) == []
+
+    def test_items_yielded_before_stream_ends(self):
+        """Test the first item is available before the rest of the body arrives."""
+        def chunks():
+            yield b'{"photos": [{"id": "1"}, '
+            raise AssertionError("read past the first item")
+
+        assert next(iter_json_array(chunks(), "photos")) == {"id": "1"}
+
+    def test_missing_key(self):
+        """Test a missing key raises ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"albums": []}'], "photos"))
+
+    def test_truncated_body(self):
+        """Test a truncated body raises ValueError after the complete items."""
+        items = iter_json_array([b'{"photos": [{"id": "1"}, {"id": '], "photos")
+
+        assert next(items) == {"id": "1"}
+        with pytest.raises(ValueError):
+            next(items)
+
+    def test_missing_separator(self):
+        """Test items without a separating comma are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"photos": [1 2]}'], "photos"))
@@ -0,0 +1,181 @@
+"""
+Tests for adaptive client-side rate limiting.
+"""
+
+import threading
+import time
+
+import pytest
+import responses
+from clickedu import RateLimiter, Transport
+from clickedu.exceptions import DeadlineExceededError
+from clickedu.utils import AIMDController, TokenBucket, deadline_scope
+from clickedu.utils.rate_limit import HostLimiter
+
+
+class TestTokenBucket:
+    """Test TokenBucket class."""
+
+    def test_burst_then_wait(self):
+        """Test the burst is served immediately and further tokens wait."""
+        bucket = TokenBucket(rate=100, burst=3)
+
+        assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.try_acquire() > 0
+
+    def test_acquire_waits_for_refill(self):
+        """Test acquire blocks until a token is refilled."""
+        bucket = TokenBucket(rate=50, burst=1)
+        bucket.acquire()
+
+        assert bucket.acquire() > 0
+
+    def test_pause(self):
+        """Test pause withholds tokens."""
+        bucket = TokenBucket(rate=1000, burst=10)
+        bucket.pause(0.5)
+
+        assert bucket.try_acquire() > 0.4
+
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestAIMDController:
+    """Test AIMDController class."""
+
+    def test_healthy_responses_grow_window(self):
+        """Test the window grows additively while responses are healthy."""
+        controller = AIMDController(initial=2, maximum=8)
+        for _ in range(20):
+            controller.acquire()
+            controller.release(latency=0.01)
+
+        assert 2 < controller.limit <= 8
+
+    def test_throttling_halves_window(self):
+        """Test a throttling response halves the window."""
+        controller = AIMDController(initial=8, maximum=8)
+        controller.acquire()
+        controller.release(latency=0.01, throttled=True)
+
+        assert controller.limit == 4
+
+    def test_decrease_once_per_cooldown(self):
+        """Test a burst of failures counts as a single congestion signal."""
+        controller = AIMDController(initial=8, maximum=8, cooldown=60)
+        for _ in range(4):
+            controller.acquire()
+        for _ in range(4):
+            controller.release(throttled=True)
+
+        assert controller.limit == 4
+
+    def test_latency_increase_is_congestion(self):
+        """Test a latency well above the baseline shrinks the window."""
+        controller = AIMDController(initial=8, maximum=8, latency_factor=3.0)
+        for _ in range(5):
+            controller.acquire()
+            controller.release(latency=0.01)
+        controller.acquire()
+
+        assert controller.release(latency=1.0)
+        assert controller.limit == 4
+
+    def test_baseline_adapts_to_slower_healthy_latency(self):
+        """Test a sustained slower latency stops counting as congestion."""
+        controller = AIMDController(initial=4, maximum=8, latency_factor=3.0, cooldown=0)
+        for _ in range(5):
+            controller.acquire()
+            controller.release(latency=0.05)
+        for _ in range(200):
+            controller.acquire()
+            congested = controller.release(latency=0.4)
+
+        assert not congested
+        assert controller.baseline_latency > 0.3
+        assert controller.limit > 1
+
+    def test_acquire_honours_deadline(self):
+        """Test waiting for a slot gives up when the deadline passes."""
+        controller = AIMDController(initial=1, minimum=1, maximum=1)
+        controller.acquire()
+
+        with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+            controller.acquire()
+
+        assert controller.in_flight == 1
+
+    def test_slot_released_when_token_wait_times_out(self):
+        """Test a deadline hit while waiting for a token frees the concurrency slot."""
+        limiter = HostLimiter(TokenBucket(rate=1, burst=1), AIMDController(initial=2, maximum=2))
+        limiter.acquire()
+
+        with deadline_scope(0.05), pytest.raises(DeadlineExceededError):
+            limiter.acquire()
+
+        assert limiter.controller.in_flight == 1
+
+    def test_window_bounds_concurrency(self):
+        """Test no more than ``limit`` callers hold a slot at once."""
+        controller = AIMDController(initial=2, minimum=1, maximum=2)
+        peak = []
+        active = [0]
+        lock = threading.Lock()
+
+        def worker():
+            controller.acquire()
+            with lock:
+                active[0] += 1
+                peak.append(active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            controller.release(latency=0.02)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+
+
+class TestTransportRateLimit:
+    """Test rate limiting applied by the shared transport."""
+
+    def test_disabled_by_default(self, test_config):
+        """Test the transport is not rate limited unless configured."""
+        transport = Transport(test_config)
+
+        assert transport.rate_limiter is None
+        assert transport.rate_limits == {}
+
+    def test_enabled_from_config(self, test_config):
+        """Test the config enables the limiter."""
+        test_config.rate_limit = 5.0
+        limiter = Transport(test_config).rate_limiter
+
+        assert limiter is not None
+        assert limiter.rate == 5.0
+
+    @responses.activate
+    def test_per_host_throttling(self, test_config):
+        """Test a 429 with Retry-After shrinks only the throttled host's window."""
+        responses.add(responses.GET, "https://school.example/a", status=429, headers={"Retry-After": "0"})
+        responses.add(responses.GET, "https://api.clickedu.eu/b", json={}, status=200)
+
+        limiter = RateLimiter(initial_concurrency=4, max_concurrency=4)
+        transport = Transport(test_config, rate_limiter=limiter)
+        transport.session.get("https://school.example/a")
+        transport.session.get("https://api.clickedu.eu/b")
+
+        stats = transport.rate_limits
+        assert stats["school.example"].concurrency_limit == 2
+        assert stats["school.example"].throttled == 1
+        assert stats["api.clickedu.eu"].concurrency_limit == 4
+        assert stats["api.clickedu.eu"].throttled == 0
+        assert stats["api.clickedu.eu"].in_flight == 0
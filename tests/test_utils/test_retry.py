@@ -0,0 +1,231 @@
+"""
+Tests for retries and circuit breakers.
+"""
+
+import pytest
+import requests
+import responses
+from clickedu import (
+    CircuitBreakers, CircuitOpenError, Deadline, DeadlineExceededError, QueryApi, RetryPolicy, Transport,
+)
+from clickedu.exceptions import APIError
+from clickedu.utils import CircuitBreaker, deadline_scope
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy class."""
+
+    def test_idempotency_defaults(self):
+        """Test GETs are retryable and POSTs only when listed."""
+        policy = RetryPolicy(retry_post_paths=["/ws/app_clickedu_permissions.php"])
+
+        assert policy.should_retry_status("GET", "/ws/app_clickedu_query.php", 503)
+        assert not policy.should_retry_status("GET", "/ws/app_clickedu_query.php", 404)
+        assert not policy.should_retry_status("POST", "/ws/app_clickedu_init.php", 503)
+        assert policy.should_retry_status("POST", "/ws/app_clickedu_permissions.php", 503)
+
+    def test_connect_errors_always_retryable(self):
+        """Test a POST that never reached the server is retried."""
+        policy = RetryPolicy()
+
+        assert policy.should_retry_error("POST", "/ws/app_clickedu_init.php", requests.exceptions.ConnectTimeout())
+        assert not policy.should_retry_error("POST", "/ws/app_clickedu_init.php", requests.exceptions.ReadTimeout())
+        assert policy.should_retry_error("GET", "/ws/app_clickedu_query.php", requests.exceptions.ReadTimeout())
+
+    def test_refused_connection_retryable(self):
+        """Test a POST whose connection was refused is retried, but not one reset mid-request."""
+        from urllib3.exceptions import MaxRetryError, NewConnectionError
+        policy = RetryPolicy()
+        refused = requests.exceptions.ConnectionError(
+            MaxRetryError(None, "/ws/app_clickedu_init.php", NewConnectionError(None, "refused")))
+
+        assert policy.should_retry_error("POST", "/ws/app_clickedu_init.php", refused)
+        assert not policy.should_retry_error("POST", "/ws/app_clickedu_init.php",
+                                             requests.exceptions.ConnectionError("reset"))
+
+    def test_exponential_backoff(self):
+        """Test delays double without jitter and stop after the last attempt."""
+        policy = RetryPolicy(max_attempts=4, backoff=0.5, max_backoff=1.5, jitter=False)
+
+        assert [policy.delay(attempt) for attempt in range(1, 5)] == [0.5, 1.0, 1.5, None]
+
+    def test_jitter_bounded(self):
+        """Test jittered delays stay within the backoff."""
+        policy = RetryPolicy(max_attempts=10, backoff=1.0)
+
+        assert all(0 <= policy.delay(3) <= 4.0 for _ in range(50))
+
+    def test_retry_after(self):
+        """Test Retry-After is honoured unless longer than allowed."""
+        policy = RetryPolicy(max_retry_after=10)
+
+        assert policy.delay(1, retry_after=2.0) == 2.0
+        assert policy.delay(1, retry_after=60.0) is None
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker class."""
+
+    def test_opens_after_threshold(self):
+        """Test consecutive failures open the breaker and reject requests."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state == "open"
+        assert not breaker.allow()
+        assert breaker.stats().rejected == 1
+
+    def test_half_open_trial(self):
+        """Test one trial request is let through after the reset timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_success_resets_failures(self):
+        """Test a success resets the consecutive failure count."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == "closed"
+
+
+QUERY_URL = "https://test.clickedu.eu/ws/app_clickedu_query.php"
+
+
+class TestTransportRetries:
+    """Test retries and breakers applied by the shared transport."""
+
+    @responses.activate
+    def test_get_retried_until_success(self, test_config):
+        """Test a transient 503 is retried transparently."""
+        responses.add(responses.GET, QUERY_URL, status=503)
+        responses.add(responses.GET, QUERY_URL, json={"ok": True}, status=200)
+
+        transport = Transport(test_config, retry_policy=RetryPolicy(max_attempts=3, backoff=0))
+        response = transport.session.get(QUERY_URL)
+
+        assert response.status_code == 200
+        assert transport.stats.retries == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_post_not_retried_by_default(self, test_config):
+        """Test a non-idempotent POST is sent once."""
+        url = "https://test.clickedu.eu/ws/app_clickedu_init.php"
+        responses.add(responses.POST, url, status=503)
+
+        transport = Transport(test_config, retry_policy=RetryPolicy(max_attempts=3, backoff=0))
+
+        assert transport.session.post(url).status_code == 503
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_connection_error_retried(self, test_config):
+        """Test connection errors are retried and re-raised when exhausted."""
+        responses.add(responses.GET, QUERY_URL, body=requests.exceptions.ConnectionError("reset"))
+
+        transport = Transport(test_config, retry_policy=RetryPolicy(max_attempts=3, backoff=0))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            transport.session.get(QUERY_URL)
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_breaker_fails_fast(self, test_config, mock_user):
+        """Test an unhealthy endpoint is rejected without sending requests."""
+        responses.add(responses.GET, f"https://{mock_user.base_url}/ws/app_clickedu_query.php", status=500)
+
+        transport = Transport(test_config, circuit_breakers=CircuitBreakers(failure_threshold=2, reset_timeout=60))
+        query_api = QueryApi(mock_user, test_config, transport)
+        for _ in range(2):
+            with pytest.raises(APIError):
+                query_api.get_news()
+
+        with pytest.raises(CircuitOpenError):
+            query_api.get_news()
+        assert len(responses.calls) == 2
+
+        state = transport.breaker_states[f"{mock_user.base_url}/ws/app_clickedu_query.php"]
+        assert state.state == "open"
+        assert state.rejected == 1
+
+    @responses.activate
+    def test_downloads_share_one_breaker(self, test_config):
+        """Test file URLs, which embed credentials, are keyed by one redacted endpoint class."""
+        base = "https://test.clickedu.eu/private/app-KEY-SECRET-TOKEN-STOKEN"
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            responses.add(responses.GET, f"{base}/{name}", status=500)
+        transport = Transport(test_config, circuit_breakers=CircuitBreakers(failure_threshold=2, reset_timeout=60))
+
+        transport.session.get(f"{base}/a.jpg")
+        transport.session.get(f"{base}/b.jpg")
+        with pytest.raises(CircuitOpenError) as excinfo:
+            transport.session.get(f"{base}/c.jpg")
+
+        assert list(transport.breaker_states) == ["test.clickedu.eu/private"]
+        assert "SECRET" not in str(excinfo.value)
+
+    @responses.activate
+    def test_expired_deadline_keeps_trial_slot(self, test_config):
+        """Test a request rejected by its deadline does not use up the half-open trial."""
+        responses.add(responses.GET, QUERY_URL, status=200)
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0)
+        breaker = breakers.for_endpoint("test.clickedu.eu/ws/app_clickedu_query.php")
+        breaker.record_failure()
+        transport = Transport(test_config, circuit_breakers=breakers)
+
+        with deadline_scope(Deadline(0)):
+            with pytest.raises(DeadlineExceededError):
+                transport.session.get(QUERY_URL)
+
+        assert breaker.state == "half_open"
+        assert transport.session.get(QUERY_URL).status_code == 200
+        assert breaker.state == "closed"
+
+    def test_unexpected_error_releases_trial(self, test_config, monkeypatch):
+        """Test a trial request failing outside requests gives its slot back."""
+        breakers = CircuitBreakers(failure_threshold=1, reset_timeout=0)
+        breaker = breakers.for_endpoint("test.clickedu.eu/ws/app_clickedu_query.php")
+        breaker.record_failure()
+        transport = Transport(test_config, circuit_breakers=breakers)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", fail)
+        with pytest.raises(RuntimeError):
+            transport.session.get(QUERY_URL)
+
+        assert breaker.allow()
+
+    def test_disabled_by_default(self, test_config):
+        """Test retries and breakers are off unless configured."""
+        transport = Transport(test_config)
+
+        assert transport.retry_policy is None
+        assert transport.breaker_states == {}
+
+    def test_policy_disables_connection_retries(self, test_config):
+        """Test urllib3 does not retry underneath a retry policy."""
+        test_config.max_retries = 3
+
+        assert Transport(test_config).session.get_adapter("https://x").max_retries.total == 3
+        transport = Transport(test_config, retry_policy=RetryPolicy())
+        assert transport.session.get_adapter("https://x").max_retries.total == 0
+
+    def test_enabled_from_config(self, test_config):
+        """Test the config enables retries and breakers."""
+        test_config.retry_attempts = 2
+        test_config.breaker_threshold = 3
+        transport = Transport(test_config)
+
+        assert transport.retry_policy.max_attempts == 3
+        assert transport.circuit_breakers.failure_threshold == 3
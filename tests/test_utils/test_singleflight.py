@@ -0,0 +1,157 @@
+"""
+Tests for request coalescing.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from clickedu import QueryApi
+from clickedu.exceptions import APIError, DeadlineExceededError
+from clickedu.utils import SingleFlight, deadline_scope
+
+
+def _wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+class TestSingleFlight:
+    """Test SingleFlight class."""
+
+    def test_concurrent_calls_share_one_result(self):
+        """Test concurrent callers with the same key run the function once."""
+        flight = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            _wait_for(lambda: flight.coalesced == 3)
+            return "result"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: flight.do("key", work), range(4)))
+
+        assert results == ["result"] * 4
+        assert len(calls) == 1
+        assert flight.coalesced == 3
+
+    def test_concurrent_calls_share_exception(self):
+        """Test waiting callers receive the leader's exception."""
+        flight = SingleFlight()
+
+        def work():
+            _wait_for(lambda: flight.coalesced == 1)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(flight.do, "key", work) for _ in range(2)]
+
+        for future in futures:
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    def test_waiting_caller_honours_its_deadline(self):
+        """Test a caller joining a slow in-flight call gives up when its own deadline passes."""
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def follower():
+            with deadline_scope(0.05):
+                return flight.do("key", lambda: "follower")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "key", lambda: release.wait(2) and "leader")
+            _wait_for(lambda: "key" in flight._calls)
+            start = time.monotonic()
+            with pytest.raises(DeadlineExceededError):
+                executor.submit(follower).result()
+            elapsed = time.monotonic() - start
+            release.set()
+
+        assert elapsed < 1
+        assert leader.result() == "leader"
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test calls that do not overlap each run the function."""
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+        assert flight.coalesced == 0
+
+
+class TestQueryCoalescing:
+    """Test request coalescing in QueryApi and FileHandler."""
+
+    @responses.activate
+    def test_identical_queries_share_one_request(self, mock_user, test_config):
+        """Test concurrent identical queries hit the network once."""
+        query_api = QueryApi(mock_user, test_config)
+
+        def callback(request):
+            _wait_for(lambda: query_api.coalesced_requests == 3)
+            return 200, {}, '{"albums": [{"id": "album_1", "name": "Album"}]}'
+
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=callback
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: query_api.get_photo_albums(), range(4)))
+
+        assert len(responses.calls) == 1
+        assert all(result.albums[0].id == "album_1" for result in results)
+        assert query_api.coalesced_requests == 3
+
+    @responses.activate
+    def test_coalesced_failure_raises_for_everyone(self, mock_user, test_config):
+        """Test every coalesced caller gets an APIError."""
+        query_api = QueryApi(mock_user, test_config)
+
+        def callback(request):
+            _wait_for(lambda: query_api.coalesced_requests == 1)
+            return 500, {}, "{}"
+
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/ws/app_clickedu_query.php",
+            callback=callback
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(query_api.get_album_by_id, "album_1") for _ in range(2)]
+
+        for future in futures:
+            with pytest.raises(APIError):
+                future.result()
+
+    @responses.activate
+    def test_identical_downloads_share_one_request(self, mock_user, test_config, tmp_path):
+        """Test concurrent downloads of the same file hit the network once."""
+        query_api = QueryApi(mock_user, test_config)
+
+        def callback(request):
+            _wait_for(lambda: query_api.coalesced_requests == 2)
+            return 200, {}, b"content"
+
+        responses.add_callback(
+            responses.GET,
+            f"https://{mock_user.base_url}/private/test_file.pdf",
+            callback=callback
+        )
+
+        download_dir = str(tmp_path / "files")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            paths = list(executor.map(
+                lambda _: query_api.download_file("../private/test_file.pdf", download_dir), range(3)
+            ))
+
+        assert len(responses.calls) == 1
+        assert len(set(paths)) == 1
@@ -0,0 +1,96 @@
+"""
+Tests for the shared HTTP transport.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+from clickedu import AuthApi, ClickeduApi, QueryApi, Transport
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 handler that keeps connections open."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Run a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestTransport:
+    """Test Transport class."""
+
+    def test_defaults_from_config(self, test_config):
+        """Test pool options default to the configuration values."""
+        test_config.pool_maxsize = 4
+        transport = Transport(test_config)
+
+        assert transport.pool_maxsize == 4
+        assert transport.session.get_adapter("https://x")._pool_maxsize == 4
+        assert transport.session.headers["User-Agent"] == test_config.get_user_agent()
+
+    def test_keep_alive_disabled(self, test_config):
+        """Test disabling keep-alive asks the server to close connections."""
+        transport = Transport(test_config, keep_alive=False)
+
+        assert transport.session.headers["Connection"] == "close"
+
+    def test_connection_reuse_stats(self, test_config, local_server):
+        """Test repeated requests to one host reuse a single connection."""
+        transport = Transport(test_config)
+        for _ in range(3):
+            transport.session.get(f"{local_server}/ping").raise_for_status()
+
+        stats = transport.stats
+        assert stats.requests == 3
+        assert stats.new_connections == 1
+        assert stats.reused_connections == 2
+        assert stats.reuse_ratio == pytest.approx(2 / 3)
+        assert stats.requests_by_host == {"127.0.0.1": 3}
+
+    def test_components_share_session(self, test_config, mock_user):
+        """Test every component uses the injected transport session."""
+        transport = Transport(test_config)
+        auth_api = AuthApi(test_config, transport)
+        clickedu_api = ClickeduApi(test_config, transport)
+        query_api = QueryApi(mock_user, test_config, transport)
+
+        assert auth_api.session is transport.session
+        assert clickedu_api.session is transport.session
+        assert query_api.session is transport.session
+        assert query_api.file_handler.session is transport.session
+
+    @responses.activate
+    def test_auth_headers_do_not_leak_into_shared_session(self, test_config):
+        """Test AuthApi form headers are sent per request, not set on the session."""
+        responses.add(
+            responses.POST,
+            f"https://{test_config.domain}/ws/app_clickedu_init.php",
+            json={"token": "test_token", "secret": "test_secret"},
+            status=200
+        )
+        transport = Transport(test_config)
+        AuthApi(test_config, transport).app_clickedu_init()
+
+        assert "content-type" not in transport.session.headers
+        assert transport.stats.requests == 1